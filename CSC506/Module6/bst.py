@@ -1,7 +1,7 @@
 # bst.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, Generator, Optional, Tuple, List
+from typing import Any, Generator, Optional, Sequence, Tuple, List
 
 
 @dataclass
@@ -10,15 +10,98 @@ class BSTNode:
     value: Any = None
     left: Optional["BSTNode"] = None
     right: Optional["BSTNode"] = None
+    # Subtree height and key count, kept exact by every mutation so len(),
+    # height() and the balanced split/join below are O(1) per node
+    height: int = 0
+    size: int = 1
+
+
+def _h(node: Optional[BSTNode]) -> int:
+    return node.height if node is not None else -1
+
+
+def _update(node: BSTNode) -> None:
+    left, right = node.left, node.right
+    node.height = 1 + max(_h(left), _h(right))
+    node.size = 1 + (left.size if left is not None else 0) + (right.size if right is not None else 0)
+
+
+def _rotate_left(x: BSTNode) -> BSTNode:
+    y = x.right
+    x.right, y.left = y.left, x
+    _update(x)
+    _update(y)
+    return y
+
+
+def _rotate_right(x: BSTNode) -> BSTNode:
+    y = x.left
+    x.left, y.right = y.right, x
+    _update(x)
+    _update(y)
+    return y
+
+
+def _rebalance(node: BSTNode) -> BSTNode:
+    """Refresh node's fields and restore the AVL condition at node with at most two rotations."""
+    _update(node)
+    balance = _h(node.left) - _h(node.right)
+    if balance > 1:
+        if _h(node.left.left) < _h(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _h(node.right.right) < _h(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+def _join_with(left: Optional[BSTNode], mid: BSTNode, right: Optional[BSTNode]) -> BSTNode:
+    """
+    AVL join: a tree holding left, then mid, then right (all left keys <
+    mid.key < all right keys). Walks down the spine of the taller side to
+    a subtree at most one level taller than the other side, hangs mid
+    there and rebalances back up: O(|height(left) - height(right)| + 1).
+    The result is AVL-balanced whenever both inputs are.
+    """
+    if _h(left) > _h(right) + 1:
+        spine: List[BSTNode] = []
+        cur = left
+        while _h(cur) > _h(right) + 1:
+            spine.append(cur)
+            cur = cur.right
+        mid.left, mid.right = cur, right
+        _update(mid)
+        node = mid
+        for parent in reversed(spine):
+            parent.right = node
+            node = _rebalance(parent)
+        return node
+    if _h(right) > _h(left) + 1:
+        spine = []
+        cur = right
+        while _h(cur) > _h(left) + 1:
+            spine.append(cur)
+            cur = cur.left
+        mid.left, mid.right = left, cur
+        _update(mid)
+        node = mid
+        for parent in reversed(spine):
+            parent.left = node
+            node = _rebalance(parent)
+        return node
+    mid.left, mid.right = left, right
+    _update(mid)
+    return mid
 
 
 class BinarySearchTree:
     def __init__(self) -> None:
         self.root: Optional[BSTNode] = None
-        self._size: int = 0
 
     def __len__(self) -> int:
-        return self._size
+        return self.root.size if self.root is not None else 0
 
     
     # Core operations    
@@ -26,26 +109,27 @@ class BinarySearchTree:
         """Insert (key, value). If key exists, overwrite value."""
         if self.root is None:
             self.root = BSTNode(key, value)
-            self._size = 1
             return
 
+        path: List[BSTNode] = []
         cur = self.root
         while True:
             if key == cur.key:
                 cur.value = value
                 return
-            elif key < cur.key:
+            path.append(cur)
+            if key < cur.key:
                 if cur.left is None:
                     cur.left = BSTNode(key, value)
-                    self._size += 1
-                    return
+                    break
                 cur = cur.left
             else:
                 if cur.right is None:
                     cur.right = BSTNode(key, value)
-                    self._size += 1
-                    return
+                    break
                 cur = cur.right
+        for node in reversed(path):
+            _update(node)
 
     def search(self, key: Any) -> Optional[BSTNode]:
         """Return the node with matching key, or None."""
@@ -59,8 +143,6 @@ class BinarySearchTree:
     def delete(self, key: Any) -> bool:
         """Delete by key. Returns True if deleted, False if not found."""
         self.root, deleted = self._delete_recursive(self.root, key)
-        if deleted:
-            self._size -= 1
         return deleted
 
     def _delete_recursive(self, node: Optional[BSTNode], key: Any) -> Tuple[Optional[BSTNode], bool]:
@@ -69,9 +151,13 @@ class BinarySearchTree:
 
         if key < node.key:
             node.left, deleted = self._delete_recursive(node.left, key)
+            if deleted:
+                _update(node)
             return node, deleted
         elif key > node.key:
             node.right, deleted = self._delete_recursive(node.right, key)
+            if deleted:
+                _update(node)
             return node, deleted
 
         # node.key == key => delete this node
@@ -86,9 +172,85 @@ class BinarySearchTree:
         successor = self._min_node(node.right)
         node.key, node.value = successor.key, successor.value
         node.right, _ = self._delete_recursive(node.right, successor.key)
+        _update(node)
         return node, True
 
     
+    # Bulk operations    
+    @classmethod
+    def from_sorted_items(cls, items: Sequence[Tuple[Any, Any]]) -> "BinarySearchTree":
+        """Build a height-balanced tree from strictly increasing (key, value) pairs in O(n)."""
+        tree = cls()
+        tree.root = cls._build_balanced(items, 0, len(items) - 1)
+        return tree
+
+    @classmethod
+    def _build_balanced(cls, items: Sequence[Tuple[Any, Any]], lo: int, hi: int) -> Optional[BSTNode]:
+        if lo > hi:
+            return None
+        mid = (lo + hi) // 2
+        key, value = items[mid]
+        node = BSTNode(key, value,
+                       cls._build_balanced(items, lo, mid - 1),
+                       cls._build_balanced(items, mid + 1, hi))
+        _update(node)
+        return node
+
+    def split(self, key: Any) -> Tuple["BinarySearchTree", "BinarySearchTree"]:
+        """
+        Split into (keys < key, keys >= key) in O(height): walk the search
+        path, then AVL-join the subtrees hanging off it bottom-up, so both
+        halves come out balanced with exact sizes. Nodes are moved, not
+        copied: this tree is left empty.
+        """
+        path: List[Tuple[BSTNode, bool]] = []  # (node, node goes to the right half)
+        cur = self.root
+        while cur is not None:
+            goes_right = not cur.key < key
+            path.append((cur, goes_right))
+            cur = cur.left if goes_right else cur.right
+
+        low: Optional[BSTNode] = None
+        high: Optional[BSTNode] = None
+        for node, goes_right in reversed(path):
+            if goes_right:
+                high = _join_with(high, node, node.right)
+            else:
+                low = _join_with(node.left, node, low)
+
+        left, right = BinarySearchTree(), BinarySearchTree()
+        left.root, right.root = low, high
+        self.root = None
+        return left, right
+
+    @staticmethod
+    def join(left: "BinarySearchTree", right: "BinarySearchTree") -> "BinarySearchTree":
+        """
+        Join two trees where every key in left is smaller than every key in
+        right, in O(height): the max of left is detached (rebalancing its
+        spine) and used as the pivot of an AVL join, so joining balanced
+        trees gives a balanced tree. Both inputs are left empty.
+        """
+        joined = BinarySearchTree()
+        if left.root is None or right.root is None:
+            joined.root = right.root if left.root is None else left.root
+        else:
+            if left._max_node(left.root).key >= left._min_node(right.root).key:
+                raise ValueError("join requires every key in left < every key in right")
+            spine: List[BSTNode] = []
+            pivot = left.root
+            while pivot.right is not None:
+                spine.append(pivot)
+                pivot = pivot.right
+            rest = pivot.left
+            for node in reversed(spine):
+                rest = _join_with(node.left, node, rest)
+            joined.root = _join_with(rest, pivot, right.root)
+        left.root = None
+        right.root = None
+        return joined
+
+    
     # Min / Max    
     def min_item(self) -> Optional[Tuple[Any, Any]]:
         """Return (min_key, value) or None."""
@@ -152,12 +314,7 @@ class BinarySearchTree:
     # Balance detection    
     def height(self) -> int:
         """Height of the tree. Empty tree => -1. Single node => 0."""
-        return self._height(self.root)
-
-    def _height(self, node: Optional[BSTNode]) -> int:
-        if node is None:
-            return -1
-        return 1 + max(self._height(node.left), self._height(node.right))
+        return _h(self.root)
 
     def is_balanced(self) -> bool:
         """Detect if the tree is height-balanced (AVL-like condition)."""
@@ -0,0 +1,130 @@
+from __future__ import annotations
+from typing import Any, Iterator, List, Optional, Tuple
+from Module6.bst import BinarySearchTree, BSTNode
+
+
+class BSTCursor:
+    """
+    Bidirectional cursor over a BinarySearchTree.
+
+    The cursor keeps only the root-to-current path (O(height) memory).
+    seek() is O(height); next()/prev() are amortized O(1). Mutating the
+    tree invalidates the cursor; call seek()/first()/last() again after.
+    """
+
+    def __init__(self, tree: BinarySearchTree) -> None:
+        self._tree = tree
+        self._path: List[BSTNode] = []
+
+    @property
+    def valid(self) -> bool:
+        """True while the cursor is positioned on an item."""
+        return bool(self._path)
+
+    @property
+    def key(self) -> Any:
+        if not self._path:
+            raise ValueError("cursor is not positioned on an item")
+        return self._path[-1].key
+
+    @property
+    def value(self) -> Any:
+        if not self._path:
+            raise ValueError("cursor is not positioned on an item")
+        return self._path[-1].value
+
+    def item(self) -> Optional[Tuple[Any, Any]]:
+        if not self._path:
+            return None
+        node = self._path[-1]
+        return node.key, node.value
+
+
+    # Positioning
+    def first(self) -> bool:
+        self._path = []
+        self._descend_left(self._tree.root)
+        return self.valid
+
+    def last(self) -> bool:
+        self._path = []
+        self._descend_right(self._tree.root)
+        return self.valid
+
+    def seek(self, key: Any) -> bool:
+        """Move to the smallest key >= key. Returns False if there is none."""
+        path: List[BSTNode] = []
+        cur = self._tree.root
+        while cur is not None:
+            path.append(cur)
+            if key == cur.key:
+                break
+            cur = cur.left if key < cur.key else cur.right
+        self._path = path
+        if path and path[-1].key < key:
+            return self.next()
+        return self.valid
+
+    def _descend_left(self, node: Optional[BSTNode]) -> None:
+        while node is not None:
+            self._path.append(node)
+            node = node.left
+
+    def _descend_right(self, node: Optional[BSTNode]) -> None:
+        while node is not None:
+            self._path.append(node)
+            node = node.right
+
+
+    # Stepping
+    def next(self) -> bool:
+        """Advance to the inorder successor. Returns False when past the end."""
+        path = self._path
+        if not path:
+            return False
+        node = path[-1]
+        if node.right is not None:
+            self._descend_left(node.right)
+            return True
+        # Climb until we leave a left subtree
+        child = path.pop()
+        while path and path[-1].right is child:
+            child = path.pop()
+        return bool(path)
+
+    def prev(self) -> bool:
+        """Step back to the inorder predecessor. Returns False when before the start."""
+        path = self._path
+        if not path:
+            return False
+        node = path[-1]
+        if node.left is not None:
+            self._descend_right(node.left)
+            return True
+        child = path.pop()
+        while path and path[-1].left is child:
+            child = path.pop()
+        return bool(path)
+
+
+def merge_join(left: BSTCursor, right: BSTCursor) -> Iterator[Tuple[Any, Any, Any]]:
+    """
+    Sort-merge inner join of two cursors on key. Yields (key, left_value, right_value).
+
+    The lagging side first steps once, then seeks in O(height), so sparse
+    overlaps skip whole runs of non-matching keys.
+    """
+    left.first()
+    right.first()
+    while left.valid and right.valid:
+        lk, rk = left.key, right.key
+        if lk == rk:
+            yield lk, left.value, right.value
+            left.next()
+            right.next()
+        elif lk < rk:
+            if left.next() and left.key < rk:
+                left.seek(rk)
+        else:
+            if right.next() and right.key < lk:
+                right.seek(lk)
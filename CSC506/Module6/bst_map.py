@@ -1,11 +1,49 @@
-from typing import Any, Iterator, Tuple, Optional
-from .bst import BinarySearchTree
+from typing import Any, Iterable, Iterator, List, Tuple, Optional
+from Module6.bst import BinarySearchTree
+from Module6.bst_cursor import BSTCursor
+
+
+def merge_sorted_items(
+    a: Iterable[Tuple[Any, Any]], b: Iterable[Tuple[Any, Any]]
+) -> Iterator[Tuple[Any, Any]]:
+    """Merge two key-sorted item streams; on equal keys the item from b wins."""
+    a_iter, b_iter = iter(a), iter(b)
+    x = next(a_iter, None)
+    y = next(b_iter, None)
+    while x is not None and y is not None:
+        if x[0] < y[0]:
+            yield x
+            x = next(a_iter, None)
+        elif y[0] < x[0]:
+            yield y
+            y = next(b_iter, None)
+        else:
+            yield y
+            x = next(a_iter, None)
+            y = next(b_iter, None)
+    while x is not None:
+        yield x
+        x = next(a_iter, None)
+    while y is not None:
+        yield y
+        y = next(b_iter, None)
 
 
 class BSTMap:
     def __init__(self) -> None:
         self._bst = BinarySearchTree()
 
+    @classmethod
+    def _from_tree(cls, tree: BinarySearchTree) -> "BSTMap":
+        m = cls()
+        m._bst = tree
+        return m
+
+    @classmethod
+    def from_sorted_items(cls, items: Iterable[Tuple[Any, Any]]) -> "BSTMap":
+        """Balanced map from key-sorted, duplicate-free items in O(n)."""
+        return cls._from_tree(BinarySearchTree.from_sorted_items(list(items)))
+
     def __len__(self) -> int:
         return len(self._bst)
 
@@ -31,6 +69,10 @@ class BSTMap:
     def items_inorder(self) -> Iterator[Tuple[Any, Any]]:
         yield from self._bst.inorder()
 
+    def cursor(self) -> BSTCursor:
+        """Unpositioned cursor; call first(), last() or seek(key) before reading."""
+        return BSTCursor(self._bst)
+
     def items_preorder(self) -> Iterator[Tuple[Any, Any]]:
         yield from self._bst.preorder()
 
@@ -42,3 +84,26 @@ class BSTMap:
 
     def ascii_tree(self) -> str:
         return self._bst.to_ascii()
+
+    def height(self) -> int:
+        return self._bst.height()
+
+    # Bulk operations
+    def union(self, other: "BSTMap") -> "BSTMap":
+        """New balanced map with the keys of both, in O(n + m). other wins on ties."""
+        merged: List[Tuple[Any, Any]] = list(merge_sorted_items(self.items_inorder(), other.items_inorder()))
+        return BSTMap.from_sorted_items(merged)
+
+    def merge(self, other: "BSTMap") -> None:
+        """In-place union: rebuild self as a balanced tree over both maps."""
+        self._bst = self.union(other)._bst
+
+    def split(self, key: Any) -> Tuple["BSTMap", "BSTMap"]:
+        """Move keys < key and keys >= key into two new maps in O(height); self is emptied."""
+        left, right = self._bst.split(key)
+        return BSTMap._from_tree(left), BSTMap._from_tree(right)
+
+    @staticmethod
+    def join(left: "BSTMap", right: "BSTMap") -> "BSTMap":
+        """Concatenate maps with all left keys < all right keys in O(height); inputs are emptied."""
+        return BSTMap._from_tree(BinarySearchTree.join(left._bst, right._bst))
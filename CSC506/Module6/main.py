@@ -1,9 +1,21 @@
+import copy
+import gc
+import os
 import random
+import sys
+import threading
 import time
-from typing import List
+import tracemalloc
+from typing import List, Tuple
 
-from bst_map import BSTMap
-from list_map import ListMap
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Module6.bst_cursor import merge_join
+from Module6.bst_map import BSTMap
+from Module6.list_map import ListMap
+from Module6.persistent_bst_map import VersionedBSTMap
+from Module6.skip_list_map import SkipListMap
+from Module6.sorted_list_map import BlockedSortedListMap, SortedListMap
 
 
 def demo_bst_map_integers() -> None:
@@ -51,15 +63,19 @@ def demo_bst_map_strings() -> None:
 
 
 def performance_comparison_search(iterations: int = 20000) -> None:
-    print("\n=== Performance: BSTMap vs ListMap (search) ===")
+    print("\n=== Performance: BSTMap vs ListMap vs sorted arrays (search) ===")
     bst_map = BSTMap()
     list_map = ListMap()
+    sorted_map = SortedListMap()
+    blocked_map = BlockedSortedListMap()
 
     # Build same dataset
     keys = random.sample(range(1, 200000), 5000)
     for k in keys:
         bst_map.set(k, k)
         list_map.set(k, k)
+        sorted_map.set(k, k)
+        blocked_map.set(k, k)
 
     # Search targets: mix of hits and misses
     targets: List[int] = []
@@ -69,28 +85,261 @@ def performance_comparison_search(iterations: int = 20000) -> None:
         else:
             targets.append(random.randint(200001, 300000))  # miss
 
-    # Time BSTMap contains
-    start = time.perf_counter()
-    hit_count_bst = 0
-    for t in targets:
-        if bst_map.contains(t):
-            hit_count_bst += 1
-    end = time.perf_counter()
-    bst_time = end - start
+    def time_contains(m) -> Tuple[int, float]:
+        start = time.perf_counter()
+        hits = 0
+        for t in targets:
+            if m.contains(t):
+                hits += 1
+        return hits, time.perf_counter() - start
 
-    # Time ListMap contains
-    start = time.perf_counter()
-    hit_count_list = 0
-    for t in targets:
-        if list_map.contains(t):
-            hit_count_list += 1
-    end = time.perf_counter()
-    list_time = end - start
+    hit_count_bst, bst_time = time_contains(bst_map)
+    hit_count_list, list_time = time_contains(list_map)
+    hit_count_sorted, sorted_time = time_contains(sorted_map)
+    hit_count_blocked, blocked_time = time_contains(blocked_map)
 
     print(f"BSTMap hits:  {hit_count_bst} | time: {bst_time:.6f}s")
     print(f"ListMap hits: {hit_count_list} | time: {list_time:.6f}s")
+    print(f"SortedListMap hits:  {hit_count_sorted} | time: {sorted_time:.6f}s")
+    print(f"BlockedSortedListMap hits: {hit_count_blocked} | time: {blocked_time:.6f}s")
     if bst_time > 0:
         print(f"Speedup (List / BST): {list_time / bst_time:.2f}x")
+    if sorted_time > 0:
+        print(f"Speedup (List / Sorted): {list_time / sorted_time:.2f}x")
+
+
+def performance_comparison_insert(n: int = 50000) -> None:
+    print(f"\n=== Performance: sorted-array inserts (n={n}) ===")
+    random_keys = random.sample(range(n * 10), n)
+    ascending_keys = sorted(random_keys)
+    factories = (("BSTMap", BSTMap), ("SortedListMap", SortedListMap),
+                 ("BlockedSortedListMap", BlockedSortedListMap))
+    for label, keys in (("random", random_keys), ("ascending", ascending_keys)):
+        for name, factory in factories:
+            if name == "BSTMap" and label == "ascending":
+                continue  # degenerates into a linked list
+            m = factory()
+            start = time.perf_counter()
+            for k in keys:
+                m.set(k, k)
+            print(f"{label:9s} {name:20s}: {time.perf_counter() - start:.6f}s")
+
+
+def performance_comparison_skip_list(n: int = 20000, iterations: int = 20000) -> None:
+    print("\n=== Performance: SkipListMap vs BSTMap ===")
+    keys = random.sample(range(1, n * 10), n)
+    targets = [random.choice(keys) for _ in range(iterations)]
+
+    for name, factory in (("BSTMap", BSTMap), ("SkipListMap", lambda: SkipListMap(seed=42))):
+        m = factory()
+        start = time.perf_counter()
+        for k in keys:
+            m.set(k, k)
+        insert_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for t in targets:
+            m.get(t)
+        search_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        in_range = sum(1 for k, _ in m.items_inorder() if n * 2 <= k < n * 4)
+        scan_time = time.perf_counter() - start
+        print(f"{name:12s} insert: {insert_time:.6f}s | search: {search_time:.6f}s | "
+              f"range count {in_range} (full scan): {scan_time:.6f}s")
+
+    skip = SkipListMap(seed=42)
+    for k in keys:
+        skip.set(k, k)
+    start = time.perf_counter()
+    in_range = sum(1 for _ in skip.items_range(n * 2, n * 4))
+    print(f"SkipListMap  items_range count {in_range}: {time.perf_counter() - start:.6f}s")
+    print("Level histogram (p=0.5):", skip.level_histogram())
+
+
+def concurrent_readers_benchmark(n: int = 5000, readers: int = 4, duration: float = 1.0) -> None:
+    """One writer churns keys while readers run get(); BSTMap needs a shared lock."""
+    print(f"\n=== Concurrency: 1 writer / {readers} readers for {duration:.1f}s ===")
+    keys = list(range(n))
+    random.shuffle(keys)  # keep the BST from degenerating into a list
+
+    def run(m, lock) -> int:
+        for k in keys:
+            m.set(k, k)
+        stop = threading.Event()
+        reads = [0] * readers
+
+        def writer() -> None:
+            rng = random.Random(1)
+            while not stop.is_set():
+                k = rng.randrange(n)
+                if lock is None:
+                    m.delete(k)
+                    m.set(k, k)
+                else:
+                    with lock:
+                        m.delete(k)
+                        m.set(k, k)
+
+        def reader(slot: int) -> None:
+            rng = random.Random(slot)
+            count = 0
+            while not stop.is_set():
+                k = rng.randrange(n)
+                if lock is None:
+                    m.get(k)
+                else:
+                    with lock:
+                        m.get(k)
+                count += 1
+            reads[slot] = count
+
+        threads = [threading.Thread(target=writer)]
+        threads += [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+        for t in threads:
+            t.start()
+        time.sleep(duration)
+        stop.set()
+        for t in threads:
+            t.join()
+        return sum(reads)
+
+    bst_reads = run(BSTMap(), threading.Lock())
+    skip_reads = run(SkipListMap(seed=42), None)
+    print(f"BSTMap + lock:        {bst_reads / duration:12.0f} reads/s")
+    print(f"SkipListMap lockless: {skip_reads / duration:12.0f} reads/s")
+
+
+def snapshot_benchmark(n: int = 5000, versions: int = 50, reads: int = 20000) -> None:
+    """Memory per version and read throughput: persistent snapshots vs full copies."""
+    print(f"\n=== Snapshots: persistent BSTMap vs full copies (n={n}, versions={versions}) ===")
+    keys = random.sample(range(1, n * 10), n)
+    updates = [random.choice(keys) for _ in range(versions)]
+    targets = [random.choice(keys) for _ in range(reads)]
+
+    bst_map = BSTMap()
+    versioned = VersionedBSTMap()
+    for k in keys:
+        bst_map.set(k, k)
+        versioned.set(k, k)
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    copies = []
+    for i, k in enumerate(updates):
+        copies.append(copy.deepcopy(bst_map))
+        bst_map.set(k, -i)
+    copy_time = time.perf_counter() - start
+    copy_bytes = tracemalloc.get_traced_memory()[0] - base
+    del copies
+
+    base = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    snapshots = []
+    for i, k in enumerate(updates):
+        snapshots.append(versioned.snapshot())
+        versioned.set(k, -i)
+    snap_time = time.perf_counter() - start
+    snap_bytes = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+
+    print(f"Full copy:  {copy_bytes / versions:12.0f} bytes/version | {copy_time / versions * 1e6:10.2f} µs/version")
+    print(f"Persistent: {snap_bytes / versions:12.0f} bytes/version | {snap_time / versions * 1e6:10.2f} µs/version")
+
+    view = snapshots[len(snapshots) // 2]
+    start = time.perf_counter()
+    for t in targets:
+        view.get(t)
+    snap_read = time.perf_counter() - start
+
+    frozen = copy.deepcopy(bst_map)
+    start = time.perf_counter()
+    for t in targets:
+        frozen.get(t)
+    copy_read = time.perf_counter() - start
+    print(f"Reads on full copy: {reads / copy_read:12.0f} ops/s")
+    print(f"Reads on snapshot:  {reads / snap_read:12.0f} ops/s")
+
+
+def bulk_operations_benchmark(n: int = 50000) -> None:
+    """union / split / join against naive one-by-one re-insertion."""
+    print(f"\n=== Bulk BSTMap ops vs naive re-insertion (n={n} per map) ===")
+    pool = random.sample(range(n * 10), 2 * n)
+    a_keys, b_keys = pool[:n], pool[n:]
+    a = BSTMap.from_sorted_items((k, k) for k in sorted(a_keys))
+    b = BSTMap.from_sorted_items((k, k) for k in sorted(b_keys))
+
+    # Naive paths re-insert in arrival (random) order; sorted order would degenerate the BST
+    start = time.perf_counter()
+    naive = BSTMap()
+    for k in pool:
+        naive.set(k, b.get(k, a.get(k)))
+    naive_union = time.perf_counter() - start
+
+    start = time.perf_counter()
+    merged = a.union(b)
+    fast_union = time.perf_counter() - start
+    print(f"Union naive:  {naive_union:.6f}s (height {naive.height()})")
+    print(f"Union merge:  {fast_union:.6f}s (height {merged.height()})")
+
+    pivot = sorted(pool)[n]
+    start = time.perf_counter()
+    low, high = BSTMap(), BSTMap()
+    for k in pool:
+        (low if k < pivot else high).set(k, merged.get(k))
+    naive_split = time.perf_counter() - start
+
+    # Each round splits and rejoins the same tree; gc is off so a collection
+    # pass over the ~100k nodes is not charged to one split
+    rounds = 1000
+    pivots = random.sample(pool, rounds)
+    split_time = join_time = 0.0
+    gc.disable()
+    try:
+        for p in pivots:
+            start = time.perf_counter()
+            low, high = merged.split(p)
+            split_time += time.perf_counter() - start
+            start = time.perf_counter()
+            merged = BSTMap.join(low, high)
+            join_time += time.perf_counter() - start
+    finally:
+        gc.enable()
+    print(f"Split naive:  {naive_split:.6f}s")
+    print(f"Split O(h):   {split_time / rounds * 1e6:.2f} µs (mean of {rounds})")
+    print(f"Join O(h):    {join_time / rounds * 1e6:.2f} µs (size {len(merged)}, height {merged.height()} "
+          f"after {rounds} split/join rounds)")
+
+    shards = 200
+    start = time.perf_counter()
+    combined = BSTMap()
+    for i in range(shards):
+        combined = BSTMap.join(combined, BSTMap.from_sorted_items([(i, i)]))
+    print(f"Join {shards} one-key shards: {(time.perf_counter() - start) * 1e3:.3f} ms "
+          f"(height {combined.height()})")
+
+
+def merge_join_benchmark(customers: int = 50000, orders: int = 20000) -> None:
+    """Cursor sort-merge join vs materializing items_inorder() into a dict."""
+    print(f"\n=== Join: cursor merge-join vs dict join ({customers} customers, {orders} orders) ===")
+    customer_map = BSTMap.from_sorted_items((k, f"customer_{k}") for k in range(0, customers * 2, 2))
+    order_keys = random.sample(range(customers * 4), orders)
+    order_map = BSTMap()
+    for k in order_keys:
+        order_map.set(k, f"order_{k}")
+
+    start = time.perf_counter()
+    lookup = dict(customer_map.items_inorder())
+    dict_rows = [(k, lookup[k], v) for k, v in order_map.items_inorder() if k in lookup]
+    dict_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cursor_rows = list(merge_join(customer_map.cursor(), order_map.cursor()))
+    cursor_time = time.perf_counter() - start
+
+    print(f"Dict join:   {len(dict_rows)} rows | {dict_time:.6f}s")
+    print(f"Cursor join: {len(cursor_rows)} rows | {cursor_time:.6f}s")
 
 
 def main() -> None:
@@ -98,6 +347,12 @@ def main() -> None:
     demo_bst_map_integers()
     demo_bst_map_strings()
     performance_comparison_search(iterations=20000)
+    performance_comparison_insert()
+    performance_comparison_skip_list()
+    concurrent_readers_benchmark()
+    snapshot_benchmark()
+    bulk_operations_benchmark()
+    merge_join_benchmark()
 
 
 if __name__ == "__main__":
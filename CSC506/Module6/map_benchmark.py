@@ -0,0 +1,205 @@
+"""
+Map Benchmark Matrix
+====================
+
+Runs every MapLike implementation over a grid of sizes, key distributions
+and operation mixes, and emits one structured row per cell so the fastest
+map per workload can be picked from the data (pass a path to also write CSV):
+
+- implementations: dict, ListMap, BSTMap, SkipListMap, sorted-array maps, HashTable
+- key distributions: sorted, random, zipf (skewed queries)
+- operation mixes: read-heavy, balanced, write-heavy
+"""
+
+import csv
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Module6.bst_map import BSTMap
+from Module6.list_map import ListMap
+from Module6.map_protocol import DictMap, HashTableMap, MapLike
+from Module6.skip_list_map import SkipListMap
+from Module6.sorted_list_map import BlockedSortedListMap, SortedListMap
+
+try:
+    from Module5.hash_table import HashTable
+except ImportError as e:
+    print(f"Warning: HashTable import failed: {e}")
+    HashTable = None
+
+
+@dataclass
+class MapImpl:
+    name: str
+    factory: Callable[[int], MapLike]
+    max_size: Optional[int] = None      # skip sizes where O(n) ops make the cell useless
+    sorted_input_ok: bool = True        # plain BSTs degenerate (and recurse too deep) on sorted keys
+
+
+def default_implementations() -> List[MapImpl]:
+    impls = [
+        MapImpl("dict", lambda n: DictMap()),
+        MapImpl("ListMap", lambda n: ListMap(), max_size=2000),
+        MapImpl("BSTMap", lambda n: BSTMap(), sorted_input_ok=False),
+        MapImpl("SkipListMap", lambda n: SkipListMap(seed=0)),
+        MapImpl("SortedListMap", lambda n: SortedListMap()),
+        MapImpl("BlockedSortedListMap", lambda n: BlockedSortedListMap()),
+    ]
+    if HashTable is not None:
+        # Size the table to the load so chains stay short
+        impls.append(MapImpl("HashTable", lambda n: HashTableMap(HashTable(capacity=2 * n + 1))))
+    return impls
+
+
+OPERATION_MIXES: Dict[str, Dict[str, float]] = {
+    "read_heavy": {"get": 0.90, "set": 0.05, "delete": 0.05},
+    "balanced": {"get": 0.50, "set": 0.30, "delete": 0.20},
+    "write_heavy": {"get": 0.20, "set": 0.50, "delete": 0.30},
+}
+
+DISTRIBUTIONS = ("sorted", "random", "zipf")
+
+
+def make_key(i: int) -> str:
+    # Zero-padded strings: ordered like ints and accepted by HashTable
+    return f"k{i:09d}"
+
+
+def zipf_indices(n: int, count: int, s: float, rng: random.Random) -> List[int]:
+    """count indices in [0, n) where rank r is drawn with weight 1 / (r + 1) ** s."""
+    cum: List[float] = []
+    total = 0.0
+    for r in range(n):
+        total += 1.0 / (r + 1) ** s
+        cum.append(total)
+    ranks = rng.choices(range(n), cum_weights=cum, k=count)
+    # Scatter the hot ranks across the key space
+    perm = list(range(n))
+    rng.shuffle(perm)
+    return [perm[r] for r in ranks]
+
+
+def build_workload(size: int, distribution: str, mix: Dict[str, float], ops: int,
+                   seed: int = 42) -> Dict[str, list]:
+    """Insert order plus an (op, key) stream; identical for every implementation."""
+    rng = random.Random(seed)
+    indices = list(range(size))
+    if distribution != "sorted":
+        rng.shuffle(indices)
+    inserts = [make_key(i) for i in indices]
+
+    if distribution == "sorted":
+        start = rng.randrange(size)
+        targets = [(start + j) % size for j in range(ops)]
+    elif distribution == "random":
+        targets = [rng.randrange(size) for _ in range(ops)]
+    elif distribution == "zipf":
+        targets = zipf_indices(size, ops, 1.1, rng)
+    else:
+        raise ValueError(f"unknown distribution: {distribution}")
+
+    names = list(mix.keys())
+    kinds = rng.choices(names, weights=[mix[n] for n in names], k=ops)
+    # Writes may land just outside the loaded range so sets insert and deletes miss
+    stream = [(op, make_key(t + size if op != "get" and rng.random() < 0.1 else t))
+              for op, t in zip(kinds, targets)]
+    return {"inserts": inserts, "stream": stream}
+
+
+def run_cell(impl: MapImpl, workload: Dict[str, list]) -> Dict[str, float]:
+    m = impl.factory(len(workload["inserts"]))
+    start = time.perf_counter()
+    for k in workload["inserts"]:
+        m.set(k, k)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for op, k in workload["stream"]:
+        if op == "get":
+            m.get(k)
+        elif op == "set":
+            m.set(k, k)
+        else:
+            m.delete(k)
+    ops_s = time.perf_counter() - start
+    return {"build_s": build_s, "ops_s": ops_s}
+
+
+def run_matrix(
+    sizes: Sequence[int] = (1000, 10000),
+    distributions: Sequence[str] = DISTRIBUTIONS,
+    mixes: Optional[Dict[str, Dict[str, float]]] = None,
+    ops: int = 20000,
+    implementations: Optional[List[MapImpl]] = None,
+) -> List[Dict]:
+    """Run every (implementation, size, distribution, mix) cell. Returns one dict per cell."""
+    mixes = mixes or OPERATION_MIXES
+    implementations = implementations or default_implementations()
+    rows: List[Dict] = []
+    for size in sizes:
+        for distribution in distributions:
+            for mix_name, mix in mixes.items():
+                workload = build_workload(size, distribution, mix, ops)
+                for impl in implementations:
+                    if impl.max_size is not None and size > impl.max_size:
+                        continue
+                    if distribution == "sorted" and not impl.sorted_input_ok:
+                        continue
+                    timing = run_cell(impl, workload)
+                    rows.append({
+                        "implementation": impl.name,
+                        "size": size,
+                        "distribution": distribution,
+                        "mix": mix_name,
+                        "ops": ops,
+                        "build_s": timing["build_s"],
+                        "ops_s": timing["ops_s"],
+                        "ops_per_sec": ops / timing["ops_s"] if timing["ops_s"] > 0 else float("inf"),
+                    })
+    return rows
+
+
+def fastest_by_workload(rows: List[Dict]) -> Dict[tuple, str]:
+    """(size, distribution, mix) -> name of the implementation with the best ops/sec."""
+    best: Dict[tuple, Dict] = {}
+    for row in rows:
+        cell = (row["size"], row["distribution"], row["mix"])
+        if cell not in best or row["ops_per_sec"] > best[cell]["ops_per_sec"]:
+            best[cell] = row
+    return {cell: row["implementation"] for cell, row in best.items()}
+
+
+def write_csv(rows: List[Dict], path: str) -> None:
+    if not rows:
+        return
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main() -> None:
+    rows = run_matrix()
+    print(f"{'impl':>22} {'size':>7} {'dist':>7} {'mix':>12} {'build ms':>10} {'ops/s':>12}")
+    for r in rows:
+        print(f"{r['implementation']:>22} {r['size']:>7} {r['distribution']:>7} {r['mix']:>12} "
+              f"{r['build_s'] * 1e3:10.3f} {r['ops_per_sec']:12.0f}")
+
+    print("\nFastest per workload (excluding dict):")
+    winners = fastest_by_workload([r for r in rows if r["implementation"] != "dict"])
+    for (size, dist, mix), name in sorted(winners.items()):
+        print(f"  size={size:<6} {dist:>7} {mix:>12}: {name}")
+
+    if len(sys.argv) > 1:
+        write_csv(rows, sys.argv[1])
+        print(f"\nRows written to {sys.argv[1]}")
+
+
+if __name__ == "__main__":
+    main()
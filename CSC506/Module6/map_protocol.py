@@ -0,0 +1,73 @@
+from __future__ import annotations
+from typing import Any, Dict, Protocol
+
+_MISSING = object()
+
+
+class MapLike(Protocol):
+    """Common map API shared by ListMap, BSTMap and the adapters below."""
+
+    def __len__(self) -> int:
+        ...
+
+    def set(self, key: Any, value: Any) -> None:
+        ...
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        ...
+
+    def contains(self, key: Any) -> bool:
+        ...
+
+    def delete(self, key: Any) -> bool:
+        ...
+
+
+class DictMap:
+    """Built-in dict behind the MapLike API (the baseline)."""
+
+    def __init__(self) -> None:
+        self._data: Dict[Any, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def set(self, key: Any, value: Any) -> None:
+        self._data[key] = value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def contains(self, key: Any) -> bool:
+        return key in self._data
+
+    def delete(self, key: Any) -> bool:
+        return self._data.pop(key, _MISSING) is not _MISSING
+
+
+class HashTableMap:
+    """
+    Adapter from the Module5 HashTable (insert/search) to MapLike.
+
+    HashTable.search() returns None both for a missing key and for a stored
+    None, so contains() cannot tell them apart; store non-None values.
+    """
+
+    def __init__(self, table: Any) -> None:
+        self._table = table
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def set(self, key: Any, value: Any) -> None:
+        self._table.insert(key, value)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        value = self._table.search(key)
+        return default if value is None else value
+
+    def contains(self, key: Any) -> bool:
+        return self._table.search(key) is not None
+
+    def delete(self, key: Any) -> bool:
+        return self._table.delete(key)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+
+class PNode:
+    """Immutable BST node. Never mutated after construction, so it can be shared."""
+
+    __slots__ = ("key", "value", "left", "right")
+
+    def __init__(self, key: Any, value: Any, left: Optional["PNode"], right: Optional["PNode"]) -> None:
+        self.key = key
+        self.value = value
+        self.left = left
+        self.right = right
+
+
+class PersistentBSTMap:
+    """
+    Immutable (path-copying) BST map.
+
+    set() and delete() return a new map that shares every untouched node with
+    the old one; only the O(height) nodes on the search path are copied.
+    Old versions are ordinary objects and are reclaimed once unreferenced.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, root: Optional[PNode] = None, size: int = 0) -> None:
+        self._root = root
+        self._size = size
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[Any, Any]]) -> "PersistentBSTMap":
+        m = cls()
+        for k, v in items:
+            m = m.set(k, v)
+        return m
+
+    def __len__(self) -> int:
+        return self._size
+
+
+    # Updates (return new versions)
+    def set(self, key: Any, value: Any) -> "PersistentBSTMap":
+        root, added = self._set(self._root, key, value)
+        return PersistentBSTMap(root, self._size + (1 if added else 0))
+
+    def _set(self, node: Optional[PNode], key: Any, value: Any) -> Tuple[PNode, bool]:
+        if node is None:
+            return PNode(key, value, None, None), True
+        if key == node.key:
+            return PNode(key, value, node.left, node.right), False
+        if key < node.key:
+            left, added = self._set(node.left, key, value)
+            return PNode(node.key, node.value, left, node.right), added
+        right, added = self._set(node.right, key, value)
+        return PNode(node.key, node.value, node.left, right), added
+
+    def delete(self, key: Any) -> "PersistentBSTMap":
+        """Return a version without key (self if key is absent)."""
+        root, deleted = self._delete(self._root, key)
+        if not deleted:
+            return self
+        return PersistentBSTMap(root, self._size - 1)
+
+    def _delete(self, node: Optional[PNode], key: Any) -> Tuple[Optional[PNode], bool]:
+        if node is None:
+            return None, False
+        if key < node.key:
+            left, deleted = self._delete(node.left, key)
+            if not deleted:
+                return node, False
+            return PNode(node.key, node.value, left, node.right), True
+        if key > node.key:
+            right, deleted = self._delete(node.right, key)
+            if not deleted:
+                return node, False
+            return PNode(node.key, node.value, node.left, right), True
+
+        if node.left is None:
+            return node.right, True
+        if node.right is None:
+            return node.left, True
+
+        # Two children: new node carries the inorder successor
+        succ = node.right
+        while succ.left is not None:
+            succ = succ.left
+        right, _ = self._delete(node.right, succ.key)
+        return PNode(succ.key, succ.value, node.left, right), True
+
+
+    # Reads
+    def get(self, key: Any, default: Any = None) -> Any:
+        cur = self._root
+        while cur is not None:
+            if key == cur.key:
+                return cur.value
+            cur = cur.left if key < cur.key else cur.right
+        return default
+
+    def contains(self, key: Any) -> bool:
+        cur = self._root
+        while cur is not None:
+            if key == cur.key:
+                return True
+            cur = cur.left if key < cur.key else cur.right
+        return False
+
+    def min_item(self) -> Optional[Tuple[Any, Any]]:
+        if self._root is None:
+            return None
+        cur = self._root
+        while cur.left is not None:
+            cur = cur.left
+        return cur.key, cur.value
+
+    def max_item(self) -> Optional[Tuple[Any, Any]]:
+        if self._root is None:
+            return None
+        cur = self._root
+        while cur.right is not None:
+            cur = cur.right
+        return cur.key, cur.value
+
+    def items_inorder(self) -> Iterator[Tuple[Any, Any]]:
+        stack: List[PNode] = []
+        cur = self._root
+        while stack or cur is not None:
+            while cur is not None:
+                stack.append(cur)
+                cur = cur.left
+            cur = stack.pop()
+            yield (cur.key, cur.value)
+            cur = cur.right
+
+
+class VersionedBSTMap:
+    """
+    Mutable facade with the BSTMap API whose snapshot() is O(1).
+
+    The writer calls set()/delete() as usual; each call swaps in a new
+    persistent version. Readers hold a snapshot that never changes under them.
+    """
+
+    def __init__(self) -> None:
+        self._current = PersistentBSTMap()
+
+    def __len__(self) -> int:
+        return len(self._current)
+
+    def snapshot(self) -> PersistentBSTMap:
+        """Consistent read-only view of the current version."""
+        return self._current
+
+    def set(self, key: Any, value: Any) -> None:
+        self._current = self._current.set(key, value)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._current.get(key, default)
+
+    def contains(self, key: Any) -> bool:
+        return self._current.contains(key)
+
+    def delete(self, key: Any) -> bool:
+        before = self._current
+        self._current = before.delete(key)
+        return self._current is not before
+
+    def min_item(self) -> Optional[Tuple[Any, Any]]:
+        return self._current.min_item()
+
+    def max_item(self) -> Optional[Tuple[Any, Any]]:
+        return self._current.max_item()
+
+    def items_inorder(self) -> Iterator[Tuple[Any, Any]]:
+        yield from self._current.items_inorder()
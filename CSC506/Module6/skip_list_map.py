@@ -0,0 +1,168 @@
+from __future__ import annotations
+import random
+import threading
+from typing import Any, Iterator, List, Optional, Tuple
+
+
+class SkipNode:
+    """Tower node. __slots__ keeps each node to key, value and one pointer list."""
+
+    __slots__ = ("key", "value", "forward")
+
+    def __init__(self, key: Any, value: Any, level: int) -> None:
+        self.key = key
+        self.value = value
+        self.forward: List[Optional["SkipNode"]] = [None] * level
+
+
+class SkipListMap:
+    """
+    Probabilistic ordered map with the BSTMap API plus range iteration.
+
+    Writers are serialized by an internal lock; readers never lock. A new
+    node is fully built before it is linked (bottom level first) and a
+    deleted node is unlinked top-down while keeping its own forward
+    pointers, so a concurrent reader always sees a valid sorted chain.
+    """
+
+    def __init__(self, p: float = 0.5, max_level: int = 32, seed: Optional[int] = None) -> None:
+        if not 0.0 < p < 1.0:
+            raise ValueError("p must be in (0, 1)")
+        if max_level <= 0:
+            raise ValueError("max_level must be > 0")
+        self.p = p
+        self.max_level = max_level
+        self._rng = random.Random(seed)
+        self._head = SkipNode(None, None, max_level)
+        self._level = 1
+        self._size = 0
+        self._write_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < self.max_level and self._rng.random() < self.p:
+            level += 1
+        return level
+
+    def _find_predecessors(self, key: Any) -> List[SkipNode]:
+        """Rightmost node with node.key < key on every level (head where none)."""
+        update: List[SkipNode] = [self._head] * self.max_level
+        cur = self._head
+        for lvl in range(self._level - 1, -1, -1):
+            nxt = cur.forward[lvl]
+            while nxt is not None and nxt.key < key:
+                cur = nxt
+                nxt = cur.forward[lvl]
+            update[lvl] = cur
+        return update
+
+    def _find_node(self, key: Any) -> Optional[SkipNode]:
+        cur = self._head
+        for lvl in range(self._level - 1, -1, -1):
+            nxt = cur.forward[lvl]
+            while nxt is not None and nxt.key < key:
+                cur = nxt
+                nxt = cur.forward[lvl]
+        cur = cur.forward[0]
+        if cur is not None and cur.key == key:
+            return cur
+        return None
+
+
+    # Core operations
+    def set(self, key: Any, value: Any) -> None:
+        """Insert (key, value). If key exists, overwrite value."""
+        with self._write_lock:
+            update = self._find_predecessors(key)
+            existing = update[0].forward[0]
+            if existing is not None and existing.key == key:
+                existing.value = value
+                return
+
+            level = self._random_level()
+            node = SkipNode(key, value, level)
+            for lvl in range(level):
+                node.forward[lvl] = update[lvl].forward[lvl]
+            # Publish bottom-up: once linked on level 0 the node is reachable
+            for lvl in range(level):
+                update[lvl].forward[lvl] = node
+            if level > self._level:
+                self._level = level
+            self._size += 1
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        node = self._find_node(key)
+        return node.value if node is not None else default
+
+    def contains(self, key: Any) -> bool:
+        return self._find_node(key) is not None
+
+    def delete(self, key: Any) -> bool:
+        """Delete by key. Returns True if deleted, False if not found."""
+        with self._write_lock:
+            update = self._find_predecessors(key)
+            node = update[0].forward[0]
+            if node is None or node.key != key:
+                return False
+
+            # Unlink top-down; node.forward is left intact for in-flight readers
+            for lvl in range(len(node.forward) - 1, -1, -1):
+                if update[lvl].forward[lvl] is node:
+                    update[lvl].forward[lvl] = node.forward[lvl]
+            while self._level > 1 and self._head.forward[self._level - 1] is None:
+                self._level -= 1
+            self._size -= 1
+            return True
+
+
+    # Min / Max
+    def min_item(self) -> Optional[Tuple[Any, Any]]:
+        """Return (min_key, value) or None."""
+        node = self._head.forward[0]
+        return (node.key, node.value) if node is not None else None
+
+    def max_item(self) -> Optional[Tuple[Any, Any]]:
+        """Return (max_key, value) or None."""
+        cur = self._head
+        for lvl in range(self._level - 1, -1, -1):
+            while cur.forward[lvl] is not None:
+                cur = cur.forward[lvl]
+        return (cur.key, cur.value) if cur is not self._head else None
+
+
+    # Iteration
+    def items_inorder(self) -> Iterator[Tuple[Any, Any]]:
+        node = self._head.forward[0]
+        while node is not None:
+            yield (node.key, node.value)
+            node = node.forward[0]
+
+    def items_range(self, lo: Any = None, hi: Any = None) -> Iterator[Tuple[Any, Any]]:
+        """Yield items with lo <= key < hi in key order. None means unbounded."""
+        if lo is None:
+            node = self._head.forward[0]
+        else:
+            cur = self._head
+            for lvl in range(self._level - 1, -1, -1):
+                nxt = cur.forward[lvl]
+                while nxt is not None and nxt.key < lo:
+                    cur = nxt
+                    nxt = cur.forward[lvl]
+            node = cur.forward[0]
+        while node is not None and (hi is None or node.key < hi):
+            yield (node.key, node.value)
+            node = node.forward[0]
+
+    def level_histogram(self) -> List[int]:
+        """Number of nodes per tower height; useful to check the chosen p."""
+        counts = [0] * self.max_level
+        node = self._head.forward[0]
+        while node is not None:
+            counts[len(node.forward) - 1] += 1
+            node = node.forward[0]
+        while len(counts) > 1 and counts[-1] == 0:
+            counts.pop()
+        return counts
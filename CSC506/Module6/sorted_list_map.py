@@ -0,0 +1,187 @@
+from __future__ import annotations
+from bisect import bisect_left
+from typing import Any, Iterator, List, Optional, Tuple
+
+
+class SortedListMap:
+    """
+    Sorted-array map: parallel key and value lists searched with bisect.
+
+    Lookups are O(log n). Inserts are O(log n) search plus an O(n) memmove,
+    except keys larger than the current max, which take an O(1) append.
+    """
+
+    def __init__(self) -> None:
+        self._keys: List[Any] = []
+        self._values: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def set(self, key: Any, value: Any) -> None:
+        keys = self._keys
+        # Fast path for monotonically increasing keys
+        if not keys or key > keys[-1]:
+            keys.append(key)
+            self._values.append(value)
+            return
+        i = bisect_left(keys, key)
+        if keys[i] == key:
+            self._values[i] = value
+        else:
+            keys.insert(i, key)
+            self._values.insert(i, value)
+
+    def _index(self, key: Any) -> int:
+        keys = self._keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return i
+        return -1
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        i = self._index(key)
+        return self._values[i] if i >= 0 else default
+
+    def contains(self, key: Any) -> bool:
+        return self._index(key) >= 0
+
+    def delete(self, key: Any) -> bool:
+        i = self._index(key)
+        if i < 0:
+            return False
+        del self._keys[i]
+        del self._values[i]
+        return True
+
+    def min_item(self) -> Optional[Tuple[Any, Any]]:
+        return (self._keys[0], self._values[0]) if self._keys else None
+
+    def max_item(self) -> Optional[Tuple[Any, Any]]:
+        return (self._keys[-1], self._values[-1]) if self._keys else None
+
+    def items_inorder(self) -> Iterator[Tuple[Any, Any]]:
+        yield from zip(self._keys, self._values)
+
+    def items_range(self, lo: Any = None, hi: Any = None) -> Iterator[Tuple[Any, Any]]:
+        """Yield items with lo <= key < hi. None means unbounded."""
+        start = 0 if lo is None else bisect_left(self._keys, lo)
+        stop = len(self._keys) if hi is None else bisect_left(self._keys, hi)
+        for i in range(start, stop):
+            yield (self._keys[i], self._values[i])
+
+
+class BlockedSortedListMap:
+    """
+    Sorted list of lists: keys live in sorted blocks of at most 2 * load items.
+
+    A top-level list of block maxima is bisected first, so an insert or delete
+    only shifts elements inside one block instead of the whole array.
+    """
+
+    def __init__(self, load: int = 512) -> None:
+        if load <= 0:
+            raise ValueError("load must be > 0")
+        self._load = load
+        self._key_blocks: List[List[Any]] = []
+        self._value_blocks: List[List[Any]] = []
+        self._maxes: List[Any] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def set(self, key: Any, value: Any) -> None:
+        maxes = self._maxes
+        if not maxes:
+            self._key_blocks.append([key])
+            self._value_blocks.append([value])
+            maxes.append(key)
+            self._size = 1
+            return
+
+        b = bisect_left(maxes, key)
+        if b == len(maxes):
+            # Past the current max: append to the last block
+            b -= 1
+            self._key_blocks[b].append(key)
+            self._value_blocks[b].append(value)
+            maxes[b] = key
+        else:
+            keys = self._key_blocks[b]
+            i = bisect_left(keys, key)
+            if keys[i] == key:
+                self._value_blocks[b][i] = value
+                return
+            keys.insert(i, key)
+            self._value_blocks[b].insert(i, value)
+        self._size += 1
+
+        if len(self._key_blocks[b]) > 2 * self._load:
+            self._split(b)
+
+    def _split(self, b: int) -> None:
+        keys, values = self._key_blocks[b], self._value_blocks[b]
+        half = len(keys) // 2
+        self._key_blocks[b:b + 1] = [keys[:half], keys[half:]]
+        self._value_blocks[b:b + 1] = [values[:half], values[half:]]
+        self._maxes[b:b + 1] = [keys[half - 1], keys[-1]]
+
+    def _locate(self, key: Any) -> Tuple[int, int]:
+        b = bisect_left(self._maxes, key)
+        if b == len(self._maxes):
+            return -1, -1
+        keys = self._key_blocks[b]
+        i = bisect_left(keys, key)
+        if keys[i] == key:
+            return b, i
+        return -1, -1
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        b, i = self._locate(key)
+        return self._value_blocks[b][i] if b >= 0 else default
+
+    def contains(self, key: Any) -> bool:
+        return self._locate(key)[0] >= 0
+
+    def delete(self, key: Any) -> bool:
+        b, i = self._locate(key)
+        if b < 0:
+            return False
+        keys = self._key_blocks[b]
+        del keys[i]
+        del self._value_blocks[b][i]
+        self._size -= 1
+        if keys:
+            self._maxes[b] = keys[-1]
+        else:
+            del self._key_blocks[b]
+            del self._value_blocks[b]
+            del self._maxes[b]
+        return True
+
+    def min_item(self) -> Optional[Tuple[Any, Any]]:
+        if not self._maxes:
+            return None
+        return self._key_blocks[0][0], self._value_blocks[0][0]
+
+    def max_item(self) -> Optional[Tuple[Any, Any]]:
+        if not self._maxes:
+            return None
+        return self._key_blocks[-1][-1], self._value_blocks[-1][-1]
+
+    def items_inorder(self) -> Iterator[Tuple[Any, Any]]:
+        for keys, values in zip(self._key_blocks, self._value_blocks):
+            yield from zip(keys, values)
+
+    def items_range(self, lo: Any = None, hi: Any = None) -> Iterator[Tuple[Any, Any]]:
+        """Yield items with lo <= key < hi. None means unbounded."""
+        b = 0 if lo is None else bisect_left(self._maxes, lo)
+        for b in range(b, len(self._maxes)):
+            keys, values = self._key_blocks[b], self._value_blocks[b]
+            start = 0 if lo is None else bisect_left(keys, lo)
+            stop = len(keys) if hi is None else bisect_left(keys, hi)
+            for i in range(start, stop):
+                yield (keys[i], values[i])
+            if stop < len(keys):
+                return
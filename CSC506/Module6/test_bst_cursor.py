@@ -0,0 +1,48 @@
+from Module6.bst_cursor import merge_join
+from Module6.bst_map import BSTMap
+
+
+def _map(keys, tag=""):
+    m = BSTMap()
+    for k in keys:
+        m.set(k, f"{tag}{k}")
+    return m
+
+
+def test_seek_next_prev():
+    c = _map([10, 20, 30, 40]).cursor()
+    assert c.seek(25) and c.key == 30
+    assert c.next() and c.key == 40
+    assert not c.next() and not c.valid and c.item() is None
+    assert c.seek(10) and not c.prev()
+    assert not c.seek(41)
+    assert c.last() and c.key == 40 and c.prev() and c.key == 30
+
+
+def test_full_forward_and_backward_walks():
+    keys = [5, 3, 8, 1, 4, 7, 9]
+    c = _map(keys).cursor()
+    forward = []
+    ok = c.first()
+    while ok:
+        forward.append(c.key)
+        ok = c.next()
+    backward = []
+    ok = c.last()
+    while ok:
+        backward.append(c.key)
+        ok = c.prev()
+    assert forward == sorted(keys) and backward == sorted(keys, reverse=True)
+
+
+def test_empty_cursor():
+    c = BSTMap().cursor()
+    assert not c.first() and not c.last() and not c.seek(1)
+
+
+def test_merge_join_matches_dict_intersection():
+    left = _map(range(0, 200, 3), "l")
+    right = _map(range(0, 200, 7), "r")
+    rows = list(merge_join(left.cursor(), right.cursor()))
+    assert rows == [(k, f"l{k}", f"r{k}") for k in range(0, 200, 21)]
+    assert list(merge_join(left.cursor(), BSTMap().cursor())) == []
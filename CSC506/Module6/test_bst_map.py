@@ -0,0 +1,54 @@
+import pytest
+
+from Module6.bst_map import BSTMap
+
+
+def _map(keys):
+    m = BSTMap()
+    for k in keys:
+        m.set(k, str(k))
+    return m
+
+
+def test_union_prefers_other_on_ties_and_is_balanced():
+    a = _map(range(0, 100, 2))
+    b = BSTMap.from_sorted_items([(k, "b") for k in range(0, 100, 3)])
+    u = a.union(b)
+    keys = [k for k, _ in u.items_inorder()]
+    assert keys == sorted(set(range(0, 100, 2)) | set(range(0, 100, 3)))
+    assert u.get(6) == "b" and u.get(4) == "4"
+    assert u.is_balanced()
+
+
+def test_split_then_join_round_trips():
+    m = BSTMap.from_sorted_items([(k, str(k)) for k in range(100)])
+    left, right = m.split(40)
+    assert [k for k, _ in left.items_inorder()] == list(range(40))
+    assert [k for k, _ in right.items_inorder()] == list(range(40, 100))
+    assert len(left) == 40 and len(right) == 60
+    assert left.is_balanced() and right.is_balanced()
+    joined = BSTMap.join(left, right)
+    assert [k for k, _ in joined.items_inorder()] == list(range(100))
+    assert len(joined) == 100 and joined.is_balanced()
+
+
+def test_split_on_missing_key_and_at_the_ends():
+    m = _map([10, 20, 30])
+    left, right = m.split(25)
+    assert [k for k, _ in left.items_inorder()] == [10, 20]
+    assert [k for k, _ in right.items_inorder()] == [30]
+    left, right = _map([1, 2]).split(0)
+    assert len(left) == 0 and len(right) == 2
+
+
+def test_repeated_one_key_joins_stay_logarithmic():
+    m = BSTMap()
+    for k in range(200):
+        m = BSTMap.join(m, _map([k]))
+    assert len(m) == 200
+    assert m.height() <= 10
+
+
+def test_join_rejects_overlapping_ranges():
+    with pytest.raises(ValueError):
+        BSTMap.join(_map([1, 5]), _map([3]))
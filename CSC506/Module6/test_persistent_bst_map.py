@@ -0,0 +1,45 @@
+import random
+
+from Module6.persistent_bst_map import PersistentBSTMap, VersionedBSTMap
+
+
+def test_old_versions_are_unchanged():
+    v0 = PersistentBSTMap()
+    v1 = v0.set(5, "a").set(2, "b").set(8, "c")
+    v2 = v1.set(2, "B").delete(8)
+    assert len(v0) == 0 and list(v0.items_inorder()) == []
+    assert list(v1.items_inorder()) == [(2, "b"), (5, "a"), (8, "c")]
+    assert list(v2.items_inorder()) == [(2, "B"), (5, "a")]
+    assert len(v1) == 3 and len(v2) == 2
+
+
+def test_set_shares_untouched_subtrees():
+    v1 = PersistentBSTMap.from_items([(5, 0), (2, 0), (8, 0)])
+    v2 = v1.set(9, 1)
+    assert v2._root is not v1._root
+    assert v2._root.left is v1._root.left  # the left subtree is not on the path
+
+
+def test_delete_missing_key_returns_self():
+    v = PersistentBSTMap.from_items([(1, 1)])
+    assert v.delete(7) is v
+
+
+def test_versioned_map_matches_dict_and_snapshots_are_stable():
+    rng = random.Random(4)
+    m, ref = VersionedBSTMap(), {}
+    snap, snap_items = m.snapshot(), []
+    for i in range(1500):
+        k = rng.randrange(200)
+        if rng.random() < 0.3:
+            assert m.delete(k) == (k in ref)
+            ref.pop(k, None)
+        else:
+            m.set(k, i)
+            ref[k] = i
+        if i == 700:
+            snap, snap_items = m.snapshot(), sorted(ref.items())
+    assert list(m.items_inorder()) == sorted(ref.items())
+    assert len(m) == len(ref)
+    assert list(snap.items_inorder()) == snap_items
+    assert m.min_item() == min(ref.items()) and m.max_item() == max(ref.items())
@@ -0,0 +1,67 @@
+import random
+import threading
+
+import pytest
+
+from Module6.skip_list_map import SkipListMap
+
+
+def test_matches_dict_under_random_set_and_delete():
+    rng = random.Random(1)
+    m, ref = SkipListMap(seed=1), {}
+    for _ in range(2000):
+        k = rng.randrange(300)
+        if rng.random() < 0.3:
+            assert m.delete(k) == (k in ref)
+            ref.pop(k, None)
+        else:
+            m.set(k, -k)
+            ref[k] = -k
+    assert len(m) == len(ref)
+    assert list(m.items_inorder()) == sorted(ref.items())
+    assert m.min_item() == min(ref.items()) and m.max_item() == max(ref.items())
+    assert m.get(1000, "missing") == "missing"
+
+
+def test_items_range_is_half_open():
+    m = SkipListMap(seed=2)
+    for k in range(10):
+        m.set(k, str(k))
+    assert [k for k, _ in m.items_range(3, 6)] == [3, 4, 5]
+    assert [k for k, _ in m.items_range(lo=8)] == [8, 9]
+    assert [k for k, _ in m.items_range(hi=2)] == [0, 1]
+
+
+def test_empty_map_and_bad_parameters():
+    m = SkipListMap()
+    assert m.min_item() is None and m.max_item() is None
+    assert not m.delete(1)
+    with pytest.raises(ValueError):
+        SkipListMap(p=1.0)
+    with pytest.raises(ValueError):
+        SkipListMap(max_level=0)
+
+
+def test_readers_see_sorted_chain_during_writes():
+    m = SkipListMap(seed=3)
+    for k in range(0, 2000, 2):
+        m.set(k, k)
+    stop = threading.Event()
+    errors = []
+
+    def read():
+        while not stop.is_set():
+            keys = [k for k, _ in m.items_inorder()]
+            if keys != sorted(keys) or any(k % 2 == 0 and k not in keys for k in (0, 1998)):
+                errors.append(keys)
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    for k in range(1, 2000, 2):
+        m.set(k, k)
+    for k in range(1, 2000, 2):
+        m.delete(k)
+    stop.set()
+    reader.join()
+    assert errors == []
+    assert len(m) == 1000
@@ -0,0 +1,173 @@
+from __future__ import annotations
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from graph_algorithms import GraphLike, _neighbor_fn
+from graph_csr import CSRGraph, _csr_dijkstra
+from graph_matrix import GraphMatrix
+
+# Default arc density (stored arcs / V(V-1)) per Dijkstra worker at or
+# above which "auto" picks Floyd-Warshall. Both engines cost ~V^3 (times
+# density for Dijkstra), so the crossover is nearly independent of V and
+# moves up linearly with the number of workers. The value itself is only
+# the crossover benchmark_all_pairs measured on one machine; it has no
+# derivation beyond that, so rerun the benchmark and pass dense_threshold
+# where the hardware differs.
+DENSE_THRESHOLD = 0.005
+
+
+class DistanceTable:
+    """V x V shortest-path distances; inf marks an unreachable pair."""
+
+    def __init__(self, labels: Sequence[Any], dist: np.ndarray, engine: str) -> None:
+        self.labels: List[Any] = list(labels)
+        self.index: Dict[Any, int] = {v: i for i, v in enumerate(self.labels)}
+        self.dist = dist
+        self.engine = engine
+
+    def __getitem__(self, pair: Tuple[Any, Any]) -> float:
+        u, v = pair
+        return float(self.dist[self.index[u], self.index[v]])
+
+    def row(self, u: Any) -> Dict[Any, float]:
+        """Reachable targets of u, in the same shape as dijkstra_all's dist."""
+        values = self.dist[self.index[u]]
+        return {self.labels[j]: float(values[j]) for j in np.flatnonzero(np.isfinite(values)).tolist()}
+
+
+def density(graph: GraphLike) -> float:
+    """Stored arcs / V(V-1); an undirected edge counts as two arcs."""
+    n = len(graph.vertices())
+    if n < 2:
+        return 1.0
+    if hasattr(graph, "edge_count"):
+        arcs = graph.edge_count()
+    elif hasattr(graph, "num_arcs"):
+        arcs = graph.num_arcs
+    else:
+        neighbors = _neighbor_fn(graph)
+        arcs = sum(1 for u in graph.vertices() for _ in neighbors(u))
+    return arcs / (n * (n - 1))
+
+
+def _weight_matrix(graph: GraphLike) -> Tuple[List[Any], np.ndarray]:
+    """Labels and a fresh float64 weight matrix (inf = no edge, 0 on the diagonal)."""
+    if isinstance(graph, GraphMatrix):
+        # Copy the live block instead of walking adjacency; the graph is not compacted
+        labels = graph.vertices()
+        dist = graph.weight_block()
+    else:
+        labels = graph.vertices()
+        index = {v: i for i, v in enumerate(labels)}
+        n = len(labels)
+        dist = np.full((n, n), np.inf)
+        neighbors = _neighbor_fn(graph)
+        for u in labels:
+            i = index[u]
+            for v, w in neighbors(u):
+                if w < dist[i, index[v]]:
+                    dist[i, index[v]] = w
+    if (dist < 0).any():
+        raise ValueError("Negative edge weight found; all-pairs engines not valid.")
+    np.fill_diagonal(dist, 0.0)
+    return labels, dist
+
+
+def floyd_warshall(graph: GraphLike) -> DistanceTable:
+    """
+    Floyd-Warshall with each k-pass done as one broadcast NumPy minimum,
+    so the V^3 work runs in C. O(V^2) memory.
+    """
+    labels, dist = _weight_matrix(graph)
+    for k in range(len(labels)):
+        np.minimum(dist, dist[:, k, None] + dist[None, k, :], out=dist)
+    return DistanceTable(labels, dist, "floyd_warshall")
+
+
+# Worker-side CSR, shipped once per process by the pool initializer
+_WORKER_CSR: Optional[CSRGraph] = None
+
+
+def _init_worker(n: int, offsets: array, targets: array, weights: array) -> None:
+    global _WORKER_CSR
+    # Workers only touch int indices, so range(n) stands in for the labels
+    _WORKER_CSR = CSRGraph(range(n), offsets, targets, weights)
+
+
+def _plain_buffer(values: Sequence[Any], typecode: str) -> array:
+    """An owned `array` copy of a CSR buffer (which may be a view onto an mmap)."""
+    out = array(typecode)
+    try:
+        view = memoryview(values)  # type: ignore[arg-type]
+    except TypeError:
+        view = None
+    if view is not None and view.format == typecode:
+        out.frombytes(view.cast("B"))
+        view.release()
+    else:
+        out.extend(values)
+    return out
+
+
+def _dijkstra_rows(sources: Sequence[int]) -> List[Tuple[int, bytes]]:
+    csr = _WORKER_CSR
+    return [(s, _csr_dijkstra(csr, s, -1)[0].tobytes()) for s in sources]
+
+
+def repeated_dijkstra(graph: GraphLike, workers: Optional[int] = None, chunk: int = 64) -> DistanceTable:
+    """
+    One single-source Dijkstra per vertex on a frozen CSR copy of the graph,
+    fanned out over a process pool in chunks of sources. workers=None uses
+    every CPU; workers<=1 runs in-process. O(V * E log V) total work.
+    """
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph, sort_neighbors=False)
+    if any(w < 0 for w in csr.weights):
+        raise ValueError("Negative edge weight found; Dijkstra not valid.")
+    n = csr.num_vertices
+    dist = np.empty((n, n))
+    workers = (os.cpu_count() or 1) if workers is None else workers
+
+    if workers <= 1 or n <= chunk:
+        for s in range(n):
+            dist[s] = np.frombuffer(_csr_dijkstra(csr, s, -1)[0], dtype=np.float64)
+    else:
+        batches = [range(lo, min(lo + chunk, n)) for lo in range(0, n, chunk)]
+        # Ship plain arrays, not the graph: a MappedCSRGraph owns an mmap that
+        # cannot be pickled, and labels are not needed to fill the rows
+        buffers = (n, _plain_buffer(csr.offsets, "q"), _plain_buffer(csr.targets, "i"),
+                   _plain_buffer(csr.weights, "d"))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=buffers) as pool:
+            for rows in pool.map(_dijkstra_rows, batches):
+                for s, raw in rows:
+                    dist[s] = np.frombuffer(raw, dtype=np.float64)
+    return DistanceTable(csr.vertices(), dist, "repeated_dijkstra")
+
+
+def choose_engine(graph: GraphLike, workers: int = 1, dense_threshold: float = DENSE_THRESHOLD) -> str:
+    """The engine "auto" resolves to for this graph and worker count."""
+    if density(graph) >= dense_threshold * max(1, workers):
+        return "floyd_warshall"
+    return "repeated_dijkstra"
+
+
+def all_pairs_shortest_paths(
+    graph: GraphLike, engine: str = "auto", workers: Optional[int] = None,
+    dense_threshold: float = DENSE_THRESHOLD,
+) -> DistanceTable:
+    """
+    Distances between every pair of vertices. engine is "floyd_warshall",
+    "repeated_dijkstra" or "auto", which picks Floyd-Warshall when
+    density(graph) >= dense_threshold * workers and repeated Dijkstra otherwise.
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if engine == "auto":
+        engine = choose_engine(graph, workers, dense_threshold)
+    if engine == "floyd_warshall":
+        return floyd_warshall(graph)
+    if engine == "repeated_dijkstra":
+        return repeated_dijkstra(graph, workers=workers)
+    raise ValueError(f"Unknown all-pairs engine: {engine!r}")
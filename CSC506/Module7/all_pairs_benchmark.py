@@ -0,0 +1,47 @@
+"""
+All-Pairs Benchmark
+===================
+
+Floyd-Warshall vs repeated Dijkstra (serial and pooled) across arc
+densities, next to the engine all_pairs_shortest_paths(engine="auto")
+would pick. The crossover printed here is where DENSE_THRESHOLD came from;
+rerun it to choose dense_threshold on other hardware.
+"""
+
+import os
+from typing import List, Optional
+
+from all_pairs import DENSE_THRESHOLD, choose_engine, floyd_warshall, repeated_dijkstra
+from graph_benchmark import banner, timed, to_matrix
+from graph_generators import gnm_graph
+
+
+def benchmark_all_pairs(sizes: Optional[List[int]] = None,
+                        densities: Optional[List[float]] = None) -> None:
+    """Floyd-Warshall vs repeated Dijkstra (serial and pooled) across arc densities."""
+    sizes = sizes or [300, 600]
+    densities = densities or [0.002, 0.005, 0.01, 0.02, 0.05, 0.1]
+    cpus = os.cpu_count() or 1
+    banner(f"All-pairs shortest paths ({cpus} CPU(s), auto threshold {DENSE_THRESHOLD} per worker)")
+    for n in sizes:
+        for d in densities:
+            g = gnm_graph(n, max(1, int(d * n * (n - 1) / 2)))
+            m = to_matrix(g)
+
+            t_fw, fw = timed(lambda: floyd_warshall(m))
+            t_serial, rd = timed(lambda: repeated_dijkstra(g, workers=1))
+            t_pool, _ = timed(lambda: repeated_dijkstra(g, workers=cpus))
+            assert fw.row(0) == rd.row(0)
+
+            winner = "floyd_warshall" if t_fw <= t_pool else "repeated_dijkstra"
+            picked = choose_engine(g, cpus)
+            print(f"V={n:>4} density={d:5.3f} | floyd_warshall {t_fw:7.3f}s | dijkstra x{n} serial {t_serial:7.3f}s "
+                  f"pool({cpus}) {t_pool:7.3f}s | fastest {winner:17s} auto {picked}")
+
+
+def main() -> None:
+    benchmark_all_pairs()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Runs every per-feature benchmark module in turn. Each module can also be
+run on its own (python search_benchmark.py, ...); graph_benchmark.py runs
+the representation x algorithm matrix and holds the shared timing helpers.
+"""
+
+import all_pairs_benchmark
+import connectivity_benchmark
+import dynamic_sssp_benchmark
+import io_benchmark
+import parallel_bfs_benchmark
+import path_cache_benchmark
+import representation_benchmark
+import search_benchmark
+import tracing_benchmark
+
+MODULES = (
+    search_benchmark,
+    tracing_benchmark,
+    representation_benchmark,
+    all_pairs_benchmark,
+    path_cache_benchmark,
+    dynamic_sssp_benchmark,
+    connectivity_benchmark,
+    io_benchmark,
+    parallel_bfs_benchmark,
+)
+
+
+def main() -> None:
+    for module in MODULES:
+        module.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+from __future__ import annotations
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+import heapq
+
+from graph_algorithms import GraphLike, _neighbor_fn
+from graph_list import GraphList
+from union_find import DisjointSet
+
+Edge = Tuple[Any, Any, float]
+
+
+def _intern(graph: GraphLike) -> Tuple[List[Any], Dict[Any, int]]:
+    labels = graph.vertices()
+    return labels, {v: i for i, v in enumerate(labels)}
+
+
+def connected_components(graph: GraphLike) -> List[List[Any]]:
+    """
+    Vertex sets of the connected components (weakly connected on directed
+    graphs), via one union-find pass over the edges: O(V + E alpha(V)).
+    Components are ordered by their first vertex in graph.vertices().
+    """
+    labels, index = _intern(graph)
+    ds = DisjointSet(len(labels))
+    neighbors = _neighbor_fn(graph)
+    union = ds.union
+    directed = getattr(graph, "directed", False)
+    for i, u in enumerate(labels):
+        for v, _w in neighbors(u):
+            j = index[v]
+            if directed or i < j:  # undirected edges are stored both ways
+                union(i, j)
+    return [[labels[i] for i in members] for members in ds.groups().values()]
+
+
+def _directed_adjacency(graph: GraphLike, what: str) -> Tuple[List[Any], List[List[int]]]:
+    if not getattr(graph, "directed", False):
+        raise ValueError(f"{what} needs a directed graph.")
+    labels, index = _intern(graph)
+    neighbors = _neighbor_fn(graph)
+    return labels, [[index[v] for v, _w in neighbors(u)] for u in labels]
+
+
+def _tarjan(adj: List[List[int]]) -> List[List[int]]:
+    """
+    Tarjan's SCC with an explicit stack of vertices and a per-vertex cursor
+    into its neighbor list in place of recursion, so depth is bounded by
+    memory rather than the recursion limit. Frames are plain ints, which
+    keeps deep searches from triggering garbage-collector passes.
+    Components come out in reverse topological order of the condensation.
+    """
+    n = len(adj)
+    order = [-1] * n  # discovery index, -1 = unvisited
+    low = [0] * n
+    cursor = [0] * n  # next neighbor position to scan
+    on_stack = bytearray(n)
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for root in range(n):
+        if order[root] >= 0:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [root]
+        while work:
+            v = work[-1]
+            nbrs = adj[v]
+            k = cursor[v]
+            descended = False
+            while k < len(nbrs):
+                w = nbrs[k]
+                k += 1
+                if order[w] < 0:
+                    order[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    work.append(w)
+                    descended = True
+                    break
+                if on_stack[w] and order[w] < low[v]:
+                    low[v] = order[w]
+            cursor[v] = k
+            if descended:
+                continue
+            work.pop()
+            if work:
+                u = work[-1]
+                if low[v] < low[u]:
+                    low[u] = low[v]
+            if low[v] == order[v]:
+                component = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = 0
+                    component.append(w)
+                    if w == v:
+                        break
+                components.append(component)
+    return components
+
+
+def strongly_connected_components(graph: GraphLike) -> List[List[Any]]:
+    """
+    Vertex sets of the strongly connected components of a directed graph,
+    by iterative Tarjan: O(V + E). Components are in topological order of
+    the condensation (every edge between two components points forward);
+    members keep graph.vertices() order.
+    """
+    labels, adj = _directed_adjacency(graph, "Strongly connected components")
+    return [[labels[i] for i in sorted(members)] for members in reversed(_tarjan(adj))]
+
+
+def topological_sort(graph: GraphLike) -> List[Any]:
+    """
+    Kahn's algorithm: repeatedly emit a vertex with no remaining incoming
+    edges. O(V + E). Ties follow graph.vertices() order. Raises ValueError
+    if the graph has a cycle.
+    """
+    labels, adj = _directed_adjacency(graph, "Topological sort")
+    indegree = [0] * len(labels)
+    for nbrs in adj:
+        for j in nbrs:
+            indegree[j] += 1
+    queue = deque(i for i, d in enumerate(indegree) if d == 0)
+    order: List[int] = []
+    while queue:
+        i = queue.popleft()
+        order.append(i)
+        for j in adj[i]:
+            indegree[j] -= 1
+            if indegree[j] == 0:
+                queue.append(j)
+    if len(order) < len(labels):
+        raise ValueError(f"Graph has a cycle: {len(labels) - len(order)} vertices lie on or after one.")
+    return [labels[i] for i in order]
+
+
+def condensation(graph: GraphLike) -> Tuple[GraphList, Dict[Any, int]]:
+    """
+    The DAG of strongly connected components: vertex k stands for the k-th
+    component of strongly_connected_components (so 0..k-1 is already a
+    topological order) and keeps the lightest edge between two components.
+    Returns (dag, vertex -> component number).
+    """
+    labels, adj = _directed_adjacency(graph, "Condensation")
+    neighbors = _neighbor_fn(graph)
+    components = _tarjan(adj)
+    last = len(components) - 1
+    comp = [0] * len(labels)
+    for k, members in enumerate(components):
+        for i in members:
+            comp[i] = last - k  # renumber into topological order
+
+    dag_adj: Dict[Any, Dict[Any, float]] = {k: {} for k in range(len(components))}
+    for i, u in enumerate(labels):
+        cu = comp[i]
+        out = dag_adj[cu]
+        for j, (_v, w) in zip(adj[i], neighbors(u)):
+            cv = comp[j]
+            if cv != cu and w < out.get(cv, float("inf")):
+                out[cv] = w
+    return GraphList.from_adjacency(dag_adj, directed=True), {labels[i]: comp[i] for i in range(len(labels))}
+
+
+def _undirected_edges(graph: GraphLike) -> Tuple[List[Any], List[Tuple[float, int, int]]]:
+    if getattr(graph, "directed", False):
+        raise ValueError("Minimum spanning trees need an undirected graph.")
+    labels, index = _intern(graph)
+    neighbors = _neighbor_fn(graph)
+    edges: List[Tuple[float, int, int]] = []
+    for i, u in enumerate(labels):
+        for v, w in neighbors(u):
+            j = index[v]
+            if i < j:  # each undirected edge is stored twice; keep one copy
+                edges.append((w, i, j))
+    return labels, edges
+
+
+def kruskal_mst(graph: GraphLike) -> Tuple[List[Edge], float]:
+    """
+    Minimum spanning forest by Kruskal: sort edges once, keep each edge
+    that joins two different union-find sets. O(E log E).
+    Returns (edges as (u, v, w), total weight).
+    """
+    labels, edges = _undirected_edges(graph)
+    edges.sort()
+    ds = DisjointSet(len(labels))
+    union = ds.union
+    tree: List[Edge] = []
+    total = 0.0
+    for w, i, j in edges:
+        if union(i, j):
+            tree.append((labels[i], labels[j], w))
+            total += w
+            if ds.count == 1:
+                break
+    return tree, total
+
+
+def prim_mst(graph: GraphLike, start: Optional[Any] = None) -> Tuple[List[Edge], float]:
+    """
+    Minimum spanning forest by Prim with a lazy binary heap: O(E log E).
+    Grows a tree from start (default: the first vertex), then from each
+    vertex not yet reached, so disconnected graphs give a forest like
+    kruskal_mst. Same return shape as kruskal_mst.
+    """
+    if getattr(graph, "directed", False):
+        raise ValueError("Minimum spanning trees need an undirected graph.")
+    labels, index = _intern(graph)
+    neighbors = _neighbor_fn(graph)
+    in_tree = bytearray(len(labels))
+    tree: List[Edge] = []
+    total = 0.0
+
+    roots = list(range(len(labels)))
+    if start is not None:
+        roots.insert(0, index[start])
+    for root in roots:
+        if in_tree[root]:
+            continue
+        in_tree[root] = 1
+        pq: List[Tuple[float, int, int]] = [(w, index[v], root) for v, w in neighbors(labels[root])]
+        heapq.heapify(pq)
+        while pq:
+            w, j, i = heapq.heappop(pq)
+            if in_tree[j]:
+                continue
+            in_tree[j] = 1
+            tree.append((labels[i], labels[j], w))
+            total += w
+            for v, wv in neighbors(labels[j]):
+                k = index[v]
+                if not in_tree[k]:
+                    heapq.heappush(pq, (wv, k, j))
+    return tree, total
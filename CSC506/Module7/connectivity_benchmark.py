@@ -0,0 +1,114 @@
+"""
+Connectivity Benchmarks
+=======================
+
+- connected components by union-find vs a BFS sweep (and the BFS from
+  every vertex it replaced), Kruskal vs Prim on a million-edge graph
+- SCC, topological sort and condensation on a million-edge DAG, with
+  cycles added, and on a chain deeper than the recursion limit
+"""
+
+import random
+import sys
+from typing import Any
+
+from connectivity import (
+    condensation,
+    connected_components,
+    kruskal_mst,
+    prim_mst,
+    strongly_connected_components,
+    topological_sort,
+)
+from graph_algorithms import bfs_tree
+from graph_benchmark import banner, timed
+from graph_generators import gnm_graph
+from graph_list import GraphList
+
+
+def benchmark_connectivity(n: int = 250_000, m: int = 1_000_000, bfs_sample: int = 5) -> None:
+    """Components by union-find vs BFS; Kruskal vs Prim MST on a million-edge graph."""
+    banner(f"Connectivity and MST (V={n:,}, E={m:,})")
+    t, g = timed(lambda: gnm_graph(n, m))
+    print(f"build GraphList: {t:7.3f}s")
+
+    # What the planning jobs did: a BFS from every vertex. Timed on a sample, extrapolated to V.
+    vertices = g.vertices()
+    per_bfs = timed(lambda: [bfs_tree(g, s) for s in vertices[:bfs_sample]])[0] / bfs_sample
+    print(f"BFS from every vertex (est.): {per_bfs * n / 3600:9.1f} h ({per_bfs:.3f}s per BFS)")
+
+    # Better BFS baseline: one sweep, a new BFS only from unseen vertices
+    def bfs_sweep() -> int:
+        seen = set()
+        sweep = 0
+        for s in vertices:
+            if s not in seen:
+                seen.update(bfs_tree(g, s)[0])
+                sweep += 1
+        return sweep
+
+    bfs_time, sweep = timed(bfs_sweep)
+    uf_time, comps = timed(lambda: connected_components(g))
+    assert len(comps) == sweep
+    print(f"BFS sweep: {bfs_time:7.3f}s | union-find connected_components: {uf_time:7.3f}s | "
+          f"{len(comps):,} components")
+
+    k_time, (k_edges, k_total) = timed(lambda: kruskal_mst(g))
+    p_time, (p_edges, p_total) = timed(lambda: prim_mst(g))
+    assert len(k_edges) == len(p_edges) == n - len(comps) and abs(k_total - p_total) < 1e-6
+    print(f"kruskal_mst: {k_time:7.3f}s | prim_mst: {p_time:7.3f}s | forest weight {k_total:,.0f} "
+          f"({len(k_edges):,} edges)")
+
+
+def benchmark_dag(n: int = 200_000, m: int = 1_000_000, back_edges: int = 2_000) -> None:
+    """SCC, topological sort and condensation on a million-edge DAG, then with cycles added."""
+    banner(f"Directed ordering (V={n:,}, E={m:,})")
+    rng = random.Random(12)
+    rank = list(range(n))
+    rng.shuffle(rank)  # hidden topological order, so vertex ids are not already sorted
+
+    def arcs(count: int, forward: bool) -> Any:
+        for _ in range(count):
+            a, b = rng.randrange(n), rng.randrange(n)
+            if a != b:
+                lo, hi = min(a, b), max(a, b)
+                yield (rank[lo], rank[hi], 1.0) if forward else (rank[hi], rank[lo], 1.0)
+
+    dag = GraphList(directed=True)
+    for v in range(n):
+        dag.add_vertex(v)
+    dag.add_edges(arcs(m, forward=True))
+
+    t, order = timed(lambda: topological_sort(dag))
+    pos = {v: i for i, v in enumerate(order)}
+    assert all(pos[u] < pos[v] for u in dag.vertices() for v, _w in dag.iter_neighbors(u))
+    print(f"topological_sort (DAG):             {t:7.3f}s")
+    t, comps = timed(lambda: strongly_connected_components(dag))
+    assert len(comps) == n
+    print(f"strongly_connected_components (DAG): {t:7.3f}s | {len(comps):,} components")
+
+    dag.add_edges(arcs(back_edges, forward=False))
+    t, comps = timed(lambda: strongly_connected_components(dag))
+    print(f"strongly_connected_components (+{back_edges:,} back edges): {t:7.3f}s | {len(comps):,} components, "
+          f"largest {max(map(len, comps)):,}")
+    t, (cdag, _membership) = timed(lambda: condensation(dag))
+    print(f"condensation: {t:7.3f}s | {len(cdag.vertices()):,} vertices")
+    try:
+        topological_sort(dag)
+    except ValueError as exc:
+        print(f"topological_sort with cycles: ValueError ({exc})")
+
+    # The DFS depth a recursive Tarjan would need on a long dependency chain
+    chain = GraphList(directed=True)
+    chain.add_edges((i, i + 1, 1.0) for i in range(n - 1))
+    t, comps = timed(lambda: strongly_connected_components(chain))
+    print(f"SCC on a {n:,}-vertex chain (depth {n:,}, recursion limit {sys.getrecursionlimit():,}): {t:7.3f}s")
+
+
+def main() -> None:
+    benchmark_connectivity()
+    benchmark_dag()
+
+
+if __name__ == "__main__":
+    main()
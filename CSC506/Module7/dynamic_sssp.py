@@ -0,0 +1,151 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Set, Tuple
+import heapq
+
+from graph_algorithms import GraphLike, _neighbor_fn, dijkstra_all, reconstruct_path
+
+
+class DynamicSSSP:
+    """
+    Single-source shortest paths kept up to date across edge updates, in the
+    spirit of Ramalingam-Reps.
+
+    Route edge changes through add_edge/remove_edge here. A decrease or
+    insertion runs a Dijkstra seeded at the improved endpoint and stops
+    where distances stop improving. A deletion or increase on a
+    shortest-path-tree edge (u, v) invalidates only v's subtree: those
+    vertices are re-seeded from their unaffected predecessors and settled
+    with a Dijkstra confined to the subtree. Changes to non-tree edges
+    cost O(degree). If the graph was mutated behind our back (graph.version
+    moved), the next call recomputes from scratch.
+
+    Needs graph.predecessors (GraphList keeps a reverse index for directed graphs).
+    """
+
+    def __init__(self, graph: GraphLike, source: Any) -> None:
+        self.graph = graph
+        self.source = source
+        self.dist: Dict[Any, float] = {}
+        self.parent: Dict[Any, Optional[Any]] = {}
+        self._children: Dict[Any, Set[Any]] = {}
+        self.last_affected = 0  # vertices settled by the last repair
+        self.recompute()
+
+    def recompute(self) -> None:
+        """Full Dijkstra from source; rebuilds the tree's child index."""
+        self.dist, self.parent = dijkstra_all(self.graph, self.source)
+        self._children = {}
+        for v, p in self.parent.items():
+            if p is not None:
+                self._children.setdefault(p, set()).add(v)
+        self._version = getattr(self.graph, "version", 0)
+        self.last_affected = len(self.dist)
+
+    def distance(self, v: Any) -> float:
+        self._sync()
+        return self.dist.get(v, float("inf"))
+
+    def path(self, v: Any) -> List[Any]:
+        self._sync()
+        return reconstruct_path(self.parent, v)
+
+    def add_edge(self, u: Any, v: Any, weight: float = 1.0) -> None:
+        """graph.add_edge plus repair; also handles re-weighting an existing edge."""
+        self._sync()
+        old = self._weight(u, v)
+        self.graph.add_edge(u, v, weight)
+        self.last_affected = 0
+        arcs = [(u, v)] if self.graph.directed else [(u, v), (v, u)]
+        for a, b in arcs:
+            if old is not None and weight > old:
+                self._increase(a, b)
+            else:
+                self._decrease(a, b, float(weight))
+        self._version = getattr(self.graph, "version", 0)
+
+    def remove_edge(self, u: Any, v: Any) -> bool:
+        """graph.remove_edge plus repair."""
+        self._sync()
+        existed = self.graph.remove_edge(u, v)
+        self.last_affected = 0
+        if existed:
+            self._increase(u, v)
+            if not self.graph.directed:
+                self._increase(v, u)
+        self._version = getattr(self.graph, "version", 0)
+        return existed
+
+    def _sync(self) -> None:
+        if getattr(self.graph, "version", 0) != self._version:
+            self.recompute()
+
+    def _weight(self, u: Any, v: Any) -> Optional[float]:
+        for x, w in _neighbor_fn(self.graph)(u):
+            if x == v:
+                return w
+        return None
+
+    def _set_parent(self, v: Any, p: Any) -> None:
+        old = self.parent.get(v)
+        if old is not None:
+            self._children[old].discard(v)
+        self.parent[v] = p
+        self._children.setdefault(p, set()).add(v)
+
+    def _propagate(self, pq: List[Tuple[float, Any]]) -> None:
+        """Dijkstra from the seeded queue; only strictly improving relaxations spread."""
+        dist = self.dist
+        neighbors = _neighbor_fn(self.graph)
+        inf = float("inf")
+        while pq:
+            d, x = heapq.heappop(pq)
+            if d > dist[x]:
+                continue
+            self.last_affected += 1
+            for y, w in neighbors(x):
+                alt = d + w
+                if alt < dist.get(y, inf):
+                    dist[y] = alt
+                    self._set_parent(y, x)
+                    heapq.heappush(pq, (alt, y))
+
+    def _decrease(self, u: Any, v: Any, weight: float) -> None:
+        if u not in self.dist or u == v:
+            return
+        alt = self.dist[u] + weight
+        if alt < self.dist.get(v, float("inf")):
+            self.dist[v] = alt
+            self._set_parent(v, u)
+            self._propagate([(alt, v)])
+
+    def _increase(self, u: Any, v: Any) -> None:
+        if self.parent.get(v) != u or u == v:
+            return  # not a tree edge: no distance can get worse
+
+        # Detach v's subtree; its distances are now unknown
+        affected: List[Any] = []
+        stack = [v]
+        while stack:
+            x = stack.pop()
+            affected.append(x)
+            stack.extend(self._children.pop(x, ()))
+        self._children[u].discard(v)
+        for x in affected:
+            del self.dist[x]
+            del self.parent[x]
+
+        # Re-seed each affected vertex from predecessors outside the subtree
+        dist = self.dist
+        inf = float("inf")
+        pq: List[Tuple[float, Any]] = []
+        for x in affected:
+            best, via = inf, None
+            for p, w in self.graph.predecessors(x):
+                if p in dist and dist[p] + w < best:
+                    best, via = dist[p] + w, p
+            if via is not None:
+                dist[x] = best
+                self._set_parent(x, via)
+                pq.append((best, x))
+        heapq.heapify(pq)
+        self._propagate(pq)
@@ -1,6 +1,12 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Protocol, Tuple
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Protocol, Set, Tuple, Union
 import heapq
+import warnings
+
+from graph_csr import CSRGraph, csr_bfs, csr_dfs, csr_dijkstra, csr_dijkstra_all
+from graph_matrix import GraphMatrix, matrix_dijkstra, matrix_dijkstra_all
+from tracing import StepLog
 
 
 class GraphLike(Protocol):
@@ -10,94 +16,249 @@ class GraphLike(Protocol):
     def neighbors(self, u: Any) -> List[Tuple[Any, float]]:
         ...
 
+    def iter_neighbors(self, u: Any) -> Iterable[Tuple[Any, float]]:
+        ...
+
+
+# heuristic(u, goal) -> lower bound on the u -> goal distance; see heuristics.py
+Heuristic = Callable[[Any, Any], float]
+
+# Called as tracer(event, *args); see tracing.py for ready-made sinks.
+# Algorithms only touch it behind an `is not None` check, so the default
+# (no tracer) does no formatting and grows no step list.
+Tracer = Callable[..., None]
+
+
+# dijkstra_all and dijkstra_shortest_path hand GraphMatrix graphs with at
+# least this many stored arcs per vertex (without a tracer) to the O(V^2)
+# array Dijkstra in graph_matrix.py. Both versions scan a whole matrix row
+# per settled vertex, so what decides it is how much of the graph a search
+# reaches: below ~1.5 arcs per vertex components stay small and the heap
+# wins 2-10x; from 2 up the array version is level or ahead at every V
+# measured (250..4000, benchmark_dense_dijkstra).
+DENSE_DIJKSTRA_MIN_DEGREE = 2.0
+
+
+def _use_matrix_dijkstra(graph: GraphLike, source: Any, tracer: Optional[Tracer]) -> bool:
+    return (tracer is None and isinstance(graph, GraphMatrix) and graph.has_vertex(source)
+            and graph.edge_count() >= DENSE_DIJKSTRA_MIN_DEGREE * len(graph.vertices()))
+
+
+def _step_log(name: str, steps: Optional[bool], tracer: Optional[Tracer]) -> Optional[StepLog]:
+    """
+    bfs, dfs and dijkstra_shortest_path used to return their formatted
+    steps as a last tuple element. steps=True keeps that shape, steps=False
+    returns the plain result. Leaving steps unset without a tracer still
+    gets the old shape but warns: the default will become False. Passing a
+    tracer is the new calling convention and implies steps=False.
+    """
+    if steps is None:
+        if tracer is not None:
+            return None
+        warnings.warn(f"{name}() returning a steps list is deprecated; pass steps=False for the "
+                      f"plain result, or a tracing.StepLog as tracer= to record steps",
+                      DeprecationWarning, stacklevel=3)
+        steps = True
+    return StepLog() if steps else None
+
+
+def _tee(log: StepLog, tracer: Optional[Tracer]) -> Tracer:
+    if tracer is None:
+        return log
+
+    def both(event: str, *args: Any) -> None:
+        log(event, *args)
+        tracer(event, *args)
+
+    return both
+
+
+def _neighbor_fn(graph: GraphLike) -> Callable[[Any], Iterable[Tuple[Any, float]]]:
+    """graph.iter_neighbors (no list per call) when the graph has it, else graph.neighbors."""
+    return getattr(graph, "iter_neighbors", graph.neighbors)
+
+
+def bfs(
+    graph: GraphLike, start: Any, tracer: Optional[Tracer] = None, steps: Optional[bool] = None
+) -> Union[List[Any], Tuple[List[Any], List[str]]]:
+    """
+    Teaching BFS: list queue, neighbors in str order, optional tracer.
+    Returns the visit order, or (order, steps) with steps=True (see
+    _step_log for the deprecated default). An untraced run on a CSRGraph
+    with sorted adjacency goes to csr_bfs, which visits in the same order.
+    """
+    log = _step_log("bfs", steps, tracer)
+    if log is not None:
+        return bfs(graph, start, _tee(log, tracer), steps=False), log.lines()
+    if tracer is None and isinstance(graph, CSRGraph) and graph.neighbors_sorted:
+        return csr_bfs(graph, start)[0]
 
-def bfs(graph: GraphLike, start: Any) -> Tuple[List[Any], List[str]]:
-   
     visited = set()
     order: List[Any] = []
-    steps: List[str] = []
+    presorted = getattr(graph, "neighbors_sorted", False)
 
     queue: List[Any] = [start]
-    steps.append(f"INIT queue={queue}")
+    if tracer is not None:
+        tracer("INIT", "queue", [start])
 
     while queue:
         u = queue.pop(0)
-        steps.append(f"DEQUEUE {u}")
+        if tracer is not None:
+            tracer("DEQUEUE", u)
 
         if u in visited:
-            steps.append(f"SKIP {u} (already visited)")
+            if tracer is not None:
+                tracer("SKIP", u, "already visited")
             continue
 
         visited.add(u)
         order.append(u)
-        steps.append(f"VISIT {u}")
+        if tracer is not None:
+            tracer("VISIT", u)
 
-        nbrs = sorted(graph.neighbors(u), key=lambda x: str(x[0]))
+        if presorted:
+            nbrs = graph.iter_neighbors(u)
+        else:
+            nbrs = sorted(graph.neighbors(u), key=lambda x: str(x[0]))
         for v, _w in nbrs:
             if v not in visited:
                 queue.append(v)
-                steps.append(f"ENQUEUE {v} (from {u})")
+                if tracer is not None:
+                    tracer("ENQUEUE", v, u)
+
+    return order
+
 
-    return order, steps
+def bfs_tree(
+    graph: GraphLike, start: Any, target: Any = None
+) -> Tuple[List[Any], Dict[Any, Optional[Any]], Dict[Any, int]]:
+    """
+    Production BFS: deque queue, vertices marked visited when enqueued.
 
+    Each vertex is enqueued at most once, so the run is O(V + E). Returns
+    (order, parent, dist): order is discovery order (the same as dequeue
+    order in BFS) and dist counts edges from start. When target is given
+    the search stops as soon as target is discovered. Neighbors are taken
+    in graph order, not sorted. CSRGraph input goes to csr_bfs.
+    """
+    if isinstance(graph, CSRGraph):
+        return csr_bfs(graph, start, target)
+
+    parent: Dict[Any, Optional[Any]] = {start: None}
+    dist: Dict[Any, int] = {start: 0}
+    order: List[Any] = [start]
+    queue: Deque[Any] = deque([start])
+
+    if start == target:
+        return order, parent, dist
+
+    neighbors = _neighbor_fn(graph)
+    while queue:
+        u = queue.popleft()
+        d = dist[u] + 1
+        for v, _w in neighbors(u):
+            if v in parent:
+                continue
+            parent[v] = u
+            dist[v] = d
+            order.append(v)
+            if v == target:
+                return order, parent, dist
+            queue.append(v)
+
+    return order, parent, dist
+
+
+def dfs(
+    graph: GraphLike, start: Any, tracer: Optional[Tracer] = None, steps: Optional[bool] = None
+) -> Union[List[Any], Tuple[List[Any], List[str]]]:
+    """
+    Iterative DFS, smallest neighbor (str order) first, optional tracer.
+    Returns the visit order, or (order, steps) with steps=True. An
+    untraced run on a CSRGraph with sorted adjacency goes to csr_dfs.
+    """
+    log = _step_log("dfs", steps, tracer)
+    if log is not None:
+        return dfs(graph, start, _tee(log, tracer), steps=False), log.lines()
+    if tracer is None and isinstance(graph, CSRGraph) and graph.neighbors_sorted:
+        return csr_dfs(graph, start)
 
-def dfs(graph: GraphLike, start: Any) -> Tuple[List[Any], List[str]]:
-    
     visited = set()
     order: List[Any] = []
-    steps: List[str] = []
+    presorted = getattr(graph, "neighbors_sorted", False)
 
     stack: List[Any] = [start]
-    steps.append(f"INIT stack={stack}")
+    if tracer is not None:
+        tracer("INIT", "stack", [start])
 
     while stack:
         u = stack.pop()
-        steps.append(f"POP {u}")
+        if tracer is not None:
+            tracer("POP", u)
 
         if u in visited:
-            steps.append(f"SKIP {u} (already visited)")
+            if tracer is not None:
+                tracer("SKIP", u, "already visited")
             continue
 
         visited.add(u)
         order.append(u)
-        steps.append(f"VISIT {u}")
+        if tracer is not None:
+            tracer("VISIT", u)
 
         # Push neighbors in reverse sorted order so the smallest comes out first
-        nbrs = sorted(graph.neighbors(u), key=lambda x: str(x[0]), reverse=True)
-        for v, _w in nbrs:
-            if v not in visited:
-                stack.append(v)
-                steps.append(f"PUSH {v} (from {u})")
+        if presorted:
+            fresh = [v for v, _w in graph.iter_neighbors(u) if v not in visited]
+            fresh.reverse()
+        else:
+            nbrs = sorted(graph.neighbors(u), key=lambda x: str(x[0]), reverse=True)
+            fresh = [v for v, _w in nbrs if v not in visited]
+        for v in fresh:
+            stack.append(v)
+            if tracer is not None:
+                tracer("PUSH", v, u)
 
-    return order, steps
+    return order
 
 
-def dijkstra_shortest_path(graph: GraphLike, start: Any, goal: Any) -> Tuple[List[Any], float, List[str]]:
-    
-    steps: List[str] = []
-    dist: Dict[Any, float] = {v: float("inf") for v in graph.vertices()}
-    prev: Dict[Any, Optional[Any]] = {v: None for v in graph.vertices()}
+def _dijkstra(
+    graph: GraphLike, source: Any, targets: Optional[Set[Any]], tracer: Optional[Tracer]
+) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]], Set[Any]]:
+    """
+    Heap-based Dijkstra core. Only reached vertices get dist/prev entries.
+    Stops once every vertex in targets is settled (targets=None: run to
+    exhaustion). Returns (dist, prev, settled); dist is final for settled
+    vertices and tentative for the rest.
+    """
+    dist: Dict[Any, float] = {source: 0.0}
+    prev: Dict[Any, Optional[Any]] = {source: None}
+    pq: List[Tuple[float, Any]] = [(0.0, source)]
+    if tracer is not None:
+        tracer("INIT", source)
 
-    dist[start] = 0.0
-    pq: List[Tuple[float, Any]] = [(0.0, start)]
-    steps.append(f"INIT dist[{start}]=0, push({start})")
-
-    visited = set()
+    remaining = set(targets) if targets is not None else None
+    visited: Set[Any] = set()
+    neighbors = _neighbor_fn(graph)
 
     while pq:
         cur_dist, u = heapq.heappop(pq)
-        steps.append(f"POP ({u}, dist={cur_dist})")
+        if tracer is not None:
+            tracer("POP", u, cur_dist)
 
         if u in visited:
-            steps.append(f"SKIP {u} (already finalized)")
+            if tracer is not None:
+                tracer("SKIP", u, "already finalized")
             continue
         visited.add(u)
 
-        if u == goal:
-            steps.append(f"REACHED goal {goal}")
-            break
+        if remaining is not None and u in remaining:
+            remaining.discard(u)
+            if tracer is not None:
+                tracer("REACHED", u)
+            if not remaining:
+                break
 
-        for v, w in graph.neighbors(u):
+        for v, w in neighbors(u):
             if w < 0:
                 raise ValueError("Negative edge weight found; Dijkstra not valid.")
             if v in visited:
@@ -107,19 +268,228 @@ def dijkstra_shortest_path(graph: GraphLike, start: Any, goal: Any) -> Tuple[Lis
                 dist[v] = alt
                 prev[v] = u
                 heapq.heappush(pq, (alt, v))
-                steps.append(f"RELAX {u}->{v} w={w}: dist[{v}]={alt}, prev[{v}]={u}")
+                if tracer is not None:
+                    tracer("RELAX", u, v, w, alt)
+
+    return dist, prev, visited
 
-    # Reconstruct path
-    if dist.get(goal, float("inf")) == float("inf"):
-        steps.append("NO PATH found")
-        return [], float("inf"), steps
 
+def reconstruct_path(prev: Dict[Any, Optional[Any]], target: Any) -> List[Any]:
+    """
+    Walk predecessor pointers back from target. Paths are only built when
+    asked for, so one search can serve many targets cheaply. Returns [] when
+    target was not reached.
+    """
+    if target not in prev:
+        return []
     path: List[Any] = []
-    cur: Optional[Any] = goal
+    cur: Optional[Any] = target
     while cur is not None:
         path.append(cur)
         cur = prev[cur]
     path.reverse()
+    return path
+
+
+def dijkstra_all(
+    graph: GraphLike, source: Any, tracer: Optional[Tracer] = None
+) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    """
+    Single-source shortest paths to every reachable vertex in one run.
+    Returns (dist, prev); unreachable vertices are absent from both.
+    Dense GraphMatrix graphs go to matrix_dijkstra_all and CSRGraph to
+    csr_dijkstra_all (untraced runs only).
+    """
+    if tracer is None and isinstance(graph, CSRGraph):
+        return csr_dijkstra_all(graph, source)
+    if _use_matrix_dijkstra(graph, source, tracer):
+        return matrix_dijkstra_all(graph, source)
+    dist, prev, _ = _dijkstra(graph, source, None, tracer)
+    return dist, prev
+
+
+def dijkstra_multi_target(
+    graph: GraphLike, source: Any, targets: Iterable[Any], tracer: Optional[Tracer] = None
+) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    """
+    Like dijkstra_all but stops as soon as every target is settled.
+    dist and prev hold only settled vertices, so a target missing from
+    them is unreachable and reconstruct_path never follows a tentative
+    predecessor. No targets means nothing to search for: ({}, {}) without
+    a search.
+    """
+    targets = set(targets)
+    if not targets:
+        return {}, {}
+    dist, prev, settled = _dijkstra(graph, source, targets, tracer)
+    return {v: dist[v] for v in settled}, {v: prev[v] for v in settled}
+
 
-    steps.append(f"PATH={path}, COST={dist[goal]}")
-    return path, dist[goal], steps
+def dijkstra_shortest_path(
+    graph: GraphLike, start: Any, goal: Any, tracer: Optional[Tracer] = None,
+    steps: Optional[bool] = None,
+) -> Union[Tuple[List[Any], float], Tuple[List[Any], float, List[str]]]:
+    """
+    Cheapest start -> goal path and its cost; ([], inf) if unreachable.
+    steps=True appends the steps list, as the old return value did.
+    Untraced runs on dense GraphMatrix graphs go to matrix_dijkstra and on
+    CSRGraph to csr_dijkstra.
+    """
+    log = _step_log("dijkstra_shortest_path", steps, tracer)
+    if log is not None:
+        path, cost = dijkstra_shortest_path(graph, start, goal, _tee(log, tracer), steps=False)
+        return path, cost, log.lines()
+    if tracer is None and isinstance(graph, CSRGraph):
+        return csr_dijkstra(graph, start, goal)
+    if _use_matrix_dijkstra(graph, start, tracer):
+        return matrix_dijkstra(graph, start, goal)
+
+    dist, prev, settled = _dijkstra(graph, start, {goal}, tracer)
+
+    if goal not in settled:
+        if tracer is not None:
+            tracer("NO_PATH")
+        return [], float("inf")
+
+    path = reconstruct_path(prev, goal)
+    if tracer is not None:
+        tracer("PATH", path, dist[goal])
+    return path, dist[goal]
+
+
+def astar_shortest_path(
+    graph: GraphLike, start: Any, goal: Any, heuristic: Heuristic, tracer: Optional[Tracer] = None
+) -> Tuple[List[Any], float]:
+    """
+    A* search. With an admissible, consistent heuristic it returns the same
+    (path, cost) as dijkstra_shortest_path while settling fewer vertices.
+    The zero heuristic reduces it to Dijkstra.
+    """
+    g_score: Dict[Any, float] = {start: 0.0}
+    prev: Dict[Any, Optional[Any]] = {start: None}
+    pq: List[Tuple[float, float, Any]] = [(heuristic(start, goal), 0.0, start)]
+    if tracer is not None:
+        tracer("INIT", start)
+
+    visited: Set[Any] = set()
+    neighbors = _neighbor_fn(graph)
+
+    while pq:
+        _f, cur_dist, u = heapq.heappop(pq)
+        if tracer is not None:
+            tracer("POP", u, cur_dist)
+
+        if u in visited:
+            if tracer is not None:
+                tracer("SKIP", u, "already finalized")
+            continue
+        visited.add(u)
+
+        if u == goal:
+            if tracer is not None:
+                tracer("REACHED", goal)
+            path = reconstruct_path(prev, goal)
+            if tracer is not None:
+                tracer("PATH", path, cur_dist)
+            return path, cur_dist
+
+        for v, w in neighbors(u):
+            if w < 0:
+                raise ValueError("Negative edge weight found; A* not valid.")
+            if v in visited:
+                continue
+            alt = cur_dist + w
+            if alt < g_score.get(v, float("inf")):
+                g_score[v] = alt
+                prev[v] = u
+                heapq.heappush(pq, (alt + heuristic(v, goal), alt, v))
+                if tracer is not None:
+                    tracer("RELAX", u, v, w, alt)
+
+    if tracer is not None:
+        tracer("NO_PATH")
+    return [], float("inf")
+
+
+def reverse_adjacency(graph: GraphLike) -> Dict[Any, List[Tuple[Any, float]]]:
+    """v -> [(u, w)] for every edge u -> v. O(V + E); build once and reuse across queries."""
+    radj: Dict[Any, List[Tuple[Any, float]]] = {v: [] for v in graph.vertices()}
+    neighbors = _neighbor_fn(graph)
+    for u in graph.vertices():
+        for v, w in neighbors(u):
+            radj.setdefault(v, []).append((u, w))
+    return radj
+
+
+def bidirectional_dijkstra(
+    graph: GraphLike,
+    start: Any,
+    goal: Any,
+    reverse: Optional[Dict[Any, List[Tuple[Any, float]]]] = None,
+) -> Tuple[List[Any], float]:
+    """
+    Point-to-point Dijkstra run from both ends at once.
+
+    The backward search walks reverse edges: on undirected graphs that is
+    just neighbors(); on directed graphs it uses graph.predecessors() when
+    available, else a prebuilt reverse_adjacency() or one built here. A
+    graph without a directed attribute is treated as directed, which is
+    correct either way. best is the shortest start->goal length seen
+    through any relaxed edge; the search stops once top(forward) +
+    top(backward) >= best, when no unexplored path can be shorter.
+    """
+    if start == goal:
+        return [start], 0.0
+
+    forward_neighbors = _neighbor_fn(graph)
+    if not getattr(graph, "directed", True):
+        backward_neighbors = forward_neighbors
+    elif reverse is None and hasattr(graph, "predecessors"):
+        backward_neighbors = graph.predecessors
+    else:
+        radj = reverse if reverse is not None else reverse_adjacency(graph)
+        backward_neighbors = lambda v: radj.get(v, [])
+
+    inf = float("inf")
+    dist = ({start: 0.0}, {goal: 0.0})
+    prev: Tuple[Dict[Any, Optional[Any]], Dict[Any, Optional[Any]]] = ({start: None}, {goal: None})
+    pqs: Tuple[List[Tuple[float, Any]], List[Tuple[float, Any]]] = ([(0.0, start)], [(0.0, goal)])
+    settled: Tuple[Set[Any], Set[Any]] = (set(), set())
+    expand = (forward_neighbors, backward_neighbors)
+
+    best = inf
+    meet: Optional[Any] = None
+
+    while pqs[0] and pqs[1]:
+        if pqs[0][0][0] + pqs[1][0][0] >= best:
+            break
+        side = 0 if pqs[0][0][0] <= pqs[1][0][0] else 1
+        other = 1 - side
+
+        cur_dist, u = heapq.heappop(pqs[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+
+        my_dist, other_dist = dist[side], dist[other]
+        for v, w in expand[side](u):
+            if w < 0:
+                raise ValueError("Negative edge weight found; Dijkstra not valid.")
+            alt = cur_dist + w
+            if alt < my_dist.get(v, inf):
+                my_dist[v] = alt
+                prev[side][v] = u
+                heapq.heappush(pqs[side], (alt, v))
+            if v in other_dist and my_dist[v] + other_dist[v] < best:
+                best = my_dist[v] + other_dist[v]
+                meet = v
+
+    if meet is None:
+        return [], inf
+
+    path = reconstruct_path(prev[0], meet)
+    cur = prev[1][meet]
+    while cur is not None:
+        path.append(cur)
+        cur = prev[1][cur]
+    return path, best
@@ -0,0 +1,238 @@
+"""
+Graph Benchmark Matrix
+======================
+
+Runs BFS, DFS and Dijkstra over every graph representation for a grid of
+generators, sizes and average degrees, and emits one structured row per
+cell. Pass an output prefix to also write <prefix>.csv, <prefix>.json and,
+when matplotlib is installed, one scaling plot per algorithm
+(<prefix>_<algorithm>.png):
+
+    python graph_benchmark.py results/graphs
+
+- generators: Erdős–Rényi G(n, p), 2D grid, Barabási–Albert, random geometric
+- representations: GraphList, GraphMatrix, CSRGraph
+- algorithms: bfs_tree, dfs, dijkstra_all (the csr_* versions on CSRGraph)
+
+Also home to the timing and memory helpers the per-feature benchmark
+modules (search_benchmark.py, io_benchmark.py, ...) share.
+"""
+
+import csv
+import json
+import math
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from connectivity import connected_components
+from graph_algorithms import bfs_tree, dfs, dijkstra_all
+from graph_csr import CSRGraph, csr_bfs, csr_dfs, csr_dijkstra_all
+from graph_generators import barabasi_albert_graph, erdos_renyi_graph, grid_graph, random_geometric_graph
+from graph_list import GraphList
+from graph_matrix import GraphMatrix
+
+try:
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+except ImportError:
+    plt = None
+
+ALGORITHMS = ("bfs", "dfs", "dijkstra")
+
+
+def banner(title: str) -> None:
+    print(f"\n=== {title} ===")
+
+
+def timed(fn: Callable[[], Any]) -> Tuple[float, Any]:
+    """(seconds, result) of one call to fn."""
+    start = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - start, out
+
+
+def best_of(fn: Callable[[], Any], repeat: int = 3) -> float:
+    """Fastest of repeat calls to fn, in seconds."""
+    return min(timed(fn)[0] for _ in range(repeat))
+
+
+def traced_memory(fn: Callable[[], Any]) -> Tuple[int, int, Any]:
+    """(bytes still allocated, peak bytes, result) of one call to fn under tracemalloc."""
+    tracemalloc.start()
+    try:
+        out = fn()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current, peak, out
+
+
+@dataclass
+class GeneratorSpec:
+    name: str
+    make: Callable[[int, float, int], GraphList]  # (n, average degree, seed) -> graph
+    fixed_degree: bool = False                     # ignores the degree axis; run once per size
+
+
+@dataclass
+class Representation:
+    name: str
+    convert: Callable[[GraphList], Any]
+    run: Dict[str, Callable[[Any, Any], Any]]      # algorithm -> fn(graph, source)
+    max_vertices: Optional[int] = None             # skip sizes where memory makes the cell useless
+
+
+def to_matrix(g: GraphList) -> GraphMatrix:
+    """A GraphMatrix copy of g with the same vertex order."""
+    vertices = g.vertices()
+    gm = GraphMatrix(directed=g.directed, capacity=len(vertices))
+    for v in vertices:
+        gm.add_vertex(v)
+    gm.add_edges((u, v, w) for u in vertices for v, w in g.iter_neighbors(u))
+    return gm
+
+
+def default_generators() -> List[GeneratorSpec]:
+    return [
+        GeneratorSpec("erdos_renyi", lambda n, d, seed: erdos_renyi_graph(n, min(1.0, d / (n - 1)), seed)),
+        GeneratorSpec("grid", lambda n, d, seed: grid_graph(math.isqrt(n), math.isqrt(n), seed=seed)[0],
+                      fixed_degree=True),
+        GeneratorSpec("barabasi_albert", lambda n, d, seed: barabasi_albert_graph(n, max(1, round(d / 2)), seed)),
+        GeneratorSpec("geometric",
+                      lambda n, d, seed: random_geometric_graph(n, math.sqrt(d / (math.pi * n)), seed)[0]),
+    ]
+
+
+def default_representations() -> List[Representation]:
+    generic = {"bfs": bfs_tree, "dfs": lambda g, s: dfs(g, s, steps=False), "dijkstra": dijkstra_all}
+    return [
+        Representation("GraphList", lambda g: g, generic),
+        # 8 bytes per matrix cell: 4,000 vertices is already 128 MB
+        Representation("GraphMatrix", to_matrix, generic, max_vertices=4000),
+        Representation("CSRGraph", CSRGraph.from_graph,
+                       {"bfs": csr_bfs, "dfs": csr_dfs, "dijkstra": csr_dijkstra_all}),
+    ]
+
+
+def run_matrix(
+    sizes: Sequence[int] = (1000, 4000, 16000),
+    degrees: Sequence[float] = (4, 16),
+    generators: Optional[List[GeneratorSpec]] = None,
+    representations: Optional[List[Representation]] = None,
+    repeat: int = 3,
+    seed: int = 42,
+) -> List[Dict]:
+    """Run every (generator, size, degree, representation, algorithm) cell; best of repeat runs."""
+    generators = generators or default_generators()
+    representations = representations or default_representations()
+    rows: List[Dict] = []
+    for spec in generators:
+        for n in sizes:
+            for degree in (degrees[:1] if spec.fixed_degree else degrees):
+                g = spec.make(n, degree, seed)
+                vertices = g.vertices()
+                v_count = len(vertices)
+                arcs = sum(1 for u in vertices for _ in g.iter_neighbors(u))
+                edges = arcs if g.directed else arcs // 2
+                # Start inside the largest component so sparse graphs still do real work
+                component = max(connected_components(g), key=len)
+                source = component[0]
+                for rep in representations:
+                    if rep.max_vertices is not None and v_count > rep.max_vertices:
+                        continue
+                    convert_s, graph = timed(lambda: rep.convert(g))
+                    for algorithm in ALGORITHMS:
+                        fn = rep.run[algorithm]
+                        best = best_of(lambda: fn(graph, source), repeat)
+                        rows.append({
+                            "generator": spec.name,
+                            "representation": rep.name,
+                            "algorithm": algorithm,
+                            "vertices": v_count,
+                            "edges": edges,
+                            "target_degree": degree,
+                            "reached": len(component),
+                            "avg_degree": 2 * edges / v_count if v_count else 0.0,
+                            "density": 2 * edges / (v_count * (v_count - 1)) if v_count > 1 else 0.0,
+                            "seed": seed,
+                            "convert_s": convert_s,
+                            "seconds": best,
+                        })
+                    del graph
+    return rows
+
+
+def write_csv(rows: List[Dict], path: str) -> None:
+    if not rows:
+        return
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_json(rows: List[Dict], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(rows, f, indent=2)
+
+
+def plot_scaling(rows: List[Dict], prefix: str) -> List[str]:
+    """
+    One figure per algorithm with a log-log seconds-vs-vertices panel per
+    target degree, a line per (representation, generator). Needs matplotlib.
+    """
+    if plt is None:
+        raise RuntimeError("matplotlib is not installed")
+    degrees = sorted({row["target_degree"] for row in rows})
+    paths: List[str] = []
+    for algorithm in ALGORITHMS:
+        fig, axes = plt.subplots(1, len(degrees), figsize=(6 * len(degrees), 5), squeeze=False)
+        for ax, degree in zip(axes[0], degrees):
+            series: Dict[tuple, List[Dict]] = {}
+            for row in rows:
+                if row["algorithm"] == algorithm and row["target_degree"] == degree:
+                    series.setdefault((row["representation"], row["generator"]), []).append(row)
+            for (rep, gen), points in sorted(series.items()):
+                points.sort(key=lambda r: r["vertices"])
+                ax.plot([r["vertices"] for r in points], [r["seconds"] for r in points], marker="o",
+                        label=f"{rep} / {gen}")
+            ax.set_xscale("log")
+            ax.set_yscale("log")
+            ax.set_xlabel("Vertices")
+            ax.set_ylabel("Seconds (best of runs)")
+            ax.set_title(f"{algorithm}, average degree ~{degree:g}")
+            ax.grid(True, which="both", alpha=0.3)
+            ax.legend(fontsize="x-small")
+        fig.tight_layout()
+        path = f"{prefix}_{algorithm}.png"
+        fig.savefig(path)
+        plt.close(fig)
+        paths.append(path)
+    return paths
+
+
+def main() -> None:
+    rows = run_matrix()
+    print(f"{'generator':>16} {'repr':>12} {'alg':>9} {'V':>7} {'E':>8} {'deg':>6} {'reached':>8} {'ms':>10}")
+    for r in rows:
+        print(f"{r['generator']:>16} {r['representation']:>12} {r['algorithm']:>9} {r['vertices']:>7} "
+              f"{r['edges']:>8} {r['avg_degree']:6.1f} {r['reached']:>8} {r['seconds'] * 1e3:10.3f}")
+
+    if len(sys.argv) > 1:
+        prefix = sys.argv[1]
+        write_csv(rows, prefix + ".csv")
+        write_json(rows, prefix + ".json")
+        print(f"\nRows written to {prefix}.csv and {prefix}.json")
+        if plt is None:
+            print("matplotlib not installed; skipping plots")
+        else:
+            for path in plot_scaling(rows, prefix):
+                print(f"Plot written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+from __future__ import annotations
+from array import array
+from collections import deque
+from functools import cached_property
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+import heapq
+
+
+class CSRGraph:
+    """
+    Frozen compressed-sparse-row graph.
+
+    Vertex labels are interned to 0..V-1. The out-edges of vertex i are
+    targets[offsets[i]:offsets[i + 1]] with matching weights, all held in
+    flat `array` buffers (4 + 8 bytes per stored arc plus 8 per vertex).
+    Undirected graphs store each edge in both directions, like GraphList.
+    Implements GraphLike; the int-indexed methods are the fast paths.
+    """
+
+    def __init__(self, labels: Sequence[Any], offsets: Sequence[int], targets: Sequence[int],
+                 weights: Sequence[float], directed: bool = False,
+                 neighbors_sorted: bool = False) -> None:
+        if len(offsets) != len(labels) + 1:
+            raise ValueError("offsets must have len(labels) + 1 entries")
+        if len(targets) != len(weights):
+            raise ValueError("targets and weights must have the same length")
+        self.directed = directed
+        self.neighbors_sorted = neighbors_sorted
+        self.version = 0  # frozen: never changes
+        # Any indexable sequence is kept as-is (graph_io passes a lazily decoded label table)
+        self._labels: Sequence[Any] = labels if hasattr(labels, "__getitem__") else list(labels)
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_graph(cls, graph: Any, sort_neighbors: bool = True) -> "CSRGraph":
+        """
+        Freeze any GraphLike. With sort_neighbors, each adjacency run is
+        ordered by str(label) once here, which is the order bfs/dfs would
+        otherwise sort into on every visit.
+        """
+        labels = graph.vertices()
+        index = {v: i for i, v in enumerate(labels)}
+        offsets = [0]
+        targets: List[int] = []
+        weights: List[float] = []
+        neighbors = getattr(graph, "iter_neighbors", graph.neighbors)
+        for u in labels:
+            nbrs = neighbors(u)
+            if sort_neighbors:
+                nbrs = sorted(nbrs, key=lambda x: str(x[0]))
+            else:
+                nbrs = list(nbrs)
+            if nbrs:
+                # Column-wise list extends keep the per-edge work in C
+                vs, ws = zip(*nbrs)
+                targets.extend(map(index.__getitem__, vs))
+                weights.extend(ws)
+            offsets.append(len(targets))
+        return cls(labels, array("q", offsets), array("i", targets), array("d", weights),
+                   directed=getattr(graph, "directed", False), neighbors_sorted=sort_neighbors)
+
+
+    @cached_property
+    def _index(self) -> Dict[Any, int]:
+        """label -> id, built on first label lookup (the int fast paths never need it)."""
+        return {v: i for i, v in enumerate(self._labels)}
+
+    # GraphLike API (labels)
+    def vertices(self) -> List[Any]:
+        return list(self._labels)
+
+    def has_vertex(self, v: Any) -> bool:
+        return v in self._index
+
+    def neighbors(self, u: Any) -> List[Tuple[Any, float]]:
+        i = self._index.get(u)
+        if i is None:
+            return []
+        labels, targets, weights = self._labels, self.targets, self.weights
+        return [(labels[targets[k]], weights[k]) for k in range(self.offsets[i], self.offsets[i + 1])]
+
+    def iter_neighbors(self, u: Any) -> Iterator[Tuple[Any, float]]:
+        i = self._index.get(u)
+        if i is None:
+            return
+        labels, targets, weights = self._labels, self.targets, self.weights
+        for k in range(self.offsets[i], self.offsets[i + 1]):
+            yield labels[targets[k]], weights[k]
+
+
+    # Integer fast paths
+    @property
+    def num_vertices(self) -> int:
+        return len(self._labels)
+
+    @property
+    def num_arcs(self) -> int:
+        """Stored adjacency entries (an undirected edge counts twice)."""
+        return len(self.targets)
+
+    def index_of(self, label: Any) -> int:
+        return self._index[label]
+
+    def label_of(self, i: int) -> Any:
+        return self._labels[i]
+
+    def neighbor_range(self, i: int) -> range:
+        """Positions into targets/weights holding vertex i's out-edges."""
+        return range(self.offsets[i], self.offsets[i + 1])
+
+    def degree(self, i: int) -> int:
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def nbytes(self) -> int:
+        """Bytes held by the offset/target/weight buffers."""
+        return sum(len(buf) * buf.itemsize for buf in (self.offsets, self.targets, self.weights))
+
+
+def csr_bfs(
+    csr: CSRGraph, start: Any, target: Any = None
+) -> Tuple[List[Any], Dict[Any, Optional[Any]], Dict[Any, int]]:
+    """bfs_tree over a CSRGraph: same (order, parent, dist) contract, int arrays inside."""
+    if not csr.has_vertex(start):
+        return [start], {start: None}, {start: 0}
+    n = csr.num_vertices
+    offsets, targets = csr.offsets, csr.targets
+    s = csr.index_of(start)
+    t = csr._index.get(target, -1) if target is not None else -1
+    parent = array("i", [-1]) * n
+    dist = array("i", [-1]) * n
+    dist[s] = 0
+    order = [s]
+    queue: Deque[int] = deque([s])
+
+    while queue and s != t:
+        u = queue.popleft()
+        d = dist[u] + 1
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            if dist[v] >= 0:
+                continue
+            dist[v] = d
+            parent[v] = u
+            order.append(v)
+            if v == t:
+                queue.clear()
+                break
+            queue.append(v)
+
+    labels = csr._labels
+    return (
+        [labels[i] for i in order],
+        {labels[i]: (labels[parent[i]] if parent[i] >= 0 else None) for i in order},
+        {labels[i]: dist[i] for i in order},
+    )
+
+
+def csr_dfs(csr: CSRGraph, start: Any) -> List[Any]:
+    """dfs over a CSRGraph; with sorted adjacency the visit order matches dfs()."""
+    if not csr.has_vertex(start):
+        return [start]
+    offsets, targets = csr.offsets, csr.targets
+    visited = bytearray(csr.num_vertices)
+    order: List[int] = []
+    stack = [csr.index_of(start)]
+    while stack:
+        u = stack.pop()
+        if visited[u]:
+            continue
+        visited[u] = 1
+        order.append(u)
+        # Reverse so the first neighbor is popped first
+        for k in range(offsets[u + 1] - 1, offsets[u] - 1, -1):
+            v = targets[k]
+            if not visited[v]:
+                stack.append(v)
+    labels = csr._labels
+    return [labels[i] for i in order]
+
+
+def _csr_dijkstra(csr: CSRGraph, s: int, t: int) -> Tuple[array, array]:
+    inf = float("inf")
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    n = csr.num_vertices
+    dist = array("d", [inf]) * n
+    parent = array("i", [-1]) * n
+    done = bytearray(n)
+    dist[s] = 0.0
+    pq: List[Tuple[float, int]] = [(0.0, s)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        if done[u]:
+            continue
+        done[u] = 1
+        if u == t:
+            break
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            alt = d + weights[k]
+            if alt < dist[v]:
+                dist[v] = alt
+                parent[v] = u
+                heapq.heappush(pq, (alt, v))
+    return dist, parent
+
+
+def csr_dijkstra_all(csr: CSRGraph, source: Any) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    """dijkstra_all over a CSRGraph. Weights were validated when the source graph was built."""
+    if not csr.has_vertex(source):
+        return {source: 0.0}, {source: None}
+    dist, parent = _csr_dijkstra(csr, csr.index_of(source), -1)
+    labels = csr._labels
+    inf = float("inf")
+    reached = [i for i in range(csr.num_vertices) if dist[i] < inf]
+    return (
+        {labels[i]: dist[i] for i in reached},
+        {labels[i]: (labels[parent[i]] if parent[i] >= 0 else None) for i in reached},
+    )
+
+
+def csr_dijkstra(csr: CSRGraph, start: Any, goal: Any) -> Tuple[List[Any], float]:
+    """dijkstra_shortest_path over a CSRGraph; start == goal is ([start], 0.0) even off the graph, as there."""
+    if start == goal:
+        return [start], 0.0
+    if not csr.has_vertex(start) or not csr.has_vertex(goal):
+        return [], float("inf")
+    t = csr.index_of(goal)
+    dist, parent = _csr_dijkstra(csr, csr.index_of(start), t)
+    if dist[t] == float("inf"):
+        return [], float("inf")
+    path: List[Any] = []
+    cur = t
+    while cur >= 0:
+        path.append(csr._labels[cur])
+        cur = parent[cur]
+    path.reverse()
+    return path, dist[t]
@@ -0,0 +1,170 @@
+from __future__ import annotations
+import math
+import random
+from typing import Any, Dict, Iterable, List, Tuple
+
+from graph_list import GraphList
+
+Edge = Tuple[Any, Any, float]
+Coords = Dict[Any, Tuple[float, float]]
+
+# Every generator is seeded, so the same arguments always give the same
+# graph. graph_cls picks the representation (GraphList by default,
+# GraphMatrix works too); extra keyword options go to its constructor.
+# Weights are floats in 1..100 unless the generator has a natural length.
+
+
+def _build(graph_cls: Any, vertices: Iterable[Any], edges: Iterable[Edge], directed: bool,
+           **options: Any) -> Any:
+    vertices = list(vertices)
+    g = graph_cls(directed=directed, **options)
+    if hasattr(g, "reserve"):
+        g.reserve(len(vertices))
+    for v in vertices:
+        g.add_vertex(v)
+    g.add_edges(edges)
+    return g
+
+
+def gnm_graph(n: int, m: int, seed: int = 42, directed: bool = False,
+              graph_cls: Any = GraphList, **options: Any) -> Any:
+    """
+    Erdős–Rényi G(n, m) style: vertices 0..n-1 and m uniformly random
+    edges. Self-loops are redrawn; a repeated pair keeps its last weight,
+    so the edge count can fall slightly short of m on dense graphs.
+    """
+    rng = random.Random(seed)
+    randrange, randint = rng.randrange, rng.randint
+
+    def edges() -> Iterable[Edge]:
+        added = 0
+        while added < m:
+            u, v = randrange(n), randrange(n)
+            if u == v:
+                continue
+            yield u, v, float(randint(1, 100))
+            added += 1
+
+    return _build(graph_cls, range(n), edges(), directed, **options)
+
+
+def erdos_renyi_graph(n: int, p: float, seed: int = 42, directed: bool = False,
+                      graph_cls: Any = GraphList, **options: Any) -> Any:
+    """
+    Erdős–Rényi G(n, p): each pair is an edge independently with
+    probability p. Skips ahead geometrically between edges (Batagelj and
+    Brandes), so the cost is O(n + m) rather than O(n^2).
+    """
+    if not 0.0 <= p <= 1.0:
+        raise ValueError("p must be between 0 and 1.")
+    rng = random.Random(seed)
+    pairs = n * (n - 1) if directed else n * (n - 1) // 2
+
+    def positions() -> Iterable[int]:
+        if p == 0.0:
+            return
+        if p == 1.0:
+            yield from range(pairs)
+            return
+        log_q = math.log(1.0 - p)
+        k = -1
+        while True:
+            k += 1 + int(math.log(1.0 - rng.random()) / log_q)
+            if k >= pairs:
+                return
+            yield k
+
+    def edges() -> Iterable[Edge]:
+        for k in positions():
+            if directed:
+                u, j = divmod(k, n - 1)
+                v = j + (j >= u)  # skip the diagonal
+            else:
+                # k-th pair (u, v) with v < u in row-major lower-triangle order
+                u = (1 + math.isqrt(1 + 8 * k)) // 2
+                if u * (u - 1) // 2 > k:
+                    u -= 1
+                v = k - u * (u - 1) // 2
+            yield u, v, float(rng.randint(1, 100))
+
+    return _build(graph_cls, range(n), edges(), directed, **options)
+
+
+def grid_graph(rows: int, cols: int, jitter: float = 0.0, seed: int = 42,
+               graph_cls: Any = GraphList, **options: Any) -> Tuple[Any, Coords]:
+    """
+    rows x cols 4-neighbor grid, vertices (r, c). Each point sits at
+    (c, r) moved by up to jitter in x and y; an edge weighs its Euclidean
+    length, so the coordinates make an admissible A* heuristic. Returns
+    (graph, coords).
+    """
+    rng = random.Random(seed)
+    coords: Coords = {(r, c): (c + rng.uniform(-jitter, jitter), r + rng.uniform(-jitter, jitter))
+                      for r in range(rows) for c in range(cols)}
+
+    def edges() -> Iterable[Edge]:
+        for (r, c), (x, y) in coords.items():
+            for nb in ((r + 1, c), (r, c + 1)):
+                if nb in coords:
+                    nx, ny = coords[nb]
+                    yield (r, c), nb, math.hypot(x - nx, y - ny)
+
+    return _build(graph_cls, coords, edges(), False, **options), coords
+
+
+def barabasi_albert_graph(n: int, k: int, seed: int = 42,
+                          graph_cls: Any = GraphList, **options: Any) -> Any:
+    """
+    Barabási–Albert preferential attachment: each new vertex links to k
+    distinct existing vertices chosen with probability proportional to
+    degree, giving a power-law degree tail. Vertices 0..n-1, about
+    k * (n - k) undirected edges.
+    """
+    if not 1 <= k < n:
+        raise ValueError("k must be at least 1 and less than n.")
+    rng = random.Random(seed)
+
+    def edges() -> Iterable[Edge]:
+        repeated: List[int] = []  # each vertex once per unit of degree
+        targets = list(range(k))
+        for source in range(k, n):
+            for t in targets:
+                yield source, t, float(rng.randint(1, 100))
+            repeated.extend(targets)
+            repeated.extend([source] * k)
+            chosen = set()
+            while len(chosen) < k:
+                chosen.add(rng.choice(repeated))
+            targets = list(chosen)
+
+    return _build(graph_cls, range(n), edges(), False, **options)
+
+
+def random_geometric_graph(n: int, radius: float, seed: int = 42, directed: bool = False,
+                           graph_cls: Any = GraphList, **options: Any) -> Tuple[Any, Coords]:
+    """
+    n points in the unit square; an edge joins points closer than radius
+    and weighs their distance. Bucketing points into radius-sized cells
+    keeps it near O(n + m). directed=True stores both arcs of each edge.
+    Returns (graph, coords).
+    """
+    rng = random.Random(seed)
+    points = [(rng.random(), rng.random()) for _ in range(n)]
+    cells: Dict[Tuple[int, int], List[int]] = {}
+    for i, (x, y) in enumerate(points):
+        cells.setdefault((int(x / radius), int(y / radius)), []).append(i)
+
+    def edges() -> Iterable[Edge]:
+        for (cx, cy), members in cells.items():
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for j in cells.get((cx + dx, cy + dy), []):
+                        for i in members:
+                            if i < j:
+                                d = math.dist(points[i], points[j])
+                                if d < radius:
+                                    yield i, j, d
+                                    if directed:
+                                        yield j, i, d
+
+    return _build(graph_cls, range(n), edges(), directed, **options), dict(enumerate(points))
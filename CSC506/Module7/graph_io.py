@@ -0,0 +1,226 @@
+from __future__ import annotations
+import mmap
+import struct
+from array import array
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from graph_csr import CSRGraph
+from graph_list import GraphList
+from graph_loader import group_dicts
+from graph_matrix import GraphMatrix
+
+# File layout (little-endian, every array 8-byte aligned):
+#   header        magic, kind, flags, label encoding, V, arcs, label bytes
+#   label table   uint64 label_offsets[V + 1] + blob   (str: utf-8 blob)
+#                 or int64 labels[V]                   (int labels)
+#   adjacency     int64 offsets[V + 1] | int32 targets[arcs] | pad | float64 weights[arcs]
+# Adjacency is CSR in the graph's own neighbor order, so a reload reproduces
+# vertex and neighbor order exactly.
+_MAGIC = b"GRAPHIO1"
+_HEADER = struct.Struct("<8sBBBxxxxxQQQ")
+_KINDS = {"list": 0, "matrix": 1, "csr": 2}
+_KIND_NAMES = {code: name for name, code in _KINDS.items()}
+_DIRECTED = 1
+_SORTED = 2
+_LABELS_STR, _LABELS_INT = 0, 1
+
+
+def _pad8(n: int) -> int:
+    return -n % 8
+
+
+class LazyLabels(Sequence):
+    """
+    utf-8 label table decoded one entry at a time on first access, straight
+    from the mapped file. Iterating or building an index decodes everything.
+    """
+
+    def __init__(self, offsets: Any, blob: memoryview) -> None:
+        self._offsets = offsets
+        self._blob = blob
+        self._cache: List[Optional[str]] = [None] * (len(offsets) - 1)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __getitem__(self, i: Any) -> Any:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        label = self._cache[i]
+        if label is None:
+            label = self._cache[i] = str(self._blob[self._offsets[i]:self._offsets[i + 1]], "utf-8")
+        return label
+
+    def __iter__(self) -> Iterator[str]:
+        return (self[i] for i in range(len(self)))
+
+
+class MappedCSRGraph(CSRGraph):
+    """
+    CSRGraph returned by read_graph(kind="csr"): its buffers are views onto
+    the memory-mapped file. close() (or leaving a with block) unmaps the
+    file and leaves an empty graph; views still held elsewhere (e.g. an
+    np.frombuffer of offsets) make it raise BufferError.
+    """
+
+    def __init__(self, mm: mmap.mmap, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._mmap: Optional[mmap.mmap] = mm
+
+    def __enter__(self) -> "MappedCSRGraph":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._mmap is None:
+            return
+        self._labels = []
+        self.__dict__.pop("_index", None)
+        self.offsets, self.targets, self.weights = array("q", [0]), array("i"), array("d")
+        mm, self._mmap = self._mmap, None
+        mm.close()
+
+
+def _label_encoding(labels: List[Any]) -> int:
+    if all(type(v) is str for v in labels):
+        return _LABELS_STR
+    if all(type(v) is int for v in labels) and all(-(1 << 63) <= v < (1 << 63) for v in labels):
+        return _LABELS_INT
+    raise ValueError("write_graph stores str or int (64-bit) vertex labels only")
+
+
+def _adjacency(graph: Any) -> Tuple[List[Any], np.ndarray, np.ndarray, np.ndarray]:
+    """(labels, offsets, targets, weights) in the graph's own neighbor order."""
+    if isinstance(graph, CSRGraph):
+        return (list(graph._labels), np.asarray(graph.offsets, dtype=np.int64),
+                np.asarray(graph.targets, dtype=np.int32), np.asarray(graph.weights, dtype=np.float64))
+    if isinstance(graph, GraphMatrix):
+        labels = graph.vertices()
+        n = len(labels)
+        block = graph.weight_block()
+        rows, cols = np.nonzero(np.isfinite(block))  # row-major: already CSR order
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=offsets[1:])
+        return labels, offsets, cols.astype(np.int32), block[rows, cols]
+    csr = CSRGraph.from_graph(graph, sort_neighbors=False)
+    return (list(csr._labels), np.frombuffer(csr.offsets, dtype=np.int64),
+            np.frombuffer(csr.targets, dtype=np.int32), np.frombuffer(csr.weights, dtype=np.float64))
+
+
+def write_graph(graph: Any, path: str) -> int:
+    """
+    Save a GraphList, GraphMatrix or CSRGraph (left unchanged). Returns the
+    file size in bytes. Vertex labels must be all str or all int; anything
+    else raises ValueError.
+    """
+    kind = "matrix" if isinstance(graph, GraphMatrix) else "csr" if isinstance(graph, CSRGraph) else "list"
+    labels, offsets, targets, weights = _adjacency(graph)
+    flags = (_DIRECTED if getattr(graph, "directed", False) else 0) | \
+        (_SORTED if getattr(graph, "neighbors_sorted", False) else 0)
+
+    encoding = _label_encoding(labels)
+    if encoding == _LABELS_STR:
+        blobs = [v.encode("utf-8") for v in labels]
+        label_offsets = np.zeros(len(blobs) + 1, dtype="<u8")
+        np.cumsum([len(b) for b in blobs], out=label_offsets[1:])
+        table = label_offsets.tobytes() + b"".join(blobs)
+    else:
+        table = np.asarray(labels, dtype="<i8").tobytes()
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _KINDS[kind], flags, encoding, len(labels), len(targets), len(table)))
+        f.write(table + b"\0" * _pad8(len(table)))
+        f.write(np.asarray(offsets, dtype="<i8").tobytes())
+        f.write(np.asarray(targets, dtype="<i4").tobytes())
+        f.write(b"\0" * _pad8(4 * len(targets)))
+        f.write(np.asarray(weights, dtype="<f8").tobytes())
+        return f.tell()
+
+
+def read_graph(path: str, kind: Optional[str] = None, lazy_labels: bool = False) -> Any:
+    """
+    Load a file written by write_graph, as the kind it was saved from or
+    as kind ("list", "matrix" or "csr").
+
+    The file is memory-mapped. kind="csr" is near-zero-copy: it returns a
+    MappedCSRGraph whose offsets, targets and weights are typed
+    memoryviews onto the mapping, so pages are read on first touch; close
+    it (or use it in a with block) to unmap the file. With lazy_labels,
+    string labels are decoded one at a time as they are used (label_of,
+    path output) instead of all up front; a label -> id lookup still
+    decodes the whole table once. GraphList and GraphMatrix copy the
+    arrays into their own structures and the mapping is closed before
+    returning.
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, kind_code, flags, encoding, n, m, table_len = _HEADER.unpack_from(mm, 0)
+    error = None
+    if magic != _MAGIC:
+        error = f"{path} is not a saved graph file"
+    elif encoding not in (_LABELS_STR, _LABELS_INT):
+        error = f"{path} has an unsupported label encoding ({encoding})"
+    kind = kind or _KIND_NAMES.get(kind_code)
+    if error is None and kind not in _KINDS:
+        error = f"Unknown graph kind: {kind!r}"
+    if error is not None:
+        mm.close()
+        raise ValueError(error)
+    directed = bool(flags & _DIRECTED)
+    labels, offsets, targets, weights = _sections(mm, encoding, n, m, table_len, lazy_labels and kind == "csr")
+
+    if kind == "csr":
+        return MappedCSRGraph(mm, labels, offsets, targets, weights, directed=directed,
+                              neighbors_sorted=bool(flags & _SORTED))
+    graph = _unpack(kind, labels, offsets, targets, weights, directed, bool(flags & _SORTED))
+    del labels, offsets, targets, weights  # release the views so the mapping can close
+    mm.close()
+    return graph
+
+
+def _sections(mm: mmap.mmap, encoding: int, n: int, m: int, table_len: int,
+              lazy_labels: bool) -> Tuple[Sequence[Any], memoryview, memoryview, memoryview]:
+    """(labels, offsets, targets, weights); the last three are typed views onto mm."""
+    buf = memoryview(mm)
+    pos = _HEADER.size
+    table = buf[pos:pos + table_len]
+    if encoding == _LABELS_STR:
+        label_offsets = table[:8 * (n + 1)].cast("Q")
+        labels: Sequence[Any] = LazyLabels(label_offsets, table[8 * (n + 1):])
+        if not lazy_labels:
+            labels = list(labels)
+    else:
+        labels = np.frombuffer(table, dtype="<i8").tolist()
+    pos += table_len + _pad8(table_len)
+
+    offsets = buf[pos:pos + 8 * (n + 1)].cast("q")
+    pos += 8 * (n + 1)
+    targets = buf[pos:pos + 4 * m].cast("i")
+    pos += 4 * m + _pad8(4 * m)
+    weights = buf[pos:pos + 8 * m].cast("d")
+    return labels, offsets, targets, weights
+
+
+def _unpack(kind: str, labels: Sequence[Any], offsets: memoryview, targets: memoryview,
+            weights: memoryview, directed: bool, neighbors_sorted: bool) -> Any:
+    """Copy mapped CSR sections into a new GraphList or GraphMatrix."""
+    n = len(labels)
+    offsets_np = np.frombuffer(offsets, dtype=np.int64)
+    sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(offsets_np))
+    targets_np = np.frombuffer(targets, dtype=np.int32)
+    weights_np = np.frombuffer(weights, dtype=np.float64)
+    if kind == "matrix":
+        g = GraphMatrix(directed=directed, capacity=max(1, n))
+        for v in labels:
+            g.add_vertex(v)
+        slots = np.array([g.index_of(v) for v in labels], dtype=np.intp)
+        # Undirected files store both arcs, so add_edges_at's mirror write repeats the same weights
+        g.add_edges_at(slots[sources], slots[targets_np], weights_np)
+        return g
+    # Stored arcs are already symmetric for undirected graphs
+    adj = group_dicts(sources, targets_np, weights_np, labels)
+    return GraphList.from_adjacency(adj, directed=directed, sorted_neighbors=neighbors_sorted)
@@ -1,11 +1,48 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Set, Tuple
 
 
 class GraphList:
-    def __init__(self, directed: bool = False) -> None:
+    """
+    Adjacency-dict graph.
+
+    With sorted_neighbors=True each adjacency dict is kept in str(label)
+    order, the order bfs/dfs visit neighbors in. Vertices that gained a new
+    neighbor are re-sorted once on their next read rather than on every
+    visit, and neighbors_sorted tells the algorithms they can skip sorting.
+
+    version is bumped by every mutation so caches can tell stale results.
+    """
+
+    def __init__(self, directed: bool = False, sorted_neighbors: bool = False) -> None:
         self.directed = directed
+        self.neighbors_sorted = sorted_neighbors
+        self.version = 0
         self._adj: Dict[Any, Dict[Any, float]] = {}  # u -> {v: weight}
+        # v -> {u: weight} for directed graphs; undirected _adj is already symmetric
+        self._radj: Dict[Any, Dict[Any, float]] = {}
+        self._dirty: Set[Any] = set()  # vertices whose adjacency needs re-sorting
+
+    @classmethod
+    def from_adjacency(cls, adj: Dict[Any, Dict[Any, float]], directed: bool = False,
+                       sorted_neighbors: bool = False) -> "GraphList":
+        """
+        Adopt prebuilt u -> {v: weight} dicts (not copied). Undirected input
+        must already be symmetric and every neighbor must be a key of adj;
+        weights must be non-negative. The bulk loader uses this to skip
+        per-edge add_edge calls.
+        """
+        g = cls(directed=directed, sorted_neighbors=sorted_neighbors)
+        g._adj = adj
+        if directed:
+            radj: Dict[Any, Dict[Any, float]] = {v: {} for v in adj}
+            for u, nbrs in adj.items():
+                for v, w in nbrs.items():
+                    radj[v][u] = w
+            g._radj = radj
+        if sorted_neighbors:
+            g._dirty = set(adj)
+        return g
 
     def vertices(self) -> List[Any]:
         return list(self._adj.keys())
@@ -16,15 +53,29 @@ class GraphList:
     def add_vertex(self, v: Any) -> None:
         if v not in self._adj:
             self._adj[v] = {}
+            if self.directed:
+                self._radj[v] = {}
+            self.version += 1
 
     def remove_vertex(self, v: Any) -> bool:
+        """Remove v and its edges in O(degree) using the reverse index."""
         if v not in self._adj:
             return False
         # Remove outgoing
-        self._adj.pop(v)
-        # Remove incoming references
-        for u in self._adj:
-            self._adj[u].pop(v, None)
+        out = self._adj.pop(v)
+        self._dirty.discard(v)
+        if self.directed:
+            for w in out:
+                self._radj[w].pop(v, None)
+            # Remove incoming references
+            for u in self._radj.pop(v):
+                if u != v:
+                    self._adj[u].pop(v, None)
+        else:
+            for u in out:
+                if u != v:
+                    self._adj[u].pop(v, None)
+        self.version += 1
         return True
 
     def add_edge(self, u: Any, v: Any, weight: float = 1.0) -> None:
@@ -32,25 +83,105 @@ class GraphList:
             raise ValueError("Dijkstra requires non-negative weights.")
         self.add_vertex(u)
         self.add_vertex(v)
+        if self.neighbors_sorted:
+            # Deleting keeps dict order, so only new keys can break it
+            if v not in self._adj[u]:
+                self._dirty.add(u)
+            if not self.directed and u not in self._adj[v]:
+                self._dirty.add(v)
         self._adj[u][v] = float(weight)
-        if not self.directed:
+        if self.directed:
+            self._radj[v][u] = float(weight)
+        else:
             self._adj[v][u] = float(weight)
+        self.version += 1
+
+    def add_edges(self, edges: Iterable[Tuple[Any, Any, float]]) -> int:
+        """
+        Bulk add_edge: same result as calling add_edge per (u, v, w), but
+        with the adjacency lookups inlined and one version bump for the
+        batch. Weights are stored as given, so pass floats. A negative
+        weight raises ValueError and keeps the edges before it. Returns
+        the number of edges read.
+        """
+        adj, radj, directed = self._adj, self._radj, self.directed
+        dirty = self._dirty if self.neighbors_sorted else None
+        count = 0
+        for u, v, w in edges:
+            if w < 0:
+                raise ValueError("Dijkstra requires non-negative weights.")
+            au = adj.get(u)
+            if au is None:
+                au = adj[u] = {}
+                if directed:
+                    radj[u] = {}
+            av = adj.get(v)
+            if av is None:
+                av = adj[v] = {}
+                if directed:
+                    radj[v] = {}
+            if dirty is not None:
+                dirty.add(u)
+                if not directed:
+                    dirty.add(v)
+            au[v] = w
+            if directed:
+                radj[v][u] = w
+            else:
+                av[u] = w
+            count += 1
+        if count:
+            self.version += 1
+        return count
 
     def remove_edge(self, u: Any, v: Any) -> bool:
         if u not in self._adj or v not in self._adj:
             return False
         existed = v in self._adj[u]
         self._adj[u].pop(v, None)
-        if not self.directed:
+        if self.directed:
+            self._radj[v].pop(u, None)
+        else:
             self._adj[v].pop(u, None)
+        if existed:
+            self.version += 1
         return existed
 
     def neighbors(self, u: Any) -> List[Tuple[Any, float]]:
         if u not in self._adj:
             return []
-        items = [(v, w) for v, w in self._adj[u].items()]
+        items = [(v, w) for v, w in self.iter_neighbors(u)]
         return items
 
+    def iter_neighbors(self, u: Any) -> Iterable[Tuple[Any, float]]:
+        """Live (v, weight) view of u's adjacency; no copy. Do not mutate the graph while iterating."""
+        adj = self._adj.get(u)
+        if adj is None:
+            return ()
+        if u in self._dirty:
+            self._dirty.discard(u)
+            adj = self._adj[u] = dict(sorted(adj.items(), key=lambda x: str(x[0])))
+        return adj.items()
+
+    def predecessors(self, v: Any) -> List[Tuple[Any, float]]:
+        """Incoming edges of v as (u, weight); same as neighbors() when undirected."""
+        if not self.directed:
+            return self.neighbors(v)
+        if v not in self._radj:
+            return []
+        return list(self._radj[v].items())
+
+    def save(self, path: str) -> int:
+        """Write the graph in graph_io's binary format; returns bytes written."""
+        from graph_io import write_graph
+        return write_graph(self, path)
+
+    @classmethod
+    def load(cls, path: str) -> "GraphList":
+        """Read a file written by save() (or graph_io.write_graph) back as a GraphList."""
+        from graph_io import read_graph
+        return read_graph(path, kind="list")
+
     def display_connections(self) -> str:
         lines: List[str] = []
         for u in sorted(self._adj.keys(), key=lambda x: str(x)):
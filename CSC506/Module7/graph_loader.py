@@ -0,0 +1,384 @@
+from __future__ import annotations
+import csv
+import struct
+from array import array
+from itertools import chain, islice
+from operator import methodcaller
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from graph_csr import CSRGraph
+from graph_list import GraphList
+from graph_matrix import GraphMatrix
+
+# One parsed chunk: interned endpoint ids and weights, all the same length
+EdgeChunk = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+# Binary edge file: header, label table, then three aligned column arrays
+#   magic | uint64 n_labels | uint64 n_edges | uint64 label_bytes
+#   uint64 label_offsets[n_labels + 1] | utf-8 label blob | pad to 8
+#   int32 src[n_edges] | int32 dst[n_edges] | pad to 8 | float64 weight[n_edges]
+_EDGE_MAGIC = b"GEDGES01"
+_EDGE_HEADER = struct.Struct("<8sQQQ")
+
+
+class LabelTable:
+    """Interns vertex labels to dense ids 0..n-1; each label string is kept once."""
+
+    def __init__(self) -> None:
+        self.labels: List[str] = []
+        self.index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def intern(self, label: str) -> int:
+        i = self.index.get(label)
+        if i is None:
+            i = self.index[label] = len(self.labels)
+            self.labels.append(label)
+        return i
+
+    def intern_many(self, labels: List[str]) -> array:
+        """Ids for a batch of labels. New labels get ids in first-seen order; the lookups run in C."""
+        index = self.index
+        missing = [label for label in dict.fromkeys(labels) if label not in index]
+        if missing:
+            index.update(zip(missing, range(len(self.labels), len(self.labels) + len(missing))))
+            self.labels.extend(missing)
+        return array("i", map(index.__getitem__, labels))
+
+
+def _delimiter_for(path: str) -> str:
+    return "\t" if path.endswith((".tsv", ".tab")) else ","
+
+
+def _is_number(text: str) -> bool:
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _looks_like_header(first: str, second: str, delimiter: str) -> bool:
+    """
+    A 3+ column first row is a header when its weight is present and not a
+    number (an empty weight is an edge with default_weight). A 2-column
+    first row is one when neither endpoint is a number but the
+    next row has a numeric endpoint; with string labels on every row the
+    two cannot be told apart, so pass header=True.
+    """
+    fields = next(csv.reader([first], delimiter=delimiter), [])
+    if len(fields) > 2:
+        return bool(fields[2]) and not _is_number(fields[2])
+    if len(fields) == 2 and not any(map(_is_number, fields)):
+        following = next(csv.reader([second], delimiter=delimiter), [])
+        return any(map(_is_number, following[:2]))
+    return False
+
+
+def _read_blocks(f: Any, block_size: int, head: str = "") -> Iterator[str]:
+    """Text blocks of about block_size characters, always ending on a line boundary; head leads the first."""
+    while True:
+        block = head + f.read(block_size)
+        head = ""
+        if not block:
+            return
+        if not block.endswith("\n"):
+            block += f.readline()
+        yield block
+
+
+def _split_block(block: str, delimiter: str, default_weight: float) -> Tuple[List[str], List[str], array]:
+    """
+    (sources, targets, weights) of one block. Unquoted blocks whose lines
+    all have the same 2 or 3 fields are split in one C-level str.split;
+    anything else (quotes, blank lines, ragged rows) goes through csv. An
+    empty weight field means default_weight on both paths.
+    """
+    body = block.rstrip("\n")
+    if '"' not in body:
+        lines = body.split("\n")
+        counts = list(map(methodcaller("count", delimiter), lines))
+        width = counts[0] + 1
+        if width in (2, 3) and min(counts) == max(counts):
+            fields = delimiter.join(lines).split(delimiter)
+            if width == 3:
+                raw = fields[2::3]
+                if "" in raw:
+                    return fields[0::3], fields[1::3], array("d", (float(x) if x else default_weight for x in raw))
+                return fields[0::3], fields[1::3], array("d", map(float, raw))
+            return fields[0::2], fields[1::2], array("d", [default_weight]) * len(lines)
+    rows = [row for row in csv.reader(body.splitlines(), delimiter=delimiter) if len(row) >= 2]
+    weights = array("d", (float(row[2]) if len(row) > 2 and row[2] else default_weight for row in rows))
+    return [row[0] for row in rows], [row[1] for row in rows], weights
+
+
+def iter_edge_chunks(
+    path: str,
+    table: LabelTable,
+    delimiter: Optional[str] = None,
+    block_size: int = 1 << 18,
+    header: Optional[bool] = None,
+    default_weight: float = 1.0,
+) -> Iterator[EdgeChunk]:
+    """
+    Stream a CSV/TSV edge list (u, v[, weight] per row) as interned chunks.
+
+    The file is read in blocks of about block_size characters, so only one
+    block of text and its arrays are alive at a time; no per-row lists are
+    built on the common unquoted path. Labels go through table in row
+    order (u then v), so ids match the vertex order add_edge would have
+    produced, and each label string is stored once. delimiter defaults to
+    tab for .tsv/.tab files and comma otherwise. header=None guesses from
+    the first rows (see _looks_like_header). Negative, infinite or NaN
+    weights raise ValueError.
+    """
+    for sources, targets, weights in _iter_text_rows(path, delimiter, block_size, header, default_weight):
+        ids = np.frombuffer(table.intern_many(list(chain.from_iterable(zip(sources, targets)))),
+                            dtype=np.int32)
+        yield ids[0::2].copy(), ids[1::2].copy(), weights
+
+
+def _iter_text_rows(path: str, delimiter: Optional[str] = None, block_size: int = 1 << 18,
+                    header: Optional[bool] = None,
+                    default_weight: float = 1.0) -> Iterator[Tuple[List[str], List[str], np.ndarray]]:
+    """Per block: source labels, target labels and checked weights, header row skipped."""
+    delimiter = delimiter or _delimiter_for(path)
+    with open(path) as f:
+        first = f.readline()
+        if not first:
+            return
+        is_header = header
+        head = ""
+        if is_header is None:
+            head = f.readline()
+            is_header = _looks_like_header(first, head, delimiter)
+        for block in _read_blocks(f, block_size, head if is_header else first + head):
+            sources, targets, weights = _split_block(block, delimiter, default_weight)
+            if sources:
+                yield sources, targets, _check_weights(np.frombuffer(weights, dtype=np.float64))
+
+
+def _check_weights(w: np.ndarray) -> np.ndarray:
+    if (w < 0).any():
+        raise ValueError("Dijkstra requires non-negative weights.")
+    if np.isinf(w).any():
+        raise ValueError("Edge weight must be finite.")
+    if np.isnan(w).any():
+        raise ValueError("Edge weight must be a number, not NaN.")
+    return w
+
+
+def load_edge_arrays(path: str, **options: Any) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (labels, src, dst, weight) for a whole edge list. Binary edge files
+    (see write_binary_edges) are memory-mapped instead of parsed; options
+    are passed to iter_edge_chunks for text files.
+    """
+    if is_binary_edge_file(path):
+        return read_binary_edges(path)
+    table = LabelTable()
+    chunks = list(iter_edge_chunks(path, table, **options))
+    if not chunks:
+        empty = np.empty(0, dtype=np.int32)
+        return table.labels, empty, empty, np.empty(0)
+    src, dst, w = (np.concatenate(col) for col in zip(*chunks))
+    return table.labels, src, dst, w
+
+
+def _arcs(src: np.ndarray, dst: np.ndarray, weights: np.ndarray,
+          directed: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Stored arcs in add_edge order; undirected edges become (i, j), (j, i) pairs, interleaved."""
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.float64)
+    if directed:
+        return src, dst, weights
+    return np.column_stack((src, dst)).ravel(), np.column_stack((dst, src)).ravel(), np.repeat(weights, 2)
+
+
+def group_dicts(keys: np.ndarray, values: np.ndarray, weights: np.ndarray,
+                labels: List[Any]) -> Dict[Any, Dict[Any, float]]:
+    """
+    labels[k] -> {labels[v]: w} for every arc (k, v, w), built one dict(zip())
+    per key after a stable sort. Repeated (k, v) keeps its first position and
+    last weight, exactly like repeated dict assignment in add_edge.
+    """
+    n = len(labels)
+    order = np.argsort(keys, kind="stable")
+    counts = np.bincount(keys, minlength=n).tolist()
+    value_labels = iter(list(map(labels.__getitem__, values[order].tolist())))
+    value_weights = iter(weights[order].tolist())
+    return {labels[k]: dict(zip(islice(value_labels, c), islice(value_weights, c)))
+            for k, c in enumerate(counts)}
+
+
+def graph_list_from_arrays(labels: List[Any], src: np.ndarray, dst: np.ndarray, weights: np.ndarray,
+                           directed: bool = False, sorted_neighbors: bool = False) -> GraphList:
+    """Group arcs by source with NumPy and hand the dicts to GraphList.from_adjacency."""
+    s, d, w = _arcs(src, dst, weights, directed)
+    return GraphList.from_adjacency(group_dicts(s, d, w, labels), directed=directed,
+                                    sorted_neighbors=sorted_neighbors)
+
+
+def graph_matrix_from_arrays(labels: List[Any], src: np.ndarray, dst: np.ndarray, weights: np.ndarray,
+                             directed: bool = False) -> GraphMatrix:
+    """Add the vertices in label order, then write every edge with one GraphMatrix.add_edges_at call."""
+    g = GraphMatrix(directed=directed, capacity=max(1, len(labels)))
+    for v in labels:
+        g.add_vertex(v)
+    slots = np.array([g.index_of(v) for v in labels], dtype=np.intp)
+    if len(src):
+        g.add_edges_at(slots[np.asarray(src)], slots[np.asarray(dst)], weights)
+    return g
+
+
+def _label_list(labels: List[Any], ids: np.ndarray) -> List[Any]:
+    return list(map(labels.__getitem__, np.asarray(ids).tolist()))
+
+
+def _iter_label_rows(path: str, block_edges: int = 1 << 16,
+                     **options: Any) -> Iterator[Tuple[List[Any], List[Any], List[float]]]:
+    """
+    (sources, targets, weights) label lists per block of a text or binary
+    edge list. Text labels are deduplicated so each distinct label string
+    is stored once however many rows name it.
+    """
+    if is_binary_edge_file(path):
+        labels, src, dst, w = read_binary_edges(path)
+        _check_weights(w)
+        for lo in range(0, len(src), block_edges):
+            hi = lo + block_edges
+            yield _label_list(labels, src[lo:hi]), _label_list(labels, dst[lo:hi]), w[lo:hi].tolist()
+        return
+    seen: Dict[str, str] = {}
+    for sources, targets, weights in _iter_text_rows(path, **options):
+        yield list(map(seen.setdefault, sources, sources)), list(map(seen.setdefault, targets, targets)), \
+            weights.tolist()
+
+
+def graph_list_from_file(path: str, directed: bool = False, sorted_neighbors: bool = False,
+                         **options: Any) -> GraphList:
+    """
+    Stream an edge list into GraphList.add_edges one block at a time.
+    Parsed rows go straight into the adjacency dicts, with no id arrays
+    or grouping pass in between.
+    """
+    g = GraphList(directed=directed, sorted_neighbors=sorted_neighbors)
+    for sources, targets, weights in _iter_label_rows(path, **options):
+        g.add_edges(zip(sources, targets, weights))
+    return g
+
+
+def csr_from_arrays(labels: List[Any], src: np.ndarray, dst: np.ndarray, weights: np.ndarray,
+                    directed: bool = False, sort_neighbors: bool = True) -> CSRGraph:
+    """
+    Build CSR buffers with one stable NumPy sort instead of an intermediate
+    GraphList. Duplicate (u, v) arcs keep the last weight, matching
+    add_edge. With sort_neighbors each run is ordered by str(label), like
+    CSRGraph.from_graph; otherwise by target id.
+    """
+    n = len(labels)
+    s, d, w = _arcs(src, dst, weights, directed)
+    if sort_neighbors:
+        rank = np.empty(n, dtype=np.int64)
+        rank[np.argsort(np.array([str(v) for v in labels], dtype=object), kind="stable")] = np.arange(n)
+        key = s * n + rank[d]
+    else:
+        key = s * n + d
+    order = np.argsort(key, kind="stable")
+    key = key[order]
+    # Within a run of equal keys the stable sort kept arc order: keep the last
+    last = np.ones(len(key), dtype=bool)
+    last[:-1] = key[1:] != key[:-1]
+    order = order[last]
+    s, d, w = s[order], d[order], w[order]
+
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(s, minlength=n), out=offsets[1:])
+    return CSRGraph(
+        labels,
+        array("q", offsets.tobytes()),
+        array("i", d.astype(np.int32).tobytes()),
+        array("d", w.tobytes()),
+        directed=directed,
+        neighbors_sorted=sort_neighbors,
+    )
+
+
+def load_graph(path: str, kind: str = "list", directed: bool = False, **options: Any) -> Any:
+    """
+    Load an edge-list file (CSV, TSV or binary) straight into a GraphList
+    ("list"), GraphMatrix ("matrix") or CSRGraph ("csr").
+    """
+    if kind == "list":
+        return graph_list_from_file(path, directed=directed, **options)
+    labels, src, dst, w = load_edge_arrays(path, **options)
+    if kind == "matrix":
+        return graph_matrix_from_arrays(labels, src, dst, w, directed=directed)
+    if kind == "csr":
+        return csr_from_arrays(labels, src, dst, w, directed=directed)
+    raise ValueError(f"Unknown graph kind: {kind!r}")
+
+
+def _pad8(n: int) -> int:
+    return -n % 8
+
+
+def write_binary_edges(path: str, labels: List[str], src: np.ndarray, dst: np.ndarray,
+                       weights: np.ndarray) -> None:
+    blobs = [str(v).encode("utf-8") for v in labels]
+    label_offsets = np.zeros(len(blobs) + 1, dtype="<u8")
+    np.cumsum([len(b) for b in blobs], out=label_offsets[1:])
+    blob = b"".join(blobs)
+    m = len(src)
+    with open(path, "wb") as f:
+        f.write(_EDGE_HEADER.pack(_EDGE_MAGIC, len(labels), m, len(blob)))
+        f.write(label_offsets.tobytes())
+        f.write(blob + b"\0" * _pad8(len(blob)))
+        f.write(np.asarray(src, dtype="<i4").tobytes())
+        f.write(np.asarray(dst, dtype="<i4").tobytes())
+        f.write(b"\0" * _pad8(8 * m))
+        f.write(np.asarray(weights, dtype="<f8").tobytes())
+
+
+def convert_to_binary(text_path: str, binary_path: str, **options: Any) -> int:
+    """Parse a CSV/TSV edge list once and write it as a binary edge file. Returns the edge count."""
+    labels, src, dst, w = load_edge_arrays(text_path, **options)
+    write_binary_edges(binary_path, labels, src, dst, w)
+    return len(src)
+
+
+def is_binary_edge_file(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(_EDGE_MAGIC)) == _EDGE_MAGIC
+
+
+def read_binary_edges(path: str) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Memory-map a binary edge file. src, dst and weight are read-only views
+    onto the mapping (pages load on first touch); only labels are decoded.
+    """
+    with open(path, "rb") as f:
+        magic, n_labels, m, blob_len = _EDGE_HEADER.unpack(f.read(_EDGE_HEADER.size))
+    if magic != _EDGE_MAGIC:
+        raise ValueError(f"{path} is not a binary edge file")
+    raw = np.memmap(path, dtype=np.uint8, mode="r")
+    pos = _EDGE_HEADER.size
+    label_offsets = raw[pos:pos + 8 * (n_labels + 1)].view("<u8")
+    pos += 8 * (n_labels + 1)
+    blob = bytes(raw[pos:pos + blob_len])
+    pos += blob_len + _pad8(blob_len)
+    bounds = label_offsets.tolist()
+    labels = [blob[bounds[i]:bounds[i + 1]].decode("utf-8") for i in range(n_labels)]
+    if m == 0:
+        return labels, np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32), np.empty(0)
+    src = raw[pos:pos + 4 * m].view("<i4")
+    pos += 4 * m
+    dst = raw[pos:pos + 4 * m].view("<i4")
+    pos += 4 * m + _pad8(8 * m)
+    weights = raw[pos:pos + 8 * m].view("<f8")
+    return labels, src, dst, weights
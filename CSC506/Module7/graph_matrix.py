@@ -1,109 +1,344 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Tuple
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+_FREE = object()  # marks a tombstoned slot in _vertices
 
 
 class GraphMatrix:
-    def __init__(self, directed: bool = False) -> None:
+    """
+    Adjacency matrix backed by a float64 NumPy array; inf marks "no edge".
+
+    The array is over-allocated (capacity x capacity) and grown
+    geometrically, so add_vertex is O(1) amortized row/column bookkeeping
+    with an occasional bulk copy instead of a Python loop over every row.
+
+    remove_vertex tombstones the slot (clears its row and column, pushes it
+    on a free list for reuse) instead of shifting the matrix; compact()
+    squeezes tombstones out once they exceed COMPACT_RATIO of the slots.
+
+    version is bumped by every mutation (compaction is not one).
+    """
+
+    GROWTH = 1.5
+    COMPACT_RATIO = 0.5
+
+    def __init__(self, directed: bool = False, capacity: int = 16) -> None:
         self.directed = directed
-        self._index: Dict[Any, int] = {}        
-        self._vertices: List[Any] = []          
-        self._matrix: List[List[Optional[float]]] = []  
+        self.neighbors_sorted = False  # slot order, not str(label) order
+        self.version = 0
+        self._index: Dict[Any, int] = {}
+        self._vertices: List[Any] = []     # slot -> label, or _FREE
+        self._free: List[int] = []
+        self._matrix = np.full((max(1, capacity), max(1, capacity)), np.inf)
+        self._edge_count_cache = (-1, 0)  # (version, edge_count) cache
 
     def vertices(self) -> List[Any]:
-        return list(self._vertices)
+        if not self._free:
+            return list(self._vertices)
+        return [v for v in self._vertices if v is not _FREE]
 
     def has_vertex(self, v: Any) -> bool:
         return v in self._index
 
+    @property
+    def capacity(self) -> int:
+        return self._matrix.shape[0]
+
+    def reserve(self, n: int) -> None:
+        """Make room for n vertices up front (avoids repeated growth when V is known)."""
+        if n <= self.capacity:
+            return
+        size = len(self._vertices)
+        grown = np.full((n, n), np.inf)
+        grown[:size, :size] = self._matrix[:size, :size]
+        self._matrix = grown
+
     def add_vertex(self, v: Any) -> None:
         """Add a vertex if it does not exist."""
         if v in self._index:
             return
-        idx = len(self._vertices)
+        if self._free:
+            idx = self._free.pop()
+            self._vertices[idx] = v
+        else:
+            idx = len(self._vertices)
+            if idx >= self.capacity:
+                self.reserve(max(idx + 1, int(self.capacity * self.GROWTH)))
+            self._vertices.append(v)
         self._index[v] = idx
-        self._vertices.append(v)
-
-        # Expand existing rows
-        for row in self._matrix:
-            row.append(None)
-
-        # Add new row
-        self._matrix.append([None] * (idx + 1))
+        self.version += 1
 
     def remove_vertex(self, v: Any) -> bool:
-        """Remove a vertex and all incident edges."""
+        """Remove a vertex and all incident edges (O(V) vectorized clear, no shifting)."""
         if v not in self._index:
             return False
 
-        idx = self._index[v]
-
-        # Remove row
-        self._matrix.pop(idx)
-
-        # Remove column
-        for row in self._matrix:
-            row.pop(idx)
-
-        # Remove from vertices list
-        self._vertices.pop(idx)
-
-        # Rebuild index map
-        self._index.clear()
-        for i, vert in enumerate(self._vertices):
-            self._index[vert] = i
+        idx = self._index.pop(v)
+        n = len(self._vertices)
+        self._matrix[idx, :n] = np.inf
+        self._matrix[:n, idx] = np.inf
+        self._vertices[idx] = _FREE
+        self._free.append(idx)
+        self.version += 1
 
+        if len(self._free) > self.COMPACT_RATIO * n:
+            self.compact()
         return True
 
+    def compact(self) -> None:
+        """Drop tombstoned slots, keeping live vertices in slot order."""
+        if not self._free:
+            return
+        live = [i for i, v in enumerate(self._vertices) if v is not _FREE]
+        keep = np.array(live, dtype=np.intp)
+        packed = self._matrix[np.ix_(keep, keep)]
+        self._matrix[:len(live), :len(live)] = packed
+        n = len(self._vertices)
+        self._matrix[len(live):n, :n] = np.inf
+        self._matrix[:n, len(live):n] = np.inf
+        self._vertices = [self._vertices[i] for i in live]
+        self._index = {v: i for i, v in enumerate(self._vertices)}
+        self._free = []
+
     def add_edge(self, u: Any, v: Any, weight: float = 1.0) -> None:
-        
+
         if weight < 0:
             raise ValueError("Dijkstra requires non-negative weights.")
+        if weight == float("inf"):
+            raise ValueError("Edge weight must be finite (inf marks a missing edge).")
+        if math.isnan(weight):
+            raise ValueError("Edge weight must be a number, not NaN.")
         self.add_vertex(u)
         self.add_vertex(v)
         i, j = self._index[u], self._index[v]
-        self._matrix[i][j] = float(weight)
+        self._matrix[i, j] = weight
+        if not self.directed:
+            self._matrix[j, i] = weight
+        self.version += 1
+
+    def add_edges(self, edges: Iterable[Tuple[Any, Any, float]]) -> int:
+        """
+        Bulk add_edge: validates all weights at once, then interns the
+        endpoints and writes the matrix with one fancy-indexed assignment (a
+        repeated (u, v) keeps its last weight, as with add_edge). A bad
+        weight raises before any vertex is added. Returns the number of
+        edges read.
+        """
+        edges = list(edges)
+        if not edges:
+            return 0
+        w_arr = _checked_weights([w for _u, _v, w in edges])
+        rows: List[int] = []
+        cols: List[int] = []
+        index = self._index
+        for u, v, _w in edges:
+            i = index.get(u)
+            if i is None:
+                self.add_vertex(u)
+                i = index[u]
+            j = index.get(v)
+            if j is None:
+                self.add_vertex(v)
+                j = index[v]
+            rows.append(i)
+            cols.append(j)
+        return self._write_edges(rows, cols, w_arr)
+
+    def index_of(self, v: Any) -> int:
+        """Matrix slot of v (KeyError if absent)."""
+        return self._index[v]
+
+    def add_edges_at(self, rows: Any, cols: Any, weights: Any) -> int:
+        """
+        add_edges for endpoints given as live slots (see index_of), as
+        aligned sequences or arrays: one validation pass and one
+        fancy-indexed write. Returns the number of edges written.
+        """
+        w_arr = _checked_weights(weights)
+        if not len(w_arr):
+            return 0
+        return self._write_edges(rows, cols, w_arr)
+
+    def _write_edges(self, rows: Any, cols: Any, w_arr: np.ndarray) -> int:
+        count = len(w_arr)
+        r_arr = np.asarray(rows, dtype=np.intp)
+        c_arr = np.asarray(cols, dtype=np.intp)
         if not self.directed:
-            self._matrix[j][i] = float(weight)
+            # Interleave (i, j), (j, i) per edge so later edges still win
+            r_arr, c_arr = np.column_stack((r_arr, c_arr)).ravel(), np.column_stack((c_arr, r_arr)).ravel()
+            w_arr = np.repeat(w_arr, 2)
+        self._matrix[r_arr, c_arr] = w_arr
+        self.version += 1
+        return count
 
     def remove_edge(self, u: Any, v: Any) -> bool:
         if u not in self._index or v not in self._index:
             return False
         i, j = self._index[u], self._index[v]
-        existed = self._matrix[i][j] is not None
-        self._matrix[i][j] = None
+        existed = bool(np.isfinite(self._matrix[i, j]))
+        self._matrix[i, j] = np.inf
         if not self.directed:
-            self._matrix[j][i] = None
+            self._matrix[j, i] = np.inf
+        if existed:
+            self.version += 1
         return existed
 
     def neighbors(self, u: Any) -> List[Tuple[Any, float]]:
         """Return neighbors of u as a list of (neighbor, weight)."""
         if u not in self._index:
             return []
-        i = self._index[u]
-        result: List[Tuple[Any, float]] = []
-        for j, w in enumerate(self._matrix[i]):
-            if w is not None:
-                result.append((self._vertices[j], float(w)))
-        return result
+        return list(self.iter_neighbors(u))
+
+    def iter_neighbors(self, u: Any) -> Iterable[Tuple[Any, float]]:
+        """Lazy (neighbor, weight) pairs; only the finite-column index is materialized."""
+        if u not in self._index:
+            return ()
+        row = self._matrix[self._index[u], :len(self._vertices)]
+        cols = np.flatnonzero(np.isfinite(row))  # tombstoned columns are all inf
+        return zip(map(self._vertices.__getitem__, cols.tolist()), row[cols].tolist())
+
+    def predecessors(self, v: Any) -> List[Tuple[Any, float]]:
+        """Incoming edges of v as (u, weight), read from v's column."""
+        if v not in self._index:
+            return []
+        col = self._matrix[:len(self._vertices), self._index[v]]
+        rows = np.flatnonzero(np.isfinite(col))
+        vertices = self._vertices
+        return [(vertices[i], w) for i, w in zip(rows.tolist(), col[rows].tolist())]
+
+    def weight_block(self) -> np.ndarray:
+        """
+        Fresh V x V float64 copy of the live vertices' weights, rows and
+        columns in vertices() order (inf = no edge). Tombstoned slots are
+        skipped without compacting, so reading never renumbers slots.
+        """
+        n = len(self._vertices)
+        if not self._free:
+            return self._matrix[:n, :n].copy()
+        live = np.array([i for i, v in enumerate(self._vertices) if v is not _FREE], dtype=np.intp)
+        return self._matrix[np.ix_(live, live)]
+
+    def edge_count(self) -> int:
+        """Number of stored matrix entries (an undirected edge counts twice). Cached per version."""
+        version, count = self._edge_count_cache
+        if version != self.version:
+            n = len(self._vertices)
+            count = int(np.count_nonzero(np.isfinite(self._matrix[:n, :n])))
+            self._edge_count_cache = (self.version, count)
+        return count
+
+    def density(self) -> float:
+        """Stored entries / V(V-1), the fraction of possible arcs present."""
+        n = len(self._index)
+        return self.edge_count() / (n * (n - 1)) if n > 1 else 1.0
+
+    def save(self, path: str) -> int:
+        """Write the graph in graph_io's binary format; returns bytes written."""
+        from graph_io import write_graph
+        return write_graph(self, path)
+
+    @classmethod
+    def load(cls, path: str) -> "GraphMatrix":
+        """Read a file written by save() (or graph_io.write_graph) back as a GraphMatrix."""
+        from graph_io import read_graph
+        return read_graph(path, kind="matrix")
 
     def display_connections(self) -> str:
         """Readable connections list."""
         lines: List[str] = []
-        for u in self._vertices:
+        for u in self.vertices():
             nbrs = self.neighbors(u)
             nbrs_sorted = sorted(nbrs, key=lambda x: str(x[0]))
             lines.append(f"{u} -> {nbrs_sorted}")
         return "\n".join(lines) if lines else "(empty graph)"
 
     def display_matrix(self) -> str:
-        """Pretty print the adjacency matrix."""
-        if not self._vertices:
+        """Pretty print the adjacency matrix (live vertices only; the layout is not touched)."""
+        labels = self.vertices()
+        if not labels:
             return "(empty matrix)"
-        header = "     " + "  ".join(f"{str(v):>5}" for v in self._vertices)
+        header = "     " + "  ".join(f"{str(v):>5}" for v in labels)
         lines = [header]
-        for i, u in enumerate(self._vertices):
-            row_vals = []
-            for w in self._matrix[i]:
-                row_vals.append("  .  " if w is None else f"{w:5.0f}")
+        for u, row in zip(labels, self.weight_block().tolist()):
+            row_vals = ["  .  " if w == float("inf") else f"{w:5.0f}" for w in row]
             lines.append(f"{str(u):>5} " + " ".join(row_vals))
         return "\n".join(lines)
+
+def _checked_weights(weights: Any) -> np.ndarray:
+    w_arr = np.asarray(weights, dtype=np.float64)
+    if (w_arr < 0).any():
+        raise ValueError("Dijkstra requires non-negative weights.")
+    if np.isinf(w_arr).any():
+        raise ValueError("Edge weight must be finite (inf marks a missing edge).")
+    if np.isnan(w_arr).any():
+        raise ValueError("Edge weight must be a number, not NaN.")
+    return w_arr
+
+
+def _matrix_dijkstra(g: GraphMatrix, s: int, t: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    O(V^2) array Dijkstra over slot ids: no heap, each step settles the
+    argmin of the tentative distances and relaxes that vertex's whole
+    matrix row at once. Settled and tombstoned slots hold inf in tent, so
+    argmin never picks them; a settled vertex can never improve again.
+    """
+    k = len(g._vertices)
+    block = g._matrix[:k, :k]
+    dist = np.full(k, np.inf)
+    tent = np.full(k, np.inf)  # dist of unsettled vertices, inf otherwise
+    parent = np.full(k, -1, dtype=np.intp)
+    cand = np.empty(k)
+    better = np.empty(k, dtype=bool)
+    dist[s] = tent[s] = 0.0
+    for _ in range(k):
+        u = int(tent.argmin())
+        du = float(tent[u])
+        if du == np.inf:
+            break
+        tent[u] = np.inf
+        if u == t:
+            break
+        np.add(block[u], du, out=cand)
+        np.less(cand, dist, out=better)
+        np.copyto(dist, cand, where=better)
+        np.copyto(tent, cand, where=better)
+        parent[better] = u
+    return dist, parent
+
+
+def matrix_dijkstra_all(g: GraphMatrix, source: Any) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    """
+    dijkstra_all over a GraphMatrix in O(V^2). Beats the heap on dense
+    graphs, where the heap version does O(E log V) work and scans each row
+    anyway. Equal-cost ties may pick a different predecessor.
+    """
+    dist, parent = _matrix_dijkstra(g, g._index[source], -1)
+    reached = np.flatnonzero(np.isfinite(dist)).tolist()
+    vertices, d, p = g._vertices, dist.tolist(), parent.tolist()
+    return (
+        {vertices[i]: d[i] for i in reached},
+        {vertices[i]: (vertices[p[i]] if p[i] >= 0 else None) for i in reached},
+    )
+
+
+def matrix_dijkstra(g: GraphMatrix, start: Any, goal: Any) -> Tuple[List[Any], float]:
+    """dijkstra_shortest_path over a GraphMatrix in O(V^2); stops once goal is settled."""
+    if start == goal:
+        return [start], 0.0
+    if start not in g._index or goal not in g._index:
+        return [], float("inf")
+    t = g._index[goal]
+    dist, parent = _matrix_dijkstra(g, g._index[start], t)
+    if dist[t] == np.inf:
+        return [], float("inf")
+    path: List[Any] = []
+    cur = t
+    while cur >= 0:
+        path.append(g._vertices[cur])
+        cur = int(parent[cur])
+    path.reverse()
+    return path, float(dist[t])
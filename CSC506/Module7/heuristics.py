@@ -0,0 +1,84 @@
+from __future__ import annotations
+import math
+from typing import Any, Dict, List, Sequence, Tuple
+
+from graph_algorithms import GraphLike, Heuristic, dijkstra_all
+
+Coords = Dict[Any, Tuple[float, float]]
+
+
+def zero_heuristic(u: Any, goal: Any) -> float:
+    return 0.0
+
+
+def euclidean_heuristic(coords: Coords, scale: float = 1.0) -> Heuristic:
+    """
+    Straight-line distance times scale. Admissible when every edge weight is
+    at least scale times the distance between its endpoints.
+    """
+    def h(u: Any, goal: Any) -> float:
+        (x1, y1), (x2, y2) = coords[u], coords[goal]
+        return scale * math.hypot(x1 - x2, y1 - y2)
+    return h
+
+
+def manhattan_heuristic(coords: Coords, scale: float = 1.0) -> Heuristic:
+    """|dx| + |dy| times scale. Admissible for 4-connected grids with axis-aligned moves."""
+    def h(u: Any, goal: Any) -> float:
+        (x1, y1), (x2, y2) = coords[u], coords[goal]
+        return scale * (abs(x1 - x2) + abs(y1 - y2))
+    return h
+
+
+class LandmarkHeuristic:
+    """
+    ALT lower bounds from precomputed landmark distances (triangle inequality).
+
+    For each landmark L, d(u, goal) >= d(L, goal) - d(L, u). On undirected
+    graphs d is symmetric, so the absolute difference is used. Costs one
+    dijkstra_all per landmark up front.
+    """
+
+    def __init__(self, graph: GraphLike, landmarks: Sequence[Any]) -> None:
+        self.landmarks = list(landmarks)
+        self.symmetric = not getattr(graph, "directed", False)
+        self._dist: List[Dict[Any, float]] = [dijkstra_all(graph, lm)[0] for lm in self.landmarks]
+
+    def __call__(self, u: Any, goal: Any) -> float:
+        best = 0.0
+        inf = float("inf")
+        for dist in self._dist:
+            du = dist.get(u, inf)
+            dg = dist.get(goal, inf)
+            if du == inf or dg == inf:
+                continue
+            bound = abs(dg - du) if self.symmetric else dg - du
+            if bound > best:
+                best = bound
+        return best
+
+
+def pick_landmarks(graph: GraphLike, k: int, first: Any = None) -> List[Any]:
+    """Farthest-point landmark selection: each new landmark maximizes its distance to the chosen ones."""
+    vertices = graph.vertices()
+    if not vertices or k <= 0:
+        return []
+    chosen = [vertices[0] if first is None else first]
+    closest: Dict[Any, float] = dict(dijkstra_all(graph, chosen[0])[0])
+    while len(chosen) < k:
+        candidates = [(d, v) for v, d in closest.items() if v not in chosen]
+        if not candidates:
+            break
+        _d, far = max(candidates, key=lambda item: item[0])
+        chosen.append(far)
+        for v, d in dijkstra_all(graph, far)[0].items():
+            if d < closest.get(v, float("inf")):
+                closest[v] = d
+    return chosen
+
+
+def max_heuristic(*heuristics: Heuristic) -> Heuristic:
+    """Pointwise max of admissible heuristics (still admissible, never weaker)."""
+    def h(u: Any, goal: Any) -> float:
+        return max(fn(u, goal) for fn in heuristics)
+    return h
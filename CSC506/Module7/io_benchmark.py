@@ -0,0 +1,114 @@
+"""
+Graph I/O Benchmarks
+====================
+
+- edge-list load throughput (edges/s) and peak memory: per-row add_edge
+  vs the bulk loader, from CSV and from the binary edge format
+- save/reload cost of graph_io against pickle and against rebuilding
+  from the in-memory edge list
+"""
+
+import csv
+import os
+import pickle
+import random
+import tempfile
+from typing import Any
+
+from graph_benchmark import banner, timed, to_matrix, traced_memory
+from graph_csr import csr_bfs
+from graph_generators import gnm_graph
+from graph_io import read_graph, write_graph
+from graph_list import GraphList
+from graph_loader import convert_to_binary, load_graph
+from graph_matrix import GraphMatrix
+
+
+def _write_edge_csv(path: str, n: int, m: int, seed: int = 42) -> None:
+    rng = random.Random(seed)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["source", "target", "weight"])
+        for _ in range(m):
+            writer.writerow([f"v{rng.randrange(n)}", f"v{rng.randrange(n)}", rng.randint(1, 100)])
+
+
+def _per_edge_load(path: str, cls: Any) -> Any:
+    """The old startup path: csv rows straight into add_edge."""
+    g = cls()
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        next(reader)
+        for u, v, w in reader:
+            g.add_edge(u, v, float(w))
+    return g
+
+
+def benchmark_loader(n: int = 100_000, m: int = 1_000_000, matrix_n: int = 3_000,
+                     matrix_m: int = 300_000) -> None:
+    """Edge-list load throughput (edges/s) and peak memory: per-edge add_edge vs the bulk loader."""
+    banner("Bulk loader")
+    with tempfile.TemporaryDirectory() as tmp:
+        big, small = os.path.join(tmp, "big.csv"), os.path.join(tmp, "small.csv")
+        _write_edge_csv(big, n, m)
+        _write_edge_csv(small, matrix_n, matrix_m)
+        binary = os.path.join(tmp, "big.bin")
+        t, _ = timed(lambda: convert_to_binary(big, binary))
+        print(f"CSV -> binary conversion: {t:6.3f}s "
+              f"({os.path.getsize(big) / 1e6:.1f} MB text -> {os.path.getsize(binary) / 1e6:.1f} MB binary)")
+
+        runs = [
+            (m, "add_edge per row -> GraphList", lambda: _per_edge_load(big, GraphList)),
+            (m, "load_graph CSV -> GraphList", lambda: load_graph(big, "list")),
+            (m, "load_graph CSV -> CSRGraph", lambda: load_graph(big, "csr")),
+            (m, "load_graph binary -> GraphList", lambda: load_graph(binary, "list")),
+            (m, "load_graph binary -> CSRGraph", lambda: load_graph(binary, "csr")),
+            (matrix_m, "add_edge per row -> GraphMatrix", lambda: _per_edge_load(small, GraphMatrix)),
+            (matrix_m, "load_graph CSV -> GraphMatrix", lambda: load_graph(small, "matrix")),
+        ]
+        for edges, name, run in runs:
+            # Timed and traced separately: tracemalloc slows allocation-heavy code several-fold
+            elapsed = timed(run)[0]
+            peak = traced_memory(run)[1]
+            print(f"{name:32s} E={edges:>9,}: {elapsed:7.3f}s | {edges / elapsed:>11,.0f} edges/s | "
+                  f"peak {peak / 1e6:8.1f} MB")
+
+
+def benchmark_graph_io(n: int = 100_000, m: int = 1_000_000, matrix_n: int = 3_000) -> None:
+    """Reload cost: graph_io binary vs pickle vs rebuilding from the edge list."""
+    banner(f"Graph save/load (GraphList V={n:,}, E={m:,}; GraphMatrix V={matrix_n:,})")
+    rng = random.Random(8)
+    edges = [(f"v{rng.randrange(n)}", f"v{rng.randrange(n)}", float(rng.randint(1, 100))) for _ in range(m)]
+    g = GraphList()
+    g.add_edges(edges)
+    gm = to_matrix(gnm_graph(matrix_n, matrix_n * 50))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, graph, kinds in (("GraphList", g, ("list", "csr")), ("GraphMatrix", gm, ("matrix",))):
+            path = os.path.join(tmp, name)
+            save_time, size = timed(lambda: write_graph(graph, path))
+            dump_time, pickled = timed(lambda: pickle.dumps(graph, protocol=pickle.HIGHEST_PROTOCOL))
+            print(f"{name}: graph_io {size / 1e6:7.1f} MB (save {save_time:6.3f}s) | "
+                  f"pickle {len(pickled) / 1e6:7.1f} MB (dumps {dump_time:6.3f}s)")
+            t, _ = timed(lambda: pickle.loads(pickled))
+            print(f"  pickle.loads                     {t:7.3f}s")
+            for kind in kinds:
+                t, _ = timed(lambda: read_graph(path, kind=kind))
+                print(f"  read_graph kind={kind:6s}             {t:7.3f}s")
+            if "csr" in kinds:
+                t, c = timed(lambda: read_graph(path, kind="csr", lazy_labels=True))
+                print(f"  read_graph kind=csr, lazy labels {t:7.3f}s")
+                t, _ = timed(lambda: csr_bfs(c, c.label_of(0)))
+                print(f"    first csr_bfs after lazy load   {t:7.3f}s (decodes labels for the index and output)")
+                c.close()
+        t, _ = timed(lambda: GraphList().add_edges(edges))
+        print(f"rebuild GraphList from in-memory edges (add_edges) {t:7.3f}s")
+
+
+def main() -> None:
+    benchmark_loader()
+    benchmark_graph_io()
+
+
+if __name__ == "__main__":
+    main()
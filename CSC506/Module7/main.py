@@ -1,6 +1,7 @@
 from graph_matrix import GraphMatrix
 from graph_list import GraphList
 from graph_algorithms import bfs, dfs, dijkstra_shortest_path
+from tracing import StepLog
 
 
 def build_sample_graph(g) -> None:
@@ -35,28 +36,31 @@ def run_demo(name: str, g) -> None:
 
     start = "A"
 
-    order_bfs, steps_bfs = bfs(g, start)
+    steps_bfs = StepLog()
+    order_bfs = bfs(g, start, tracer=steps_bfs)
     print("\nBFS order:", order_bfs)
     print("BFS steps (first 12):")
-    for s in steps_bfs[:12]:
+    for s in steps_bfs.lines()[:12]:
         print("  -", s)
 
-    order_dfs, steps_dfs = dfs(g, start)
+    steps_dfs = StepLog()
+    order_dfs = dfs(g, start, tracer=steps_dfs)
     print("\nDFS order:", order_dfs)
     print("DFS steps (first 12):")
-    for s in steps_dfs[:12]:
+    for s in steps_dfs.lines()[:12]:
         print("  -", s)
 
-    path, cost, steps_sp = dijkstra_shortest_path(g, "A", "F")
+    steps_sp = StepLog()
+    path, cost = dijkstra_shortest_path(g, "A", "F", tracer=steps_sp)
     print("\nShortest path A -> F:", path, "| cost=", cost)
     print("Dijkstra steps (first 12):")
-    for s in steps_sp[:12]:
+    for s in steps_sp.lines()[:12]:
         print("  -", s)
 
     # Manipulation demo: remove edge and show impact
     print("\nRemove edge D-E and re-run shortest path A->F:")
     g.remove_edge("D", "E")
-    path2, cost2, _ = dijkstra_shortest_path(g, "A", "F")
+    path2, cost2 = dijkstra_shortest_path(g, "A", "F", steps=False)
     print("Shortest path A -> F:", path2, "| cost=", cost2)
 
 
@@ -0,0 +1,159 @@
+from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from graph_csr import CSRGraph
+
+# Attached once per worker process by the pool initializer
+_WORKER: Dict[str, Any] = {}
+
+
+def _views(blocks: List[shared_memory.SharedMemory], n: int, m: int) -> Dict[str, Any]:
+    return {
+        "blocks": blocks,  # keep the mappings alive
+        "offsets": np.ndarray(n + 1, dtype=np.int64, buffer=blocks[0].buf),
+        "targets": np.ndarray(m, dtype=np.int32, buffer=blocks[1].buf),
+        "visited": np.ndarray(n, dtype=np.uint8, buffer=blocks[2].buf),
+        "frontier": np.ndarray(n, dtype=np.int32, buffer=blocks[3].buf),
+    }
+
+
+def _init_worker(names: Tuple[str, ...], n: int, m: int) -> None:
+    _WORKER.update(_views([shared_memory.SharedMemory(name=name) for name in names], n, m))
+
+
+def _expand(offsets: np.ndarray, targets: np.ndarray, visited: np.ndarray,
+            frontier: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    One level for a slice of the frontier, vectorized: gather every
+    out-arc, drop visited targets, keep the first arc into each new vertex.
+    Marks the new vertices in the shared visited map and returns
+    (new vertices, their parents).
+    """
+    starts = offsets[frontier]
+    lengths = offsets[frontier + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int32)
+        return empty, empty
+    # Arc positions: each frontier vertex's run starts..starts+length, concatenated
+    run_start = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    nbrs = targets[run_start + np.arange(total)]
+    parents = np.repeat(frontier, lengths)
+    fresh = visited[nbrs] == 0
+    nbrs, parents = nbrs[fresh], parents[fresh]
+    nbrs, first = np.unique(nbrs, return_index=True)
+    visited[nbrs] = 1
+    return nbrs, parents[first]
+
+
+def _expand_range(lo: int, hi: int) -> Tuple[np.ndarray, np.ndarray]:
+    w = _WORKER
+    return _expand(w["offsets"], w["targets"], w["visited"], w["frontier"][lo:hi])
+
+
+class ParallelBFS:
+    """
+    Level-synchronous BFS over a CSRGraph copied once into shared memory.
+
+    Each level's frontier sits in a shared buffer and is cut into one
+    contiguous range per worker. Workers expand their range with NumPy and
+    mark a shared byte-per-vertex visited map (a byte map rather than a
+    bitmap, so concurrent marks never race on a shared word). Two workers
+    can still claim the same vertex within a level; the merge keeps one
+    parent per vertex. Reuse one instance for many searches: the pool and
+    shared arrays are built once. workers<=1 runs the same kernel in-process.
+    """
+
+    def __init__(self, csr: CSRGraph, workers: Optional[int] = None, min_chunk: int = 4096) -> None:
+        self.csr = csr
+        self.workers = (os.cpu_count() or 1) if workers is None else max(1, workers)
+        self.min_chunk = min_chunk
+        n, m = csr.num_vertices, csr.num_arcs
+        self._n = n
+        sizes = (8 * (n + 1), 4 * m, n, 4 * n)
+        self._blocks = [shared_memory.SharedMemory(create=True, size=max(1, size)) for size in sizes]
+        names = tuple(block.name for block in self._blocks)
+        self._views = _views(self._blocks, n, m)
+        self._views["offsets"][:] = np.frombuffer(csr.offsets, dtype=np.int64)
+        self._views["targets"][:] = np.frombuffer(csr.targets, dtype=np.int32)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        if self.workers > 1:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                             initargs=(names, n, m))
+
+    def __enter__(self) -> "ParallelBFS":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self._views.clear()  # drop the array views before closing their buffers
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def run(self, s: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(dist, parent) int32 arrays indexed by vertex id; -1 marks unreached (and the root's parent)."""
+        v = self._views
+        visited, frontier_buf = v["visited"], v["frontier"]
+        visited[:] = 0
+        dist = np.full(self._n, -1, dtype=np.int32)
+        parent = np.full(self._n, -1, dtype=np.int32)
+        dist[s] = 0
+        visited[s] = 1
+        frontier = np.array([s], dtype=np.int32)
+        level = 0
+
+        while len(frontier):
+            size = len(frontier)
+            frontier_buf[:size] = frontier
+            parts = min(self.workers, max(1, size // self.min_chunk))
+            if parts == 1 or self._pool is None:
+                found = [_expand(v["offsets"], v["targets"], visited, frontier_buf[:size])]
+            else:
+                bounds = np.linspace(0, size, parts + 1).astype(int).tolist()
+                found = list(self._pool.map(_expand_range, bounds[:-1], bounds[1:]))
+            nbrs = np.concatenate([f[0] for f in found])
+            parents = np.concatenate([f[1] for f in found])
+            if len(found) > 1:
+                nbrs, first = np.unique(nbrs, return_index=True)
+                parents = parents[first]
+            level += 1
+            dist[nbrs] = level
+            parent[nbrs] = parents
+            frontier = nbrs
+        return dist, parent
+
+
+def parallel_bfs(
+    csr: CSRGraph, start: Any, workers: Optional[int] = None
+) -> Tuple[List[Any], Dict[Any, Optional[Any]], Dict[Any, int]]:
+    """
+    One-shot ParallelBFS with the bfs_tree/csr_bfs (order, parent, dist)
+    contract. order lists vertices level by level (by id within a level),
+    so it can differ from bfs_tree's order while dist matches exactly. A
+    start that is not in the graph reaches only itself, as in csr_bfs.
+    """
+    if not csr.has_vertex(start):
+        return [start], {start: None}, {start: 0}
+    with ParallelBFS(csr, workers=workers) as runner:
+        dist, parent = runner.run(csr.index_of(start))
+    reached = np.flatnonzero(dist >= 0)
+    order = reached[np.argsort(dist[reached], kind="stable")].tolist()
+    labels = csr._labels
+    dist_list, parent_list = dist.tolist(), parent.tolist()
+    return (
+        [labels[i] for i in order],
+        {labels[i]: (labels[parent_list[i]] if parent_list[i] >= 0 else None) for i in order},
+        {labels[i]: dist_list[i] for i in order},
+    )
@@ -0,0 +1,57 @@
+"""
+Parallel BFS Benchmark
+======================
+
+Strong scaling of ParallelBFS over 1, 2, 4, ... cpu_count workers on one
+large graph, against the serial bfs, bfs_tree and csr_bfs.
+"""
+
+import os
+import random
+
+from graph_algorithms import bfs, bfs_tree
+from graph_benchmark import banner, timed
+from graph_csr import CSRGraph, csr_bfs
+from graph_list import GraphList
+from parallel_bfs import ParallelBFS
+
+
+def benchmark_parallel_bfs(n: int = 500_000, m: int = 4_000_000, serial_cap: int = 100_000) -> None:
+    """Strong scaling of ParallelBFS over 1..cpu_count workers, against the serial searches."""
+    cores = os.cpu_count() or 1
+    banner(f"Parallel BFS (V={n:,}, E={m:,}, {cores} CPU(s) available)")
+    rng = random.Random(11)
+    g = GraphList()
+    g.add_edges((rng.randrange(n), rng.randrange(n), 1.0) for _ in range(m))
+    c = CSRGraph.from_graph(g)
+    start = g.vertices()[0]
+
+    if n <= serial_cap:
+        print(f"bfs (serial, GraphList)         {timed(lambda: bfs(g, start, steps=False))[0]:7.3f}s")
+    else:
+        print(f"bfs (serial, GraphList)         skipped above V={serial_cap:,}")
+    print(f"bfs_tree (serial, GraphList)    {timed(lambda: bfs_tree(g, start))[0]:7.3f}s")
+    print(f"csr_bfs (serial, CSR)           {timed(lambda: csr_bfs(c, start))[0]:7.3f}s")
+
+    s = c.index_of(start)
+    base = None
+    workers = 1
+    while True:
+        with ParallelBFS(c, workers=workers) as runner:
+            runner.run(s)  # warm the pool and the shared pages
+            t, _ = timed(lambda: runner.run(s))
+        base = base or t
+        print(f"ParallelBFS workers={workers:<3d}          {t:7.3f}s | speedup {base / t:5.2f}x")
+        if workers >= cores and workers >= 2:
+            break
+        workers *= 2
+    if cores == 1:
+        print("(one CPU: workers>1 time-slice a single core, so this shows overhead, not scaling)")
+
+
+def main() -> None:
+    benchmark_parallel_bfs()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, List, Tuple
+
+from graph_algorithms import GraphLike, dijkstra_shortest_path
+
+PathResult = Tuple[List[Any], float]
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0  # times the whole cache was dropped for a graph mutation
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ShortestPathCache:
+    """
+    LRU cache of (source, target) -> (path, cost) in front of a path search.
+
+    Entries are tied to graph.version: the first lookup after any
+    add/remove of a vertex or edge drops every entry, since a single
+    mutation can change any shortest path. Graphs without a version
+    attribute are treated as frozen.
+    """
+
+    def __init__(
+        self,
+        graph: GraphLike,
+        maxsize: int = 1024,
+        search: Callable[[GraphLike, Any, Any], PathResult] = partial(dijkstra_shortest_path, steps=False),
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be > 0")
+        self.graph = graph
+        self.maxsize = maxsize
+        self.search = search
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Tuple[Any, Any], PathResult]" = OrderedDict()
+        self._version = getattr(graph, "version", 0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def shortest_path(self, source: Any, target: Any) -> PathResult:
+        """Same contract as dijkstra_shortest_path; the returned path must not be mutated."""
+        version = getattr(self.graph, "version", 0)
+        if version != self._version:
+            if self._entries:
+                self._entries.clear()
+                self.stats.invalidations += 1
+            self._version = version
+
+        key = (source, target)
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return result
+
+        self.stats.misses += 1
+        result = self.search(self.graph, source, target)
+        self._entries[key] = result
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+        return result
+
+    def clear(self) -> None:
+        self._entries.clear()
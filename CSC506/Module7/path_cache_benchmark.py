@@ -0,0 +1,60 @@
+"""
+Path Cache Benchmark
+====================
+
+Replays a skewed (Zipf-like) shortest-path query log with rare edge
+mutations, with and without ShortestPathCache, and reports hit rate,
+evictions and invalidations.
+"""
+
+import random
+from typing import Any, List
+
+from graph_algorithms import dijkstra_shortest_path
+from graph_benchmark import banner, timed
+from graph_generators import grid_graph
+from path_cache import ShortestPathCache
+
+
+def benchmark_path_cache(side: int = 40, distinct: int = 200, queries: int = 3000,
+                         mutate_every: int = 300, maxsize: int = 128) -> None:
+    """Replay a skewed query log with rare edge mutations, with and without ShortestPathCache."""
+    banner(f"Shortest-path cache ({side}x{side} grid, {queries:,} queries over {distinct} pairs, "
+           f"mutation every {mutate_every}, maxsize {maxsize})")
+    g, _coords = grid_graph(side, side, jitter=0.3)
+    rng = random.Random(11)
+    vertices = g.vertices()
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(distinct)]
+    # Zipf-like skew: pair i is drawn with weight 1 / (i + 1)
+    log = rng.choices(pairs, weights=[1 / (i + 1) for i in range(distinct)], k=queries)
+    edges = [(u, v, w) for u in vertices for v, w in g.neighbors(u) if str(u) < str(v)]
+    mutations = [rng.choice(edges) for _ in range(queries // mutate_every + 1)]
+
+    def replay(query: Any) -> List[float]:
+        costs = []
+        for i, (s, t) in enumerate(log):
+            if i and i % mutate_every == 0:
+                # Toggle an edge off and back on, as in the main.py remove_edge demo
+                u, v, w = mutations[i // mutate_every]
+                g.remove_edge(u, v)
+                g.add_edge(u, v, w)
+            costs.append(query(s, t)[1])
+        return costs
+
+    plain_time, plain = timed(lambda: replay(lambda s, t: dijkstra_shortest_path(g, s, t, steps=False)))
+    cache = ShortestPathCache(g, maxsize=maxsize)
+    cached_time, cached = timed(lambda: replay(cache.shortest_path))
+
+    assert plain == cached
+    st = cache.stats
+    print(f"uncached: {plain_time:7.3f}s | cached: {cached_time:7.3f}s | speedup {plain_time / cached_time:5.1f}x")
+    print(f"hits {st.hits:,} misses {st.misses:,} hit rate {st.hit_rate:6.1%} | "
+          f"evictions {st.evictions:,} invalidations {st.invalidations:,}")
+
+
+def main() -> None:
+    benchmark_path_cache()
+
+
+if __name__ == "__main__":
+    main()
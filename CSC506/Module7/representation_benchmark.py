@@ -0,0 +1,177 @@
+"""
+Representation Benchmarks
+=========================
+
+What each graph representation costs for the operations it was built or
+tuned for:
+
+- CSRGraph vs GraphList: bytes per arc and traversal speed
+- GraphMatrix vs GraphList on dense graphs: construction and traversal
+- vertex churn (remove + re-add) on both mutable representations
+- neighbors() copies vs iter_neighbors views on pre-sorted adjacency
+- heap vs O(V^2) array Dijkstra on GraphMatrix across average degree
+"""
+
+import random
+from typing import Any, List, Optional, Tuple
+
+from graph_algorithms import DENSE_DIJKSTRA_MIN_DEGREE, _dijkstra, bfs, bfs_tree, dfs, dijkstra_all
+from graph_benchmark import banner, best_of, timed, traced_memory
+from graph_csr import CSRGraph, csr_bfs, csr_dfs, csr_dijkstra_all
+from graph_generators import erdos_renyi_graph, gnm_graph
+from graph_list import GraphList
+from graph_matrix import GraphMatrix, matrix_dijkstra_all
+
+
+def benchmark_csr(n: int = 50_000, m: int = 250_000) -> None:
+    """Memory per edge and traversal speed: GraphList vs frozen CSRGraph."""
+    banner(f"CSRGraph vs GraphList (V={n:,}, E={m:,})")
+    list_bytes, _peak, g = traced_memory(lambda: gnm_graph(n, m))
+    freeze_time, (csr_bytes, _peak, csr) = timed(lambda: traced_memory(lambda: CSRGraph.from_graph(g)))
+
+    arcs = csr.num_arcs
+    print(f"GraphList: {list_bytes / arcs:8.1f} bytes/arc")
+    print(f"CSRGraph:  {csr_bytes / arcs:8.1f} bytes/arc (buffers {csr.nbytes() / arcs:.1f}) | freeze {freeze_time:.3f}s")
+
+    runs = [
+        ("BFS", lambda: bfs_tree(g, 0), lambda: csr_bfs(csr, 0)),
+        ("DFS", lambda: dfs(g, 0, steps=False), lambda: csr_dfs(csr, 0)),
+        ("Dijkstra all", lambda: dijkstra_all(g, 0), lambda: csr_dijkstra_all(csr, 0)),
+    ]
+    for name, on_list, on_csr in runs:
+        list_time, _ = timed(on_list)
+        csr_time, _ = timed(on_csr)
+        print(f"{name:12s}: GraphList {list_time:7.3f}s | CSR {csr_time:7.3f}s | speedup {list_time / csr_time:5.2f}x")
+
+
+def benchmark_dense_matrix(sizes: Optional[List[int]] = None, density: float = 0.25) -> None:
+    """Dense-graph construction and traversal on GraphMatrix (GraphList for reference).
+
+    V=10_000 needs ~1 GB for the float64 matrix; pass sizes explicitly to run it.
+    """
+    banner(f"Dense graphs (density {density})")
+    sizes = sizes or [2000, 4000]
+    for n in sizes:
+        rng = random.Random(n)
+        edges = [(u, v, rng.randint(1, 100)) for u in range(n) for v in range(u + 1, n)
+                 if rng.random() < density]
+        for cls in (GraphMatrix, GraphList):
+            g = cls(directed=False)
+            vertex_time, _ = timed(lambda: [g.add_vertex(v) for v in range(n)])
+            edge_time, _ = timed(lambda: [g.add_edge(u, v, w) for u, v, w in edges])
+            scan_time, _ = timed(lambda: [g.neighbors(u) for u in range(n)])
+            bfs_time, _ = timed(lambda: bfs_tree(g, 0))
+            dijkstra_time, _ = timed(lambda: dijkstra_all(g, 0))
+            print(f"V={n:>6} {cls.__name__:11s}: add_vertex {vertex_time:7.3f}s | add_edge x{len(edges):,} "
+                  f"{edge_time:7.3f}s | all neighbors {scan_time:7.3f}s | bfs {bfs_time:7.3f}s | "
+                  f"dijkstra_all {dijkstra_time:7.3f}s")
+            del g
+
+
+def benchmark_churn(n: int = 3000, degree: int = 8, rounds: int = 3000) -> None:
+    """Remove a random vertex and re-add it with fresh edges, `rounds` times."""
+    banner(f"Vertex churn (V={n:,}, avg degree {degree}, {rounds:,} remove+add rounds)")
+    for cls, directed in ((GraphList, False), (GraphList, True), (GraphMatrix, False), (GraphMatrix, True)):
+        rng = random.Random(5)
+        g = cls(directed=directed)
+        for v in range(n):
+            g.add_vertex(v)
+        for _ in range(n * degree // 2):
+            u, v = rng.randrange(n), rng.randrange(n)
+            if u != v:
+                g.add_edge(u, v, 1.0)
+        live = list(range(n))
+
+        def churn() -> None:
+            next_label = n
+            for _ in range(rounds):
+                i = rng.randrange(len(live))
+                g.remove_vertex(live[i])
+                live[i] = next_label
+                for _ in range(degree):
+                    g.add_edge(next_label, live[rng.randrange(len(live))], 1.0)
+                next_label += 1
+
+        elapsed, _ = timed(churn)
+        kind = "directed" if directed else "undirected"
+        print(f"{cls.__name__:11s} {kind:10s}: {elapsed:7.3f}s | {elapsed / rounds * 1e6:9.1f} µs/round")
+
+
+class _ListNeighborsOnly:
+    """
+    Hides iter_neighbors so the algorithms fall back to neighbors(), and
+    counts the lists and (v, w) tuples those calls copy.
+    """
+
+    def __init__(self, graph: Any) -> None:
+        self.directed = graph.directed
+        self.vertices = graph.vertices
+        self._graph = graph
+        self.lists = 0
+        self.tuples = 0
+
+    def neighbors(self, u: Any) -> List[Tuple[Any, float]]:
+        nbrs = self._graph.neighbors(u)
+        self.lists += 1
+        self.tuples += len(nbrs)
+        return nbrs
+
+
+def benchmark_neighbor_iteration(n: int = 50_000, m: int = 250_000) -> None:
+    """Per-visit copy (and sort) of neighbors() vs iter_neighbors views on pre-sorted adjacency."""
+    banner(f"Neighbor iteration (V={n:,}, E={m:,})")
+    plain = gnm_graph(n, m)
+    presorted = gnm_graph(n, m, sorted_neighbors=True)
+    t, _ = timed(lambda: [presorted.iter_neighbors(u) for u in presorted.vertices()])
+    print(f"one-time adjacency sort: {t:7.3f}s")
+    assert dfs(plain, 0, steps=False) == dfs(presorted, 0, steps=False)
+    assert bfs(plain, 0, steps=False) == bfs(presorted, 0, steps=False)
+
+    runs = [
+        ("dfs", lambda g: dfs(g, 0, steps=False)),
+        ("bfs", lambda g: bfs(g, 0, steps=False)),
+        ("bfs_tree", lambda g: bfs_tree(g, 0)),
+        ("dijkstra_all", lambda g: dijkstra_all(g, 0)),
+    ]
+    for name, run in runs:
+        copying = _ListNeighborsOnly(plain)
+        t_copy, _ = timed(lambda: run(copying))
+        t_view, _ = timed(lambda: run(presorted))
+        print(f"{name:12s} neighbors(): {t_copy:7.3f}s, {copying.lists:,} lists / {copying.tuples:,} tuples copied"
+              f" (+ sort keys in bfs/dfs) | iter_neighbors: {t_view:7.3f}s, no copies | "
+              f"speedup {t_copy / t_view:5.2f}x")
+
+
+def benchmark_dense_dijkstra(sizes: Optional[List[int]] = None,
+                             degrees: Optional[List[float]] = None, sources: int = 5,
+                             repeat: int = 3) -> None:
+    """Heap Dijkstra vs the O(V^2) array Dijkstra on GraphMatrix, across average degree."""
+    banner(f"GraphMatrix Dijkstra: heap vs array (auto picks array at >= "
+           f"{DENSE_DIJKSTRA_MIN_DEGREE} arcs per vertex)")
+    sizes = sizes or [250, 500, 1000, 2000, 4000]
+    degrees = degrees or [0.5, 1, 1.5, 2, 3, 4, 8, 16, 64]
+    for n in sizes:
+        for degree in degrees:
+            g = erdos_renyi_graph(n, degree / (n - 1), seed=n, graph_cls=GraphMatrix)
+            starts = random.Random(n).sample(g.vertices(), sources)
+            times = {}
+            for name, fn in (("heap", lambda s: _dijkstra(g, s, None, None)),
+                             ("array", lambda s: matrix_dijkstra_all(g, s))):
+                times[name] = best_of(lambda: [fn(s) for s in starts], repeat) / sources
+            arcs_per_vertex = g.edge_count() / n
+            picked = "array" if arcs_per_vertex >= DENSE_DIJKSTRA_MIN_DEGREE else "heap"
+            print(f"V={n:>5} arcs/V {arcs_per_vertex:6.2f} (density {g.density():7.4f}): "
+                  f"heap {times['heap']:7.4f}s | array {times['array']:7.4f}s | "
+                  f"heap/array {times['heap'] / times['array']:6.2f}x | auto -> {picked}")
+
+
+def main() -> None:
+    benchmark_csr()
+    benchmark_dense_matrix()
+    benchmark_churn()
+    benchmark_neighbor_iteration()
+    benchmark_dense_dijkstra()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Search Benchmarks
+=================
+
+Single-source and point-to-point searches against the baselines they
+replaced:
+
+- bfs_tree (deque, visit-on-enqueue) vs the list-queue bfs
+- dijkstra_all / dijkstra_multi_target vs one dijkstra_shortest_path per target
+- A* with Euclidean, Manhattan and ALT heuristics vs Dijkstra
+- bidirectional_dijkstra vs dijkstra_shortest_path
+"""
+
+import math
+import random
+from typing import List, Optional
+
+from graph_algorithms import (
+    astar_shortest_path,
+    bfs,
+    bfs_tree,
+    bidirectional_dijkstra,
+    dijkstra_all,
+    dijkstra_multi_target,
+    dijkstra_shortest_path,
+    reconstruct_path,
+    reverse_adjacency,
+)
+from graph_benchmark import banner, timed
+from graph_generators import gnm_graph, grid_graph, random_geometric_graph
+from heuristics import LandmarkHeuristic, euclidean_heuristic, manhattan_heuristic, pick_landmarks, zero_heuristic
+from tracing import EventCounter
+
+
+def benchmark_bfs(edge_counts: Optional[List[int]] = None, avg_degree: int = 10,
+                  baseline_max_edges: int = 200_000) -> None:
+    """Deque/visit-on-enqueue bfs_tree vs the list-queue bfs."""
+    banner("BFS: bfs_tree (deque) vs bfs (list.pop(0))")
+    edge_counts = edge_counts or [100_000, 300_000, 1_000_000]
+    for m in edge_counts:
+        n = max(2, 2 * m // avg_degree)
+        g = gnm_graph(n, m)
+
+        fast, (order, _parent, _dist) = timed(lambda: bfs_tree(g, 0))
+        line = f"E={m:>9,} V={n:>8,} | bfs_tree: {fast:8.3f}s (reached {len(order):,})"
+
+        if m <= baseline_max_edges:
+            slow, _ = timed(lambda: bfs(g, 0, steps=False))
+            line += f" | bfs: {slow:8.3f}s | speedup {slow / fast:6.1f}x"
+        else:
+            line += " | bfs: skipped (quadratic)"
+        print(line)
+
+
+def benchmark_dijkstra_many(n: int = 20_000, m: int = 100_000, targets: int = 50) -> None:
+    """One dijkstra_all / multi-target run vs `targets` separate pairwise calls."""
+    banner(f"Dijkstra: {targets} targets from one source (V={n:,}, E={m:,})")
+    g = gnm_graph(n, m)
+    rng = random.Random(7)
+    goals = rng.sample(range(1, n), targets)
+
+    pairwise_time, pairwise = timed(lambda: [dijkstra_shortest_path(g, 0, t, steps=False)[1] for t in goals])
+
+    def all_then_paths() -> dict:
+        dist, prev = dijkstra_all(g, 0)
+        for t in goals:
+            reconstruct_path(prev, t)
+        return dist
+
+    all_time, dist = timed(all_then_paths)
+    multi_time, (dist_multi, _prev_multi) = timed(lambda: dijkstra_multi_target(g, 0, goals))
+
+    assert all(dist[t] == c for t, c in zip(goals, pairwise))
+    assert all(dist_multi[t] == c for t, c in zip(goals, pairwise))
+    print(f"Pairwise x{targets}:        {pairwise_time:8.3f}s")
+    print(f"dijkstra_all + paths:  {all_time:8.3f}s | speedup {pairwise_time / all_time:6.1f}x")
+    print(f"dijkstra_multi_target: {multi_time:8.3f}s | speedup {pairwise_time / multi_time:6.1f}x")
+
+
+def benchmark_astar(side: int = 150, queries: int = 20, landmarks: int = 8) -> None:
+    """Settled vertices and runtime: Dijkstra vs A* (Euclidean, Manhattan, ALT)."""
+    banner(f"A* vs Dijkstra on a {side}x{side} road-like grid ({queries} queries)")
+    g, coords = grid_graph(side, side, jitter=0.3)
+    rng = random.Random(3)
+    vertices = g.vertices()
+    pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(queries)]
+
+    t, alt = timed(lambda: LandmarkHeuristic(g, pick_landmarks(g, landmarks)))
+    print(f"ALT preprocessing ({landmarks} landmarks): {t:.3f}s")
+
+    # Edge lengths are Euclidean, so the Manhattan bound must be scaled by 1/sqrt(2)
+    heuristics = [
+        ("Dijkstra (h=0)", zero_heuristic),
+        ("A* Euclidean", euclidean_heuristic(coords)),
+        ("A* Manhattan/sqrt2", manhattan_heuristic(coords, scale=1 / math.sqrt(2))),
+        ("A* ALT", alt),
+    ]
+    baseline: List[float] = []
+    for name, h in heuristics:
+        counter = EventCounter()
+        elapsed, costs = timed(lambda: [astar_shortest_path(g, s, t, h, tracer=counter)[1] for s, t in pairs])
+        settled = counter["POP"] - counter["SKIP"]
+        if not baseline:
+            baseline = costs
+        assert all(abs(a - b) < 1e-9 for a, b in zip(costs, baseline))
+        print(f"{name:20s}: {elapsed:8.3f}s | settled/query {settled / queries:10.1f}")
+
+    t, _ = timed(lambda: [dijkstra_shortest_path(g, s, t, steps=False) for s, t in pairs])
+    print(f"{'dijkstra_shortest_path':20s}: {t:8.3f}s")
+
+
+def benchmark_bidirectional(queries: int = 30) -> None:
+    """Bidirectional vs one-sided Dijkstra on random geometric and grid graphs."""
+    banner(f"Bidirectional Dijkstra vs dijkstra_shortest_path ({queries} queries)")
+    n = 20_000
+    cases = [
+        ("geometric undirected", random_geometric_graph(n, radius=math.sqrt(8 / (math.pi * n)))[0]),
+        ("geometric directed", random_geometric_graph(n, radius=math.sqrt(8 / (math.pi * n)), directed=True)[0]),
+        ("grid 140x140", grid_graph(140, 140, jitter=0.3)[0]),
+    ]
+    rng = random.Random(11)
+    for name, g in cases:
+        vertices = g.vertices()
+        pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(queries)]
+        radj = reverse_adjacency(g) if g.directed else None
+
+        one_time, one_sided = timed(lambda: [dijkstra_shortest_path(g, s, t, steps=False)[1] for s, t in pairs])
+        two_time, two_sided = timed(lambda: [bidirectional_dijkstra(g, s, t, reverse=radj)[1] for s, t in pairs])
+
+        assert all(abs(a - b) < 1e-9 or a == b for a, b in zip(one_sided, two_sided))
+        print(f"{name:22s}: one-sided {one_time:7.3f}s | bidirectional {two_time:7.3f}s | "
+              f"speedup {one_time / two_time:5.2f}x")
+
+
+def main() -> None:
+    benchmark_bfs()
+    benchmark_dijkstra_many()
+    benchmark_astar()
+    benchmark_bidirectional()
+
+
+if __name__ == "__main__":
+    main()
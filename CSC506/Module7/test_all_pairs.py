@@ -0,0 +1,71 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from all_pairs import (_plain_buffer, all_pairs_shortest_paths, choose_engine, density, floyd_warshall,
+                       repeated_dijkstra)
+from graph_algorithms import dijkstra_all
+from graph_csr import CSRGraph
+from graph_generators import gnm_graph
+from graph_io import read_graph, write_graph
+from graph_matrix import GraphMatrix
+
+
+def test_floyd_warshall_matches_repeated_dijkstra():
+    g = gnm_graph(40, 120, directed=True)
+    fw = floyd_warshall(g)
+    rd = repeated_dijkstra(g, workers=1)
+    assert np.array_equal(fw.dist, rd.dist)
+    for u in (0, 7, 39):
+        assert rd.row(u) == dijkstra_all(g, u)[0]
+
+
+def test_pooled_dijkstra_matches_serial():
+    g = gnm_graph(30, 90)
+    serial = repeated_dijkstra(g, workers=1)
+    pooled = repeated_dijkstra(g, workers=2, chunk=4)
+    assert np.array_equal(serial.dist, pooled.dist)
+
+
+def test_mapped_csr_is_dispatched_as_plain_buffers(tmp_path):
+    g = gnm_graph(30, 90)
+    path = str(tmp_path / "g.bin")
+    write_graph(g, path)
+    expected = repeated_dijkstra(g, workers=1).dist
+    with read_graph(path, kind="csr") as mapped:
+        buffers = [_plain_buffer(mapped.offsets, "q"), _plain_buffer(mapped.targets, "i"),
+                   _plain_buffer(mapped.weights, "d")]
+        assert np.array_equal(repeated_dijkstra(mapped, workers=2, chunk=4).dist, expected)
+    # Owned copies outlive the mapping and pickle without it
+    assert pickle.loads(pickle.dumps(buffers)) == buffers
+    assert list(buffers[2]) == list(CSRGraph.from_graph(g, sort_neighbors=False).weights)
+
+
+def test_floyd_warshall_skips_tombstoned_slots():
+    m = GraphMatrix(capacity=4, directed=True)
+    m.add_edges([("a", "b", 1.0), ("b", "x", 1.0), ("x", "c", 1.0), ("b", "c", 5.0)])
+    m.remove_vertex("x")
+    table = floyd_warshall(m)
+    assert table.labels == ["a", "b", "c"]
+    assert table["a", "c"] == 6.0
+    assert table.row("c") == {"c": 0.0}
+
+
+def test_negative_weights_rejected():
+    m = GraphMatrix(directed=True)
+    m.add_vertex("a")
+    m.add_vertex("b")
+    m._matrix[0, 1] = -1.0
+    with pytest.raises(ValueError):
+        floyd_warshall(m)
+
+
+def test_auto_engine_follows_threshold():
+    g = gnm_graph(20, 40)
+    d = density(g)
+    assert choose_engine(g, workers=1, dense_threshold=d) == "floyd_warshall"
+    assert choose_engine(g, workers=2, dense_threshold=d) == "repeated_dijkstra"
+    assert all_pairs_shortest_paths(g, workers=1, dense_threshold=d * 2).engine == "repeated_dijkstra"
+    with pytest.raises(ValueError):
+        all_pairs_shortest_paths(g, engine="bogus")
@@ -0,0 +1,95 @@
+import pytest
+
+from connectivity import (condensation, connected_components, kruskal_mst, prim_mst, strongly_connected_components,
+                          topological_sort)
+from graph_generators import gnm_graph
+from graph_list import GraphList
+
+
+def test_connected_components_in_vertex_order():
+    g = GraphList()
+    g.add_edges([("a", "b", 1.0), ("c", "d", 1.0), ("b", "e", 1.0)])
+    g.add_vertex("f")
+    assert connected_components(g) == [["a", "b", "e"], ["c", "d"], ["f"]]
+
+
+def test_directed_components_are_weak():
+    g = GraphList(directed=True)
+    g.add_edges([("a", "b", 1.0), ("c", "b", 1.0), ("d", "e", 1.0)])
+    assert connected_components(g) == [["a", "b", "c"], ["d", "e"]]
+
+
+def test_kruskal_and_prim_agree_on_total_weight():
+    for seed in range(5):
+        g = gnm_graph(60, 150, seed=seed)
+        k_edges, k_total = kruskal_mst(g)
+        p_edges, p_total = prim_mst(g)
+        assert k_total == p_total
+        forest = len(g.vertices()) - len(connected_components(g))
+        assert len(k_edges) == len(p_edges) == forest
+
+
+def test_mst_picks_the_light_edges():
+    g = GraphList()
+    g.add_edges([("a", "b", 1.0), ("b", "c", 2.0), ("a", "c", 3.0), ("c", "d", 1.0), ("x", "y", 7.0)])
+    edges, total = kruskal_mst(g)
+    assert total == 11.0
+    assert sorted(edges) == [("a", "b", 1.0), ("b", "c", 2.0), ("c", "d", 1.0), ("x", "y", 7.0)]
+    assert prim_mst(g, start="d")[1] == 11.0
+
+
+def test_mst_rejects_directed_graphs():
+    g = GraphList(directed=True)
+    g.add_edges([("a", "b", 1.0)])
+    with pytest.raises(ValueError):
+        kruskal_mst(g)
+    with pytest.raises(ValueError):
+        prim_mst(g)
+
+
+def _digraph(edges, extra=()):
+    g = GraphList(directed=True)
+    g.add_edges(edges)
+    for v in extra:
+        g.add_vertex(v)
+    return g
+
+
+def test_scc_in_topological_order():
+    g = _digraph([("a", "b", 1.0), ("b", "a", 1.0), ("b", "c", 1.0), ("c", "d", 1.0), ("d", "c", 1.0),
+                  ("e", "a", 1.0)], extra=["f"])
+    comps = strongly_connected_components(g)
+    assert sorted(map(sorted, comps)) == [["a", "b"], ["c", "d"], ["e"], ["f"]]
+    position = {v: k for k, members in enumerate(comps) for v in members}
+    for u in g.vertices():
+        for v, _w in g.neighbors(u):
+            assert position[u] <= position[v]
+
+
+def test_scc_handles_deep_graphs_iteratively():
+    n = 5000  # one long cycle: far deeper than the recursion limit
+    g = _digraph([(i, (i + 1) % n, 1.0) for i in range(n)])
+    assert strongly_connected_components(g) == [list(range(n))]
+
+
+def test_topological_sort_respects_edges_and_ties():
+    g = _digraph([("c", "a", 1.0), ("b", "a", 1.0), ("a", "d", 1.0)], extra=["e"])
+    assert topological_sort(g) == ["c", "b", "e", "a", "d"]
+
+
+def test_topological_sort_rejects_cycles():
+    with pytest.raises(ValueError):
+        topological_sort(_digraph([("a", "b", 1.0), ("b", "c", 1.0), ("c", "a", 1.0)]))
+    with pytest.raises(ValueError):
+        topological_sort(gnm_graph(5, 4))  # undirected
+
+
+def test_condensation_keeps_lightest_edge_between_components():
+    g = _digraph([("a", "b", 1.0), ("b", "a", 1.0), ("a", "c", 5.0), ("b", "c", 2.0), ("c", "d", 1.0),
+                  ("d", "c", 1.0)])
+    dag, comp = condensation(g)
+    assert comp["a"] == comp["b"] != comp["c"] == comp["d"]
+    assert dag.directed
+    assert list(dag.neighbors(comp["a"])) == [(comp["c"], 2.0)]
+    assert list(dag.neighbors(comp["c"])) == []
+    assert topological_sort(dag) == sorted(dag.vertices())
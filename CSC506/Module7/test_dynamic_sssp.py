@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from dynamic_sssp import DynamicSSSP
+from graph_algorithms import dijkstra_all
+from graph_generators import gnm_graph
+from graph_list import GraphList
+
+
+def _path_cost(g, path):
+    weights = {(u, v): w for u in g.vertices() for v, w in g.neighbors(u)}
+    return sum(weights[u, v] for u, v in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize("directed", [True, False])
+def test_repairs_match_fresh_dijkstra(directed):
+    g = gnm_graph(40, 100, seed=3, directed=directed)
+    sssp = DynamicSSSP(g, 0)
+    rng = random.Random(5)
+    for step in range(150):
+        u, v = rng.randrange(40), rng.randrange(40)
+        if u == v:
+            continue
+        if step % 3 == 0:
+            sssp.remove_edge(u, v)
+        else:
+            sssp.add_edge(u, v, float(rng.randint(1, 100)))  # insert, decrease or increase
+        dist, _parent = dijkstra_all(g, 0)
+        assert sssp.dist == dist
+        for t in (5, 17, 33):
+            if t in dist:
+                assert _path_cost(g, sssp.path(t)) == dist[t]
+            else:
+                assert sssp.distance(t) == float("inf")
+
+
+def test_non_tree_change_settles_nothing():
+    g = GraphList(directed=True)
+    g.add_edges([("s", "a", 1.0), ("a", "b", 1.0), ("s", "b", 5.0)])
+    sssp = DynamicSSSP(g, "s")
+    sssp.add_edge("s", "b", 6.0)
+    assert sssp.last_affected == 0
+    assert sssp.distance("b") == 2.0
+
+
+def test_tree_edge_removal_reroutes_subtree():
+    g = GraphList(directed=True)
+    g.add_edges([("s", "a", 1.0), ("a", "b", 1.0), ("b", "c", 1.0), ("s", "b", 5.0)])
+    sssp = DynamicSSSP(g, "s")
+    assert sssp.remove_edge("a", "b")
+    assert sssp.path("c") == ["s", "b", "c"]
+    assert sssp.distance("c") == 6.0
+    assert not sssp.remove_edge("a", "b")
+
+
+def test_mutation_behind_its_back_triggers_recompute():
+    g = GraphList(directed=True)
+    g.add_edges([("s", "a", 4.0)])
+    sssp = DynamicSSSP(g, "s")
+    g.add_edges([("s", "b", 1.0), ("b", "a", 1.0)])
+    assert sssp.distance("a") == 2.0
+    assert sssp.path("a") == ["s", "b", "a"]
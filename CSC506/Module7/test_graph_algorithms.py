@@ -0,0 +1,74 @@
+from graph_algorithms import (bidirectional_dijkstra, dijkstra_all, dijkstra_multi_target,
+                              dijkstra_shortest_path, reconstruct_path, reverse_adjacency)
+from graph_generators import gnm_graph
+from graph_list import GraphList
+
+
+def _chain() -> GraphList:
+    g = GraphList()
+    for u, v, w in (("A", "B", 1), ("B", "C", 2), ("C", "D", 3)):
+        g.add_edge(u, v, w)
+    return g
+
+
+def test_multi_target_empty_targets_skips_search():
+    events = []
+    dist, prev = dijkstra_multi_target(_chain(), "A", [], tracer=lambda *e: events.append(e))
+    assert (dist, prev) == ({}, {})
+    assert events == []
+
+
+def test_multi_target_stops_at_targets():
+    dist, _prev = dijkstra_multi_target(_chain(), "A", ["C"])
+    assert dist["C"] == 3
+    assert "D" not in dist
+
+
+def test_multi_target_drops_tentative_predecessors():
+    # D gets a tentative prev A (cost 10) before the search stops at B; its shortest path is via C (6)
+    g = _chain()
+    g.add_edge("A", "D", 10)
+    dist, prev = dijkstra_multi_target(g, "A", ["B"])
+    assert set(prev) == set(dist) == {"A", "B"}
+    assert reconstruct_path(prev, "D") == []
+
+
+def test_dijkstra_all_matches_pairwise_paths():
+    g = _chain()
+    g.add_edge("A", "D", 10)
+    dist, prev = dijkstra_all(g, "A")
+    assert dist == {"A": 0.0, "B": 1.0, "C": 3.0, "D": 6.0}
+    assert reconstruct_path(prev, "D") == ["A", "B", "C", "D"]
+    assert dijkstra_shortest_path(g, "A", "D", steps=False) == (["A", "B", "C", "D"], 6.0)
+
+
+class _NoDirectedFlag:
+    """Directed adjacency without a directed attribute (GraphLike only)."""
+
+    def __init__(self, adj):
+        self._adj = adj
+
+    def vertices(self):
+        return list(self._adj)
+
+    def neighbors(self, u):
+        return list(self._adj[u].items())
+
+
+def test_bidirectional_matches_dijkstra_on_random_graphs():
+    for directed in (False, True):
+        g = gnm_graph(200, 600, seed=9, directed=directed)
+        radj = reverse_adjacency(g) if directed else None
+        for s, t in [(0, 5), (3, 150), (17, 17), (42, 199)]:
+            expected = dijkstra_shortest_path(g, s, t, steps=False)[1]
+            path, cost = bidirectional_dijkstra(g, s, t, reverse=radj)
+            assert cost == expected
+            if path:
+                assert path[0] == s and path[-1] == t
+
+
+def test_bidirectional_without_directed_attribute_follows_arc_direction():
+    # a -> b -> c: treating it as undirected would walk a -> b backwards and find b -> a
+    g = _NoDirectedFlag({"a": {"b": 1.0}, "b": {"c": 1.0}, "c": {}})
+    assert bidirectional_dijkstra(g, "b", "a") == ([], float("inf"))
+    assert bidirectional_dijkstra(g, "a", "b") == (["a", "b"], 1.0)
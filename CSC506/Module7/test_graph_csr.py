@@ -0,0 +1,62 @@
+import pytest
+
+from graph_algorithms import bfs_tree, dfs, dijkstra_all, dijkstra_shortest_path
+from graph_csr import CSRGraph, csr_bfs, csr_dfs, csr_dijkstra, csr_dijkstra_all
+from graph_list import GraphList
+from graph_matrix import GraphMatrix, matrix_dijkstra
+
+EDGES = [("A", "B", 2.0), ("A", "C", 5.0), ("B", "C", 1.0), ("C", "D", 2.0), ("D", "A", 1.0),
+         ("B", "D", 4.0), ("E", "A", 3.0)]
+
+
+def _backends():
+    gl = GraphList()
+    gl.add_edges(EDGES)
+    gl.add_vertex("Z")  # isolated
+    gm = GraphMatrix(capacity=6)
+    for v in gl.vertices():
+        gm.add_vertex(v)
+    gm.add_edges(EDGES)
+    return {"list": gl, "matrix": gm, "csr": CSRGraph.from_graph(gl)}
+
+
+@pytest.mark.parametrize("start, goal", [
+    ("A", "D"), ("E", "C"), ("A", "Z"), ("A", "A"), ("Z", "Z"),
+    ("missing", "missing"), ("missing", "A"), ("A", "missing"),
+])
+def test_shortest_path_parity_across_backends(start, goal):
+    results = {name: dijkstra_shortest_path(g, start, goal, steps=False) for name, g in _backends().items()}
+    assert results["matrix"] == results["list"]
+    assert results["csr"] == results["list"]
+
+
+def test_fast_paths_agree_with_the_generic_search():
+    b = _backends()
+    for start, goal in [("missing", "missing"), ("A", "A"), ("A", "D"), ("A", "missing")]:
+        expected = dijkstra_shortest_path(b["list"], start, goal, steps=False)
+        assert csr_dijkstra(b["csr"], start, goal) == expected
+        assert matrix_dijkstra(b["matrix"], start, goal) == expected
+
+
+def test_unknown_start_matches_generic_traversals():
+    b = _backends()
+    assert csr_bfs(b["csr"], "missing") == bfs_tree(b["list"], "missing")
+    assert csr_dfs(b["csr"], "missing") == dfs(b["list"], "missing", steps=False)
+    assert csr_dijkstra_all(b["csr"], "missing") == dijkstra_all(b["list"], "missing")
+
+
+def test_csr_traversals_match_the_source_graph():
+    b = _backends()
+    csr, gl = b["csr"], b["list"]
+    assert csr_dfs(csr, "E") == dfs(gl, "E", steps=False)
+    assert csr_bfs(csr, "A")[2] == bfs_tree(gl, "A")[2]
+    assert csr_dijkstra_all(csr, "E") == dijkstra_all(gl, "E")
+    assert csr.num_vertices == 6 and csr.num_arcs == 2 * len(EDGES)
+    assert sorted(csr.neighbors("A")) == sorted(gl.neighbors("A"))
+
+
+def test_constructor_validates_buffer_lengths():
+    with pytest.raises(ValueError):
+        CSRGraph(["a"], [0], [], [])
+    with pytest.raises(ValueError):
+        CSRGraph(["a"], [0, 1], [0], [])
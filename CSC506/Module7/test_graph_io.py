@@ -0,0 +1,89 @@
+import pytest
+
+from graph_csr import CSRGraph
+from graph_io import LazyLabels, MappedCSRGraph, read_graph, write_graph
+from graph_list import GraphList
+from graph_matrix import GraphMatrix
+
+EDGES = [("b", "a", 2.0), ("a", "c", 1.5), ("c", "b", 4.0), ("d", "a", 0.5)]
+
+
+def _adjacency(g):
+    return [(u, list(g.neighbors(u))) for u in g.vertices()]
+
+
+def _list(directed=True, sorted_neighbors=False):
+    g = GraphList(directed=directed, sorted_neighbors=sorted_neighbors)
+    g.add_edges(EDGES)
+    return g
+
+
+@pytest.mark.parametrize("directed", [True, False])
+@pytest.mark.parametrize("sorted_neighbors", [True, False])
+def test_list_round_trip_keeps_vertex_and_neighbor_order(tmp_path, directed, sorted_neighbors):
+    g = _list(directed, sorted_neighbors)
+    path = str(tmp_path / "g.graph")
+    write_graph(g, path)
+    loaded = read_graph(path)
+    assert isinstance(loaded, GraphList)
+    assert loaded.directed == directed and loaded.neighbors_sorted == sorted_neighbors
+    assert _adjacency(loaded) == _adjacency(g)
+
+
+def test_matrix_round_trip_does_not_compact_the_source(tmp_path):
+    m = GraphMatrix(directed=True, capacity=8)
+    m.add_edges(EDGES + [("x", "a", 9.0)])
+    m.remove_vertex("x")
+    before = (m.version, list(m._vertices), list(m._free))
+    path = str(tmp_path / "m.graph")
+    write_graph(m, path)
+    assert (m.version, list(m._vertices), list(m._free)) == before
+    loaded = read_graph(path)
+    assert isinstance(loaded, GraphMatrix)
+    assert _adjacency(loaded) == _adjacency(m)
+
+
+def test_csr_round_trip_and_cross_kind_reads(tmp_path):
+    csr = CSRGraph.from_graph(_list())
+    path = str(tmp_path / "c.graph")
+    write_graph(csr, path)
+    with read_graph(path) as mapped:
+        assert isinstance(mapped, MappedCSRGraph)
+        assert _adjacency(mapped) == _adjacency(csr)
+        assert mapped.neighbors_sorted
+    assert _adjacency(read_graph(path, kind="list")) == _adjacency(csr)
+    assert _adjacency(read_graph(path, kind="matrix")) == _adjacency(csr)
+
+
+def test_int_labels_round_trip(tmp_path):
+    g = GraphList(directed=True)
+    g.add_edges([(10, -3, 1.0), (1 << 40, 10, 2.0)])
+    path = str(tmp_path / "i.graph")
+    write_graph(g, path)
+    assert _adjacency(read_graph(path)) == _adjacency(g)
+
+
+@pytest.mark.parametrize("edges", [[(("a", 1), "b", 1.0)], [("a", 1, 1.0)], [(1 << 70, 1, 1.0)]])
+def test_unsupported_labels_rejected(tmp_path, edges):
+    g = GraphList()
+    g.add_edges(edges)
+    with pytest.raises(ValueError):
+        write_graph(g, str(tmp_path / "bad.graph"))
+
+
+def test_foreign_file_rejected(tmp_path):
+    path = tmp_path / "junk.graph"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        read_graph(str(path))
+
+
+def test_mapped_csr_close_and_lazy_labels(tmp_path):
+    path = str(tmp_path / "c.graph")
+    write_graph(CSRGraph.from_graph(_list()), path)
+    mapped = read_graph(path, kind="csr", lazy_labels=True)
+    assert isinstance(mapped._labels, LazyLabels)
+    assert mapped.label_of(2) == mapped.vertices()[2]
+    mapped.close()
+    mapped.close()  # idempotent
+    assert mapped.num_vertices == 0 and mapped.vertices() == []
@@ -0,0 +1,29 @@
+from graph_list import GraphList
+
+
+def test_directed_remove_vertex_clears_both_directions():
+    g = GraphList(directed=True)
+    g.add_edges([("a", "b", 1.0), ("b", "c", 2.0), ("c", "b", 3.0), ("b", "b", 4.0)])
+    version = g.version
+    assert g.remove_vertex("b")
+    assert g.version == version + 1
+    assert g.vertices() == ["a", "c"]
+    assert g.neighbors("a") == [] and g.neighbors("c") == []
+    assert g.predecessors("c") == []
+    assert not g.remove_vertex("b")
+
+
+def test_undirected_remove_vertex_and_reinsert():
+    g = GraphList()
+    g.add_edges([("a", "b", 1.0), ("b", "c", 2.0)])
+    g.remove_vertex("b")
+    assert g.neighbors("a") == [] and g.neighbors("c") == []
+    g.add_edge("b", "a", 7.0)
+    assert g.neighbors("a") == [("b", 7.0)]
+
+
+def test_sorted_neighbors_survive_removal():
+    g = GraphList(sorted_neighbors=True)
+    g.add_edges([("m", "z", 1.0), ("m", "b", 1.0), ("m", "k", 1.0)])
+    g.remove_vertex("k")
+    assert [v for v, _w in g.iter_neighbors("m")] == ["b", "z"]
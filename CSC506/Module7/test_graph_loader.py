@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from graph_loader import convert_to_binary, is_binary_edge_file, load_edge_arrays, load_graph
+
+
+def _write(tmp_path, text, name="edges.csv"):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+def _arcs(g):
+    return sorted((u, v, w) for u in g.vertices() for v, w in g.neighbors(u))
+
+
+@pytest.mark.parametrize("kind", ["list", "matrix", "csr"])
+@pytest.mark.parametrize("block_size", [1, 5, 1 << 18])
+def test_first_row_with_empty_weight_is_an_edge(tmp_path, kind, block_size):
+    path = _write(tmp_path, "a,b,\nb,c,2\n")
+    g = load_graph(path, kind=kind, directed=True, block_size=block_size)
+    assert _arcs(g) == [("a", "b", 1.0), ("b", "c", 2.0)]
+
+
+def test_first_row_with_empty_weight_survives_conversion(tmp_path):
+    text = _write(tmp_path, "a,b,\nb,c,2\n")
+    binary = str(tmp_path / "edges.bin")
+    assert convert_to_binary(text, binary) == 2
+    assert is_binary_edge_file(binary)
+    assert not is_binary_edge_file(text)
+    labels, src, dst, w = load_edge_arrays(binary)
+    assert labels == ["a", "b", "c"]
+    assert src.tolist() == [0, 1] and dst.tolist() == [1, 2] and w.tolist() == [1.0, 2.0]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("u,v,weight\na,b,3\n", [("a", "b", 3.0)]),
+    ("source\ttarget\n1\t2\n", [("1", "2", 1.0)]),
+    ("a,b\nc,d\n", [("a", "b", 1.0), ("c", "d", 1.0)]),  # string labels: no header guessed
+    ('"x,1",y,2\ny,z\n', [("x,1", "y", 2.0), ("y", "z", 1.0)]),  # quoted and ragged rows go through csv
+])
+def test_header_detection_and_parsing(tmp_path, text, expected):
+    path = _write(tmp_path, text, "edges.tsv" if "\t" in text else "edges.csv")
+    assert _arcs(load_graph(path, directed=True)) == expected
+
+
+def test_binary_round_trip_matches_text(tmp_path):
+    rows = "".join(f"v{i},v{(i * 7) % 50},{i % 9 + 1}\n" for i in range(200))
+    text = _write(tmp_path, "src,dst,w\n" + rows)
+    binary = str(tmp_path / "edges.bin")
+    convert_to_binary(text, binary)
+    for kind in ("list", "matrix", "csr"):
+        assert _arcs(load_graph(binary, kind=kind)) == _arcs(load_graph(text, kind=kind, block_size=64))
+
+
+@pytest.mark.parametrize("weight", ["-1", "inf", "nan"])
+def test_bad_weights_rejected(tmp_path, weight):
+    path = _write(tmp_path, f"a,b,1\nb,c,{weight}\n")
+    for kind in ("list", "csr"):
+        with pytest.raises(ValueError):
+            load_graph(path, kind=kind)
+
+
+def test_empty_file_loads_empty_graph(tmp_path):
+    path = _write(tmp_path, "")
+    labels, src, _dst, w = load_edge_arrays(path)
+    assert labels == [] and len(src) == 0 and w.dtype == np.float64
+    assert load_graph(path, kind="csr").num_vertices == 0
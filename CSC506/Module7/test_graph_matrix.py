@@ -0,0 +1,145 @@
+import math
+
+import numpy as np
+import pytest
+
+import graph_algorithms
+from graph_algorithms import DENSE_DIJKSTRA_MIN_DEGREE, dijkstra_all, dijkstra_shortest_path
+from graph_generators import erdos_renyi_graph
+from graph_matrix import GraphMatrix
+from tracing import EventCounter
+
+
+def test_growth_keeps_existing_edges():
+    g = GraphMatrix(capacity=2)
+    for i in range(50):
+        g.add_edge(i, i + 1, float(i))
+    assert g.capacity >= 51
+    assert g.neighbors(10) == [(9, 9.0), (11, 10.0)]
+    assert g.edge_count() == 100
+
+
+def test_add_edges_matches_add_edge():
+    edges = [("a", "b", 1.0), ("b", "c", 2.0), ("a", "b", 3.0), ("c", "a", 0.5)]
+    for directed in (False, True):
+        one, bulk = GraphMatrix(directed=directed), GraphMatrix(directed=directed)
+        for e in edges:
+            one.add_edge(*e)
+        assert bulk.add_edges(edges) == len(edges)
+        assert bulk.vertices() == one.vertices()
+        assert np.array_equal(bulk.weight_block(), one.weight_block())
+
+
+@pytest.mark.parametrize("bad", [-1.0, math.inf, math.nan])
+def test_bad_weight_leaves_the_graph_untouched(bad):
+    g = GraphMatrix()
+    g.add_edge("a", "b", 1.0)
+    version = g.version
+    with pytest.raises(ValueError):
+        g.add_edges([("a", "c", 1.0), ("d", "e", bad)])
+    with pytest.raises(ValueError):
+        g.add_edge("x", "y", bad)
+    with pytest.raises(ValueError):
+        g.add_edges_at([0], [1], [bad])
+    assert g.vertices() == ["a", "b"]
+    assert g.version == version
+    assert g.neighbors("a") == [("b", 1.0)]
+
+
+def test_add_edges_at_writes_by_slot():
+    g = GraphMatrix()
+    for v in "abc":
+        g.add_vertex(v)
+    g.add_edges_at([g.index_of("a"), g.index_of("b")], [g.index_of("c"), g.index_of("c")], [4.0, 5.0])
+    assert g.neighbors("c") == [("a", 4.0), ("b", 5.0)]
+    assert g.add_edges_at([], [], []) == 0
+
+
+def _square() -> GraphMatrix:
+    g = GraphMatrix(capacity=4)
+    for u, v, w in (("a", "b", 1.0), ("b", "c", 2.0), ("c", "d", 3.0), ("d", "a", 4.0)):
+        g.add_edge(u, v, w)
+    return g
+
+
+def test_remove_vertex_tombstones_and_reuses_the_slot():
+    g = _square()
+    slot = g.index_of("b")
+    assert g.remove_vertex("b") and not g.remove_vertex("b")
+    assert g.vertices() == ["a", "c", "d"]
+    assert g.neighbors("a") == [("d", 4.0)]
+    assert g.edge_count() == 4
+    g.add_edge("e", "a", 5.0)
+    assert g.index_of("e") == slot
+    assert g.neighbors("e") == [("a", 5.0)]
+
+
+def test_weight_block_and_display_skip_tombstones_without_compacting():
+    g = _square()
+    g.remove_vertex("a")
+    slots = list(g._vertices)
+    block = g.weight_block()
+    assert block.shape == (3, 3)
+    assert block[0, 1] == 2.0 and np.isinf(block[0, 0])
+    assert "a" not in g.display_matrix().split()
+    assert g._vertices == slots
+
+
+def test_compact_keeps_live_vertices_in_order_and_bumps_no_version():
+    g = _square()
+    g.remove_vertex("b")
+    version = g.version
+    before = [(v, g.neighbors(v)) for v in g.vertices()]
+    g.compact()
+    assert g.version == version
+    assert [(v, g.neighbors(v)) for v in g.vertices()] == before
+    assert [g.index_of(v) for v in g.vertices()] == [0, 1, 2]
+
+
+def test_heavy_removal_compacts_automatically():
+    g = _square()
+    g.remove_vertex("a")
+    g.remove_vertex("b")
+    g.remove_vertex("c")
+    assert g._free == [] and g.vertices() == ["d"]
+
+
+def _spy_matrix_dijkstra(monkeypatch):
+    calls = []
+    for name in ("matrix_dijkstra", "matrix_dijkstra_all"):
+        real = getattr(graph_algorithms, name)
+        monkeypatch.setattr(graph_algorithms, name,
+                            lambda *args, _real=real, _name=name: calls.append(_name) or _real(*args))
+    return calls
+
+
+@pytest.mark.parametrize("degree, dense", [(0.5, False), (DENSE_DIJKSTRA_MIN_DEGREE + 2, True)])
+def test_dijkstra_dispatch_follows_arcs_per_vertex(monkeypatch, degree, dense):
+    gm = erdos_renyi_graph(120, degree / 119, seed=3, graph_cls=GraphMatrix)
+    gl = erdos_renyi_graph(120, degree / 119, seed=3)
+    calls = _spy_matrix_dijkstra(monkeypatch)
+    dist, _prev = dijkstra_all(gm, 0)
+    _path, cost = dijkstra_shortest_path(gm, 0, 7, steps=False)
+    assert calls == (["matrix_dijkstra_all", "matrix_dijkstra"] if dense else [])
+    assert dist == dijkstra_all(gl, 0)[0]
+    assert cost == dijkstra_shortest_path(gl, 0, 7, steps=False)[1]
+
+
+def test_traced_or_unknown_source_runs_take_the_heap_path(monkeypatch):
+    gm = erdos_renyi_graph(60, 0.3, seed=5, graph_cls=GraphMatrix)
+    calls = _spy_matrix_dijkstra(monkeypatch)
+    counter = EventCounter()
+    dist, _prev = dijkstra_all(gm, 0, tracer=counter)
+    assert counter["POP"] > 0
+    assert dijkstra_all(gm, "missing") == ({"missing": 0.0}, {"missing": None})
+    assert calls == []
+    assert dijkstra_all(gm, 0)[0] == dist
+
+
+def test_dense_dispatch_skips_tombstoned_slots():
+    gm = erdos_renyi_graph(40, 0.5, seed=6, graph_cls=GraphMatrix)
+    for v in (3, 11, 20):
+        gm.remove_vertex(v)
+    dist, prev = dijkstra_all(gm, 0)
+    assert not {3, 11, 20} & (set(dist) | set(prev.values()))
+    assert dist == graph_algorithms._dijkstra(gm, 0, None, None)[0]
@@ -0,0 +1,51 @@
+import random
+
+from graph_algorithms import astar_shortest_path, dijkstra_all, dijkstra_shortest_path
+from graph_generators import gnm_graph, grid_graph
+from heuristics import (LandmarkHeuristic, euclidean_heuristic, manhattan_heuristic, max_heuristic,
+                        pick_landmarks, zero_heuristic)
+from tracing import EventCounter
+
+
+def _pairs(vertices, k, seed):
+    rng = random.Random(seed)
+    return [(rng.choice(vertices), rng.choice(vertices)) for _ in range(k)]
+
+
+def test_astar_matches_dijkstra_costs_on_a_grid():
+    g, coords = grid_graph(15, 15, jitter=0.3, seed=3)
+    for h in (zero_heuristic, euclidean_heuristic(coords)):
+        for s, t in _pairs(g.vertices(), 20, 1):
+            _path, cost = astar_shortest_path(g, s, t, h)
+            assert abs(cost - dijkstra_shortest_path(g, s, t, steps=False)[1]) < 1e-9
+
+
+def test_euclidean_pops_fewer_vertices_than_zero_heuristic():
+    g, coords = grid_graph(20, 20, seed=4)
+    blind, guided = EventCounter(), EventCounter()
+    astar_shortest_path(g, (0, 0), (19, 10), zero_heuristic, tracer=blind)
+    astar_shortest_path(g, (0, 0), (19, 10), euclidean_heuristic(coords), tracer=guided)
+    assert guided["POP"] < blind["POP"]
+
+
+def test_landmark_bounds_are_admissible_and_astar_stays_exact():
+    g = gnm_graph(300, 1200, seed=5)
+    landmarks = pick_landmarks(g, 4)
+    assert len(set(landmarks)) == 4
+    h = LandmarkHeuristic(g, landmarks)
+    for s, t in _pairs(g.vertices(), 15, 2):
+        exact = dijkstra_all(g, s)[0].get(t, float("inf"))
+        assert h(s, t) <= exact + 1e-9
+        assert abs(astar_shortest_path(g, s, t, h)[1] - exact) < 1e-9 or exact == float("inf")
+
+
+def test_manhattan_and_max_heuristic():
+    coords = {"a": (0.0, 0.0), "b": (3.0, 4.0)}
+    assert manhattan_heuristic(coords)("a", "b") == 7.0
+    h = max_heuristic(euclidean_heuristic(coords), zero_heuristic)
+    assert h("a", "b") == 5.0
+
+
+def test_unreachable_goal():
+    g = gnm_graph(10, 0)
+    assert astar_shortest_path(g, 0, 9, zero_heuristic) == ([], float("inf"))
@@ -0,0 +1,46 @@
+import pytest
+
+from graph_algorithms import bfs, bfs_tree
+from graph_csr import CSRGraph, csr_bfs
+from graph_generators import gnm_graph
+from graph_list import GraphList
+from parallel_bfs import ParallelBFS, parallel_bfs
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_dist_matches_bfs_tree(workers):
+    g = gnm_graph(300, 600, seed=4)
+    g.add_vertex("island")
+    csr = CSRGraph.from_graph(g)
+    order, parent, dist = parallel_bfs(csr, 0, workers=workers)
+    _order, _parent, expected = bfs_tree(g, 0)
+    assert dist == expected
+    assert sorted(order, key=str) == sorted(_order, key=str)
+    assert [dist[v] for v in order] == sorted(dist.values())
+    for v, p in parent.items():
+        assert (p is None) == (v == 0)
+        if p is not None:
+            assert dist[p] == dist[v] - 1
+            assert v in dict(csr.neighbors(p))
+
+
+def test_frontier_split_across_workers_keeps_one_parent():
+    g = gnm_graph(400, 4000, seed=8)
+    csr = CSRGraph.from_graph(g)
+    with ParallelBFS(csr, workers=2, min_chunk=8) as runner:
+        dist, parent = runner.run(0)
+        again, _ = runner.run(0)  # shared buffers are reset between runs
+    assert dist.tolist() == again.tolist()
+    assert {csr.label_of(i): d for i, d in enumerate(dist.tolist()) if d >= 0} == bfs_tree(g, 0)[2]
+    assert parent[0] == -1
+
+
+def test_unknown_start_reaches_only_itself():
+    g = GraphList()
+    g.add_edges([("a", "b", 1.0)])
+    csr = CSRGraph.from_graph(g)
+    expected = (["missing"], {"missing": None}, {"missing": 0})
+    assert parallel_bfs(csr, "missing", workers=1) == expected
+    assert csr_bfs(csr, "missing") == expected
+    assert bfs_tree(g, "missing") == expected
+    assert bfs(csr, "missing", steps=False) == ["missing"]
@@ -0,0 +1,71 @@
+import pytest
+
+from graph_csr import CSRGraph
+from graph_list import GraphList
+from path_cache import ShortestPathCache
+
+
+def _graph():
+    g = GraphList()
+    g.add_edges([("a", "b", 1.0), ("b", "c", 1.0), ("a", "c", 5.0), ("c", "d", 1.0)])
+    return g
+
+
+def _counting_cache(graph, maxsize=8):
+    calls = []
+    cache = ShortestPathCache(graph, maxsize=maxsize)
+    search = cache.search
+
+    def counted(g, s, t):
+        calls.append((s, t))
+        return search(g, s, t)
+
+    cache.search = counted
+    return cache, calls
+
+
+def test_repeat_query_is_a_hit():
+    cache, calls = _counting_cache(_graph())
+    assert cache.shortest_path("a", "c") == (["a", "b", "c"], 2.0)
+    assert cache.shortest_path("a", "c") == (["a", "b", "c"], 2.0)
+    assert calls == [("a", "c")]
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_mutation_invalidates_every_entry():
+    g = _graph()
+    cache, calls = _counting_cache(g)
+    cache.shortest_path("a", "c")
+    cache.shortest_path("a", "d")
+    g.remove_edge("b", "c")
+    assert cache.shortest_path("a", "c") == (["a", "c"], 5.0)
+    assert cache.stats.invalidations == 1
+    assert len(cache) == 1
+    assert len(calls) == 3
+
+
+def test_graph_without_version_is_treated_as_frozen():
+    csr = CSRGraph.from_graph(_graph())
+    del csr.version
+    cache, calls = _counting_cache(csr)
+    cache.shortest_path("a", "d")
+    cache.shortest_path("a", "d")
+    assert len(calls) == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache, calls = _counting_cache(_graph(), maxsize=2)
+    cache.shortest_path("a", "b")
+    cache.shortest_path("a", "c")
+    cache.shortest_path("a", "b")  # refresh a->b, so a->c is now oldest
+    cache.shortest_path("a", "d")
+    assert cache.stats.evictions == 1
+    cache.shortest_path("a", "b")
+    cache.shortest_path("a", "c")
+    assert calls == [("a", "b"), ("a", "c"), ("a", "d"), ("a", "c")]
+
+
+def test_maxsize_must_be_positive():
+    with pytest.raises(ValueError):
+        ShortestPathCache(_graph(), maxsize=0)
@@ -0,0 +1,61 @@
+import warnings
+
+import pytest
+
+from graph_algorithms import bfs, dfs, dijkstra_shortest_path
+from graph_list import GraphList
+from tracing import EventCounter, RingBufferLog, StepLog
+
+
+def _graph() -> GraphList:
+    g = GraphList()
+    for u, v, w in (("A", "B", 4), ("A", "C", 1), ("C", "B", 1), ("B", "D", 1)):
+        g.add_edge(u, v, w)
+    return g
+
+
+def test_legacy_default_warns_and_keeps_the_steps_tuple():
+    g = _graph()
+    with pytest.warns(DeprecationWarning):
+        order, steps = bfs(g, "A")
+    assert order == ["A", "B", "C", "D"]
+    assert steps[0] == "INIT queue=['A']" and "VISIT A" in steps
+    with pytest.warns(DeprecationWarning):
+        path, cost, steps = dijkstra_shortest_path(g, "A", "D")
+    assert (path, cost) == (["A", "C", "B", "D"], 3.0)
+    assert steps[0] == "INIT dist[A]=0, push(A)" and steps[-1] == "PATH=['A', 'C', 'B', 'D'], COST=3.0"
+
+
+def test_steps_false_and_tracer_calls_do_not_warn():
+    g = _graph()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert dfs(g, "A", steps=False) == ["A", "B", "C", "D"]
+        assert dfs(g, "A", tracer=StepLog()) == ["A", "B", "C", "D"]
+        assert dijkstra_shortest_path(g, "A", "D", steps=False) == (["A", "C", "B", "D"], 3.0)
+
+
+def test_steps_true_matches_steplog_and_feeds_the_tracer_too():
+    g = _graph()
+    log, counter = StepLog(), EventCounter()
+    order, steps = dfs(g, "A", tracer=counter, steps=True)
+    assert dfs(g, "A", tracer=log) == order
+    assert steps == log.lines()
+    assert counter["VISIT"] == 4
+
+
+def test_ring_buffer_keeps_the_last_events():
+    log = RingBufferLog(3)
+    dijkstra_shortest_path(_graph(), "A", "D", tracer=log)
+    assert len(log) == 3
+    assert log.lines()[-1].startswith("PATH=")
+    with pytest.raises(ValueError):
+        RingBufferLog(0)
+
+
+def test_no_path_event():
+    g = _graph()
+    g.add_vertex("Z")
+    log = StepLog()
+    assert dijkstra_shortest_path(g, "A", "Z", tracer=log) == ([], float("inf"))
+    assert log.lines()[-1] == "NO PATH found"
@@ -0,0 +1,32 @@
+from union_find import DisjointSet
+
+
+def test_union_merges_and_counts_sets():
+    ds = DisjointSet(6)
+    assert ds.union(0, 1)
+    assert ds.union(2, 3)
+    assert ds.union(1, 3)
+    assert not ds.union(0, 2)
+    assert ds.count == 3
+    assert ds.connected(0, 3)
+    assert not ds.connected(0, 4)
+    assert sorted(ds.groups().values()) == [[0, 1, 2, 3], [4], [5]]
+
+
+def test_find_compresses_the_whole_path():
+    ds = DisjointSet(5)
+    ds.parent = [0, 0, 1, 2, 3]  # hand-built chain 4 -> 3 -> 2 -> 1 -> 0
+    assert ds.find(4) == 0
+    assert ds.parent == [0, 0, 0, 0, 0]
+
+
+def test_rank_stays_logarithmic():
+    n = 1 << 10
+    ds = DisjointSet(n)
+    step = 1
+    while step < n:
+        for i in range(0, n, 2 * step):
+            ds.union(i, i + step)
+        step *= 2
+    assert ds.count == 1
+    assert max(ds.rank) == 10
@@ -0,0 +1,66 @@
+from __future__ import annotations
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Tuple, Union
+
+# (event, number of args) -> message; reproduces the original step strings
+_FORMATS: Dict[Tuple[str, int], str] = {
+    ("INIT", 1): "INIT dist[{0}]=0, push({0})",
+    ("INIT", 2): "INIT {0}={1}",
+    ("DEQUEUE", 1): "DEQUEUE {0}",
+    ("POP", 1): "POP {0}",
+    ("POP", 2): "POP ({0}, dist={1})",
+    ("SKIP", 2): "SKIP {0} ({1})",
+    ("VISIT", 1): "VISIT {0}",
+    ("ENQUEUE", 2): "ENQUEUE {0} (from {1})",
+    ("PUSH", 2): "PUSH {0} (from {1})",
+    ("REACHED", 1): "REACHED goal {0}",
+    ("RELAX", 4): "RELAX {0}->{1} w={2}: dist[{1}]={3}, prev[{1}]={0}",
+    ("NO_PATH", 0): "NO PATH found",
+    ("PATH", 2): "PATH={0}, COST={1}",
+}
+
+
+def format_event(event: str, args: Tuple[Any, ...]) -> str:
+    template = _FORMATS.get((event, len(args)))
+    if template is None:
+        return " ".join([event] + [str(a) for a in args])
+    return template.format(*args)
+
+
+class StepLog:
+    """Tracer that records raw (event, args) tuples; strings are built only in lines()."""
+
+    def __init__(self) -> None:
+        self.events: Union[List, Deque] = []
+
+    def __call__(self, event: str, *args: Any) -> None:
+        self.events.append((event, args))
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def lines(self) -> List[str]:
+        return [format_event(event, args) for event, args in self.events]
+
+
+class RingBufferLog(StepLog):
+    """StepLog that keeps only the last `capacity` events."""
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        super().__init__()
+        self.events = deque(maxlen=capacity)
+
+
+class EventCounter:
+    """Tracer that only counts events by name (e.g. settled vertices, relaxations)."""
+
+    def __init__(self) -> None:
+        self.counts: Counter = Counter()
+
+    def __call__(self, event: str, *args: Any) -> None:
+        self.counts[event] += 1
+
+    def __getitem__(self, event: str) -> int:
+        return self.counts[event]
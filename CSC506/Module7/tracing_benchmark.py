@@ -0,0 +1,42 @@
+"""
+Tracing Benchmark
+=================
+
+Time and peak memory of bfs, dfs and dijkstra_shortest_path with tracing
+off, with a full StepLog, and with a capped RingBufferLog.
+"""
+
+from graph_algorithms import bfs, dfs, dijkstra_shortest_path
+from graph_benchmark import banner, timed, traced_memory
+from graph_generators import gnm_graph
+from tracing import RingBufferLog, StepLog
+
+
+def benchmark_tracing(n: int = 20_000, m: int = 100_000, ring_capacity: int = 1000) -> None:
+    """bfs / dfs / dijkstra with tracing off, full StepLog, and a capped ring buffer."""
+    banner(f"Tracing overhead (V={n:,}, E={m:,})")
+    g = gnm_graph(n, m)
+    runs = [
+        ("bfs", lambda t: bfs(g, 0, tracer=t, steps=False)),
+        ("dfs", lambda t: dfs(g, 0, tracer=t, steps=False)),
+        ("dijkstra", lambda t: dijkstra_shortest_path(g, 0, n - 1, tracer=t, steps=False)),
+    ]
+    modes = [
+        ("off", lambda: None),
+        ("StepLog", StepLog),
+        (f"ring({ring_capacity})", lambda: RingBufferLog(ring_capacity)),
+    ]
+    for name, run in runs:
+        for mode, make_tracer in modes:
+            tracer = make_tracer()
+            _current, peak, (elapsed, _) = traced_memory(lambda: timed(lambda: run(tracer)))
+            events = len(tracer) if tracer is not None else 0
+            print(f"{name:9s} tracing={mode:11s}: {elapsed:8.3f}s | peak {peak / 1e6:8.2f} MB | events kept {events:,}")
+
+
+def main() -> None:
+    benchmark_tracing()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+from typing import Dict, List
+
+
+class DisjointSet:
+    """
+    Union-find over the integers 0..n-1.
+
+    parent is a flat list and rank a bytearray (ranks never exceed log2 n).
+    find compresses the whole path; union links by rank. Together that is
+    near-constant amortized time per operation.
+    """
+
+    def __init__(self, n: int) -> None:
+        self.parent: List[int] = list(range(n))
+        self.rank = bytearray(n)
+        self.count = n  # number of disjoint sets
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets of a and b; False if they were already one set."""
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        rank = self.rank
+        if rank[ra] < rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if rank[ra] == rank[rb]:
+            rank[ra] += 1
+        self.count -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def groups(self) -> Dict[int, List[int]]:
+        """root -> members, in increasing member order."""
+        out: Dict[int, List[int]] = {}
+        for x in range(len(self.parent)):
+            out.setdefault(self.find(x), []).append(x)
+        return out
@@ -34,10 +34,13 @@ except ImportError as e:
 try:
     from Module6.bst_map import BSTMap
     from Module6.list_map import ListMap
+    from Module6.sorted_list_map import SortedListMap, BlockedSortedListMap
 except ImportError as e:
     print(f"Warning: Tree structure imports failed: {e}")
     BSTMap = None
     ListMap = None
+    SortedListMap = None
+    BlockedSortedListMap = None
 
 try:
     from Module7.graph_list import GraphList
@@ -276,9 +279,9 @@ class PerformanceAnalyzer:
         return results
     
     def benchmark_tree_structures(self) -> Dict:
-        """Benchmark tree-based structures: BST vs List."""
+        """Benchmark tree-based structures: BST vs List vs sorted arrays."""
         print("\n" + "=" * 80)
-        print("TREE STRUCTURES - BST VS LIST MAP")
+        print("TREE STRUCTURES - BST VS LIST MAP VS SORTED ARRAYS")
         print("=" * 80)
         
         if BSTMap is None or ListMap is None:
@@ -286,58 +289,52 @@ class PerformanceAnalyzer:
             return {}
         
         sizes = [100, 500, 1000, 5000]
-        results = {
-            'bst_insert': [],
-            'list_insert': [],
-            'bst_search': [],
-            'list_search': [],
-            'sizes': sizes
-        }
+        structures = [
+            ('bst', 'BST', BSTMap),
+            ('list', 'List', ListMap),
+            ('sorted', 'Sorted', SortedListMap),
+            ('blocked', 'Blocked', BlockedSortedListMap),
+        ]
+        results = {'sizes': sizes}
+        for prefix, _, _ in structures:
+            results[f'{prefix}_insert'] = []
+            results[f'{prefix}_search'] = []
         
         for size in sizes:
             keys = [random.randint(0, size * 10) for _ in range(size)]
             
-            # BST Insert
-            bst = BSTMap()
-            start = time.perf_counter()
-            for key in keys:
-                bst.set(key, key)
-            time_bst_insert = time.perf_counter() - start
-            
-            # List Insert
-            list_map = ListMap()
-            start = time.perf_counter()
-            for key in keys:
-                list_map.set(key, key)
-            time_list_insert = time.perf_counter() - start
-            
-            # BST Search
-            start = time.perf_counter()
-            for _ in range(100):
-                bst.contains(keys[size // 2])
-            time_bst_search = time.perf_counter() - start
-            
-            # List Search
-            start = time.perf_counter()
-            for _ in range(100):
-                list_map.contains(keys[size // 2])
-            time_list_search = time.perf_counter() - start
+            insert_times = {}
+            search_times = {}
+            for prefix, _, factory in structures:
+                # Insert
+                m = factory()
+                start = time.perf_counter()
+                for key in keys:
+                    m.set(key, key)
+                insert_times[prefix] = time.perf_counter() - start
+                
+                # Search
+                start = time.perf_counter()
+                for _ in range(100):
+                    m.contains(keys[size // 2])
+                search_times[prefix] = time.perf_counter() - start
+                
+                results[f'{prefix}_insert'].append(insert_times[prefix])
+                results[f'{prefix}_search'].append(search_times[prefix])
             
-            results['bst_insert'].append(time_bst_insert)
-            results['list_insert'].append(time_list_insert)
-            results['bst_search'].append(time_bst_search)
-            results['list_search'].append(time_list_search)
+            time_bst_insert = insert_times['bst']
+            time_bst_search = search_times['bst']
             
             print(f"\nSize: {size}")
             print(f"  Insert:")
-            print(f"    BST:  {time_bst_insert*1e3:10.6f} ms")
-            print(f"    List: {time_list_insert*1e3:10.6f} ms")
-            print(f"    Ratio: {time_list_insert/time_bst_insert if time_bst_insert > 0 else 0:10.2f}x")
+            for prefix, label, _ in structures:
+                print(f"    {label + ':':8s} {insert_times[prefix]*1e3:10.6f} ms")
+            print(f"    Ratio (List/BST): {insert_times['list']/time_bst_insert if time_bst_insert > 0 else 0:10.2f}x")
             
             print(f"  Search (100 ops):")
-            print(f"    BST:  {time_bst_search*1e6:10.4f} µs")
-            print(f"    List: {time_list_search*1e6:10.4f} µs")
-            print(f"    Ratio: {time_list_search/time_bst_search if time_bst_search > 0 else 0:10.2f}x")
+            for prefix, label, _ in structures:
+                print(f"    {label + ':':8s} {search_times[prefix]*1e6:10.4f} µs")
+            print(f"    Ratio (List/BST): {search_times['list']/time_bst_search if time_bst_search > 0 else 0:10.2f}x")
         
         return results
     
@@ -464,7 +461,8 @@ class PerformanceAnalyzer:
             },
             "Maps/Trees": {
                 "BST": "Maintains order, O(log n) operations, can become unbalanced",
-                "List": "O(1) insertion, O(n) search, simpler implementation"
+                "List": "O(1) insertion, O(n) search, simpler implementation",
+                "Sorted List": "O(log n) bisect search, O(1) append for increasing keys, blocks bound memmoves"
             },
             "Data Storage": {
                 "Stack": "LIFO access, useful for recursion, graph DFS",